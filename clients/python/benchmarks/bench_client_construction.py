@@ -0,0 +1,44 @@
+"""Benchmark of constructing and closing a client.
+
+Building a `Retab` used to load the system trust store into a fresh SSL
+context, which costs tens of milliseconds; clients now share one context per
+protocol (``retab/_tls.py``). Use it to catch a regression there::
+
+    python benchmarks/bench_client_construction.py
+    python benchmarks/bench_client_construction.py -n 200 --budget-ms 5
+
+With ``--budget-ms`` the script exits non-zero when the mean exceeds the budget.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+
+from retab import Retab
+
+
+def run(rounds: int) -> float:
+    """Return the mean milliseconds taken to construct and close one client over ``rounds`` clients."""
+    Retab(api_key="sk_bench_dummy").close()  # warm the shared SSL context and imports before timing
+    started = time.perf_counter()
+    for _ in range(rounds):
+        Retab(api_key="sk_bench_dummy").close()
+    return (time.perf_counter() - started) / rounds * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-n", "--rounds", type=int, default=50, help="Clients to construct (default: 50)")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail when the mean exceeds this many milliseconds")
+    args = parser.parse_args()
+
+    mean_ms = run(args.rounds)
+    print(f"Retab(): mean {mean_ms:.2f} ms over {args.rounds} clients")
+    if args.budget_ms is not None and mean_ms > args.budget_ms:
+        sys.exit(f"over the {args.budget_ms:g} ms budget")
+
+
+if __name__ == "__main__":
+    main()
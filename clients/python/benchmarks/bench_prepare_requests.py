@@ -0,0 +1,96 @@
+"""Micro-benchmark of request construction for every resource.
+
+Times each ``prepare_*`` method of every resource (sub-resources included):
+building the request body model, dumping it to JSON-ready data and wrapping
+it in a `PreparedRequest`. Nothing is sent. Use it to measure changes to the
+generated code in ``retab/resources`` or to `PreparedRequest`::
+
+    python benchmarks/bench_prepare_requests.py                     # every resource
+    python benchmarks/bench_prepare_requests.py workflows.runs -n 20000
+
+Arguments are synthesised from each method's signature (ids, names, small
+documents given as data URLs); methods whose arguments cannot be synthesised
+are listed as skipped.
+"""
+
+from __future__ import annotations
+
+import argparse
+import inspect
+import timeit
+from typing import Any, Callable, Iterator
+
+from retab import Retab
+from retab._resource import SyncAPIResource
+
+DOCUMENT = "data:text/plain;base64,aGVsbG8="
+
+
+def _argument(parameter: inspect.Parameter) -> Any:
+    annotation = str(parameter.annotation)
+    if "MIMEData" in annotation or "FileRef" in annotation:
+        return [DOCUMENT] if annotation.startswith(("list", "List", "Sequence")) else DOCUMENT
+    for prefix, value in (("str", "id_1"), ("int", 1), ("float", 1.0), ("bool", False), ("bytes", b"a,b\n1,2\n"), ("dict", {}), ("list", [])):
+        if annotation.startswith(prefix):
+            return value
+    raise TypeError(f"cannot synthesise {parameter.name}: {annotation}")
+
+
+def _call(method: Callable[..., Any]) -> Callable[[], Any]:
+    kwargs = {
+        name: _argument(parameter)
+        for name, parameter in inspect.signature(method).parameters.items()
+        if parameter.default is inspect.Parameter.empty and parameter.kind not in (parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD)
+    }
+    method(**kwargs)  # fail fast (and warm caches) before timing
+    return lambda: method(**kwargs)
+
+
+def iter_resources(client: Retab) -> Iterator[tuple[str, SyncAPIResource]]:
+    """Yield ``(dotted path, resource)`` for every resource and sub-resource of ``client``."""
+    pending = [(name, getattr(client, name)) for name in sorted(vars(type(client))) if not name.startswith("_") and isinstance(getattr(client, name), SyncAPIResource)]
+    while pending:
+        path, resource = pending.pop(0)
+        yield path, resource
+        pending.extend((f"{path}.{name}", value) for name, value in sorted(vars(resource).items()) if isinstance(value, SyncAPIResource))
+
+
+def run(selected: list[str], number: int) -> tuple[list[tuple[str, float]], list[tuple[str, str]]]:
+    """Return ``([(method, µs per call)], [(method, reason skipped)])`` for the selected resources (all when empty)."""
+    client = Retab(api_key="sk_bench_dummy")
+    timings: list[tuple[str, float]] = []
+    skipped: list[tuple[str, str]] = []
+    for path, resource in iter_resources(client):
+        if selected and not any(path == name or path.startswith(f"{name}.") for name in selected):
+            continue
+        for name in sorted(dir(type(resource))):
+            if not name.startswith("prepare_"):
+                continue
+            label = f"{path}.{name}"
+            try:
+                call = _call(getattr(resource, name))
+            except Exception as exc:
+                skipped.append((label, f"{type(exc).__name__}: {exc}"))
+                continue
+            timings.append((label, timeit.timeit(call, number=number) / number * 1e6))
+    client.close()
+    return timings, skipped
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("resources", nargs="*", help="Resource paths to benchmark, e.g. extractions or workflows.runs (default: all)")
+    parser.add_argument("-n", "--number", type=int, default=5000, help="Calls per method (default: 5000)")
+    args = parser.parse_args()
+
+    timings, skipped = run(args.resources, args.number)
+    width = max((len(label) for label, _ in timings), default=0)
+    for label, micros in timings:
+        print(f"{label:<{width}}  {micros:8.2f} µs")
+    print(f"\n{len(timings)} methods, mean {sum(m for _, m in timings) / max(len(timings), 1):.2f} µs per call")
+    for label, reason in skipped:
+        print(f"skipped {label}: {reason}")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,6 +18,33 @@ __all__ = [
     "InternalServerError",
     "APIConnectionError",
     "APITimeoutError",
+    "DeadlineExceededError",
+    "StreamInterruptedError",
+    "StreamDecodeError",
+    "CircuitOpenError",
+    "ChecksumMismatchError",
+    # Client configuration
+    "RetryPolicy",
+    "HedgePolicy",
+    "CircuitBreaker",
+    "IdempotencyStore",
+    "ResponseCache",
+    "FileLinkCache",
+    "PageSizePolicy",
+    "RateLimiter",
+    "JSONCodec",
+    "BatchResult",
+    "BatchResults",
+    "BatchSummary",
+    "BatchProgress",
+    "BatchAborted",
+    "DownloadResult",
+    # Observability
+    "RequestHooks",
+    "RequestEvent",
+    "CallScope",
+    "MetricsRegistry",
+    "OpenTelemetryHooks",
     # Response types
     "Classification",
     "Partition",
@@ -47,6 +74,31 @@ _LAZY_EXPORTS: dict[str, tuple[str, str | None]] = {
     "InternalServerError": (".exceptions", "InternalServerError"),
     "APIConnectionError": (".exceptions", "APIConnectionError"),
     "APITimeoutError": (".exceptions", "APITimeoutError"),
+    "DeadlineExceededError": (".exceptions", "DeadlineExceededError"),
+    "StreamInterruptedError": (".exceptions", "StreamInterruptedError"),
+    "StreamDecodeError": (".exceptions", "StreamDecodeError"),
+    "CircuitOpenError": (".exceptions", "CircuitOpenError"),
+    "ChecksumMismatchError": (".exceptions", "ChecksumMismatchError"),
+    "RetryPolicy": ("._retry", "RetryPolicy"),
+    "HedgePolicy": ("._hedge", "HedgePolicy"),
+    "CircuitBreaker": ("._circuit", "CircuitBreaker"),
+    "IdempotencyStore": ("._idempotency", "IdempotencyStore"),
+    "ResponseCache": ("._cache", "ResponseCache"),
+    "FileLinkCache": ("._file_links", "FileLinkCache"),
+    "PageSizePolicy": ("._page_size", "PageSizePolicy"),
+    "RateLimiter": ("._rate_limit", "RateLimiter"),
+    "JSONCodec": ("._codec", "JSONCodec"),
+    "BatchResult": ("._batch", "BatchResult"),
+    "BatchResults": ("._batch", "BatchResults"),
+    "BatchSummary": ("._batch", "BatchSummary"),
+    "BatchProgress": ("._batch", "BatchProgress"),
+    "BatchAborted": ("._batch", "BatchAborted"),
+    "DownloadResult": ("._download", "DownloadResult"),
+    "RequestHooks": ("._hooks", "RequestHooks"),
+    "RequestEvent": ("._hooks", "RequestEvent"),
+    "CallScope": ("._hooks", "CallScope"),
+    "MetricsRegistry": ("._metrics", "MetricsRegistry"),
+    "OpenTelemetryHooks": ("._otel", "OpenTelemetryHooks"),
     "Classification": (".types.classifications", "Classification"),
     "Partition": (".types.partitions", "Partition"),
     "Split": (".types.splits", "Split"),
@@ -77,18 +129,37 @@ def __dir__() -> list[str]:
 
 if TYPE_CHECKING:
     from . import types, utils
+    from ._batch import BatchAborted, BatchProgress, BatchResult, BatchResults, BatchSummary
+    from ._cache import ResponseCache
+    from ._circuit import CircuitBreaker
+    from ._codec import JSONCodec
+    from ._download import DownloadResult
+    from ._file_links import FileLinkCache
+    from ._hedge import HedgePolicy
+    from ._hooks import CallScope, RequestEvent, RequestHooks
+    from ._idempotency import IdempotencyStore
+    from ._metrics import MetricsRegistry
+    from ._otel import OpenTelemetryHooks
+    from ._page_size import PageSizePolicy
+    from ._rate_limit import RateLimiter
+    from ._retry import RetryPolicy
     from .client import AsyncRetab, Retab
     from .exceptions import (
         APIConnectionError,
         APIError,
         APITimeoutError,
         AuthenticationError,
+        ChecksumMismatchError,
+        CircuitOpenError,
         ConflictError,
+        DeadlineExceededError,
         InternalServerError,
         NotFoundError,
         PermissionDeniedError,
         RateLimitError,
         RetabError,
+        StreamDecodeError,
+        StreamInterruptedError,
         ValidationError,
     )
     from .types.classifications import Classification
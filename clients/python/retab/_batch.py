@@ -0,0 +1,327 @@
+"""Concurrency-bounded batch execution for `AsyncRetab` and `Retab`.
+
+`AsyncRetab.batch` / `AsyncRetab.batch_as_completed` / `AsyncRetab.gather_prepared`
+run many SDK calls with at most ``concurrency`` in flight. Items are pulled
+lazily from the input iterable by a fixed set of workers, so pushing 100k
+requests through does not create 100k tasks up front.
+
+`Retab.map` / `Retab.run_batch` are the synchronous counterparts: they run
+calls on a thread pool owned by the client, over its single (thread-safe)
+``httpx.Client``, keeping at most ``max_workers`` items submitted at a time.
+
+Each item is one of:
+
+* a `PreparedRequest` (from any resource's ``prepare_*`` method), sent via
+  ``client._prepared_request``;
+* a zero-argument callable returning an awaitable, e.g.
+  ``functools.partial(client.extractions.create, document=..., json_schema=...)``;
+* an already-created awaitable (coroutine). Prefer callables for large
+  batches: a coroutine object holds its arguments from the moment it is
+  created.
+
+Failures never abort the batch unless ``stop_on_error`` is set: each item
+yields a `BatchResult` carrying either its value or its exception. Ordered
+runs return `BatchResults`, a list that also carries a `BatchSummary`
+(throughput and latency percentiles).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Generic, Iterable, TypeVar
+
+from .types.standards import PreparedRequest
+
+if TYPE_CHECKING:
+    from .client import AsyncRetab, Retab
+
+
+logger = logging.getLogger("retab")
+
+T = TypeVar("T")
+U = TypeVar("U")
+
+BatchItem = PreparedRequest | Callable[[], Awaitable[Any]] | Awaitable[Any]
+SyncBatchItem = PreparedRequest | Callable[[], Any]
+
+
+class BatchResult(Generic[T]):
+    """Outcome of one batch item: its input position and either a value or an error."""
+
+    __slots__ = ("index", "value", "error", "elapsed")
+
+    def __init__(self, index: int, value: T | None = None, error: BaseException | None = None, elapsed: float = 0.0) -> None:
+        self.index = index
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return the value, or raise the item's exception."""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error is not None else "ok"
+        return f"BatchResult(index={self.index}, {outcome}, elapsed={self.elapsed:.3f}s)"
+
+
+class BatchProgress:
+    """Running counters passed to ``on_progress`` after every finished item."""
+
+    __slots__ = ("total", "completed", "failed", "started_at")
+
+    def __init__(self, total: int | None) -> None:
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.started_at = time.monotonic()
+
+    @property
+    def succeeded(self) -> int:
+        return self.completed - self.failed
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started_at
+
+    @property
+    def throughput(self) -> float:
+        """Completed items per second since the batch started."""
+        elapsed = self.elapsed
+        return self.completed / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        total = "?" if self.total is None else str(self.total)
+        return f"BatchProgress({self.completed}/{total} done, {self.failed} failed, {self.throughput:.1f}/s)"
+
+
+ProgressCallback = Callable[[BatchProgress], None]
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, math.ceil(fraction * len(sorted_values)) - 1)
+    return sorted_values[rank]
+
+
+class BatchSummary:
+    """Throughput and per-item latency statistics for a finished batch."""
+
+    __slots__ = ("total", "failed", "elapsed", "latency_mean", "latency_p50", "latency_p95", "latency_p99", "latency_max")
+
+    def __init__(self, results: list[BatchResult[Any]], elapsed: float) -> None:
+        latencies = sorted(result.elapsed for result in results)
+        self.total = len(results)
+        self.failed = sum(1 for result in results if not result.ok)
+        self.elapsed = elapsed
+        self.latency_mean = sum(latencies) / len(latencies) if latencies else 0.0
+        self.latency_p50 = _percentile(latencies, 0.50)
+        self.latency_p95 = _percentile(latencies, 0.95)
+        self.latency_p99 = _percentile(latencies, 0.99)
+        self.latency_max = latencies[-1] if latencies else 0.0
+
+    @property
+    def succeeded(self) -> int:
+        return self.total - self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Items per second over the whole batch."""
+        return self.total / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"BatchSummary(total={self.total}, failed={self.failed}, elapsed={self.elapsed:.2f}s, throughput={self.throughput:.1f}/s, "
+            f"p50={self.latency_p50:.3f}s, p95={self.latency_p95:.3f}s, p99={self.latency_p99:.3f}s, max={self.latency_max:.3f}s)"
+        )
+
+
+class BatchResults(list[BatchResult[T]]):
+    """Input-ordered batch results, with the run's `BatchSummary` attached."""
+
+    summary: BatchSummary
+
+    def __init__(self, results: Iterable[BatchResult[T]], elapsed: float) -> None:
+        super().__init__(sorted(results, key=lambda result: result.index))
+        self.summary = BatchSummary(list(self), elapsed)
+        logger.debug("Batch finished: %r", self.summary)
+
+    @property
+    def values(self) -> list[T | None]:
+        """The successful values in input order (``None`` for failed items)."""
+        return [result.value for result in self]
+
+    @property
+    def errors(self) -> list[BatchResult[T]]:
+        return [result for result in self if not result.ok]
+
+
+class BatchAborted(Exception):
+    """Raised by a ``stop_on_error`` batch; ``__cause__`` is the first failure."""
+
+    def __init__(self, result: BatchResult[Any]) -> None:
+        self.result = result
+        super().__init__(f"Batch aborted after item {result.index} failed: {result.error!r}")
+
+
+def _total_of(items: Iterable[Any]) -> int | None:
+    try:
+        return len(items)  # type: ignore[arg-type]
+    except TypeError:
+        return None
+
+
+async def _run_item(client: "AsyncRetab", item: BatchItem) -> Any:
+    if isinstance(item, PreparedRequest):
+        return await client._prepared_request(item)
+    if inspect.isawaitable(item):
+        return await item
+    if callable(item):
+        return await item()
+    raise TypeError(f"Unsupported batch item {type(item).__name__}; expected a PreparedRequest, an async callable or an awaitable")
+
+
+async def abatch_as_completed(
+    client: "AsyncRetab",
+    items: Iterable[BatchItem],
+    *,
+    concurrency: int = 16,
+    on_progress: ProgressCallback | None = None,
+    stop_on_error: bool = False,
+) -> AsyncIterator[BatchResult[Any]]:
+    """Yield a `BatchResult` for each item as soon as it finishes."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    progress = BatchProgress(_total_of(items))
+    source = enumerate(items)
+    results: asyncio.Queue[BatchResult[Any] | None] = asyncio.Queue()
+
+    async def worker() -> None:
+        try:
+            # ``next`` is synchronous, so workers on one loop never race on the iterator.
+            for index, item in source:
+                started = time.monotonic()
+                try:
+                    value = await _run_item(client, item)
+                except Exception as exc:
+                    result: BatchResult[Any] = BatchResult(index, error=exc, elapsed=time.monotonic() - started)
+                else:
+                    result = BatchResult(index, value=value, elapsed=time.monotonic() - started)
+                results.put_nowait(result)
+        finally:
+            results.put_nowait(None)
+
+    workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+    running = len(workers)
+    try:
+        while running:
+            result = await results.get()
+            if result is None:
+                running -= 1
+                continue
+            progress.completed += 1
+            if not result.ok:
+                progress.failed += 1
+            if on_progress is not None:
+                on_progress(progress)
+            if stop_on_error and not result.ok:
+                raise BatchAborted(result) from result.error
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+async def abatch(
+    client: "AsyncRetab",
+    items: Iterable[BatchItem],
+    *,
+    concurrency: int = 16,
+    on_progress: ProgressCallback | None = None,
+    stop_on_error: bool = False,
+) -> BatchResults[Any]:
+    """Run every item and return the results in input order."""
+    started = time.monotonic()
+    collected: list[BatchResult[Any]] = []
+    async for result in abatch_as_completed(client, items, concurrency=concurrency, on_progress=on_progress, stop_on_error=stop_on_error):
+        collected.append(result)
+    return BatchResults(collected, time.monotonic() - started)
+
+
+def _call_timed(index: int, fn: Callable[[U], Any], item: U) -> BatchResult[Any]:
+    started = time.monotonic()
+    try:
+        value = fn(item)
+    except Exception as exc:
+        return BatchResult(index, error=exc, elapsed=time.monotonic() - started)
+    return BatchResult(index, value=value, elapsed=time.monotonic() - started)
+
+
+def threaded_map(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[U], Any],
+    items: Iterable[U],
+    *,
+    max_workers: int,
+    on_progress: ProgressCallback | None = None,
+    stop_on_error: bool = False,
+) -> BatchResults[Any]:
+    """Run ``fn(item)`` for every item on ``executor`` with at most ``max_workers`` submitted at once."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    started = time.monotonic()
+    progress = BatchProgress(_total_of(items))
+    source = enumerate(items)
+    pending: set[Future[BatchResult[Any]]] = set()
+    collected: list[BatchResult[Any]] = []
+
+    def submit_next() -> bool:
+        for index, item in source:
+            pending.add(executor.submit(_call_timed, index, fn, item))
+            return True
+        return False
+
+    try:
+        while len(pending) < max_workers and submit_next():
+            pass
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                pending.discard(future)
+                result = future.result()
+                collected.append(result)
+                progress.completed += 1
+                if not result.ok:
+                    progress.failed += 1
+                if on_progress is not None:
+                    on_progress(progress)
+                if stop_on_error and not result.ok:
+                    raise BatchAborted(result) from result.error
+                submit_next()
+    finally:
+        # On abort (or KeyboardInterrupt) drop everything not yet started;
+        # calls already running finish in the background.
+        for future in pending:
+            future.cancel()
+    return BatchResults(collected, time.monotonic() - started)
+
+
+def run_sync_item(client: "Retab", item: SyncBatchItem) -> Any:
+    if isinstance(item, PreparedRequest):
+        return client._prepared_request(item)
+    if callable(item):
+        return item()
+    raise TypeError(f"Unsupported batch item {type(item).__name__}; expected a PreparedRequest or a callable")
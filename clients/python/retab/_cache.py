@@ -0,0 +1,248 @@
+"""HTTP cache for GET requests.
+
+Dashboards and services read the same workflows, specs, table schemas and
+files over and over, and every read was a round trip. With
+``Retab(response_cache=ResponseCache())`` JSON GETs go through the cache:
+
+- A fresh entry is answered without a request. A response stays fresh for its
+  ``Cache-Control: max-age`` (minus its ``Age``), or ``default_ttl`` seconds
+  when it does not say.
+- A stale entry with an ``ETag`` is revalidated with ``If-None-Match``; a
+  ``304 Not Modified`` renews it without sending the body again.
+- ``no-store`` responses are never kept, ``no-cache`` ones are revalidated
+  on every read, and responses with neither a lifetime nor an ``ETag`` are
+  not kept either.
+- A mutation (any method but GET and HEAD) sent through a client using the
+  cache drops every entry of the same top-level resource: a PATCH to
+  ``/v1/workflows/wf_1`` drops everything cached under ``/v1/workflows``.
+  Changes made by other clients are only seen once entries go stale, or
+  after `ResponseCache.invalidate`.
+
+Entries live in an in-memory LRU and, when ``directory`` is set, on disk as
+well: entries evicted from memory, or written by an earlier process, are
+read back from there. Keys include the API key, so clients with different
+keys can share one cache or directory without seeing each other's data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import httpx
+
+DEFAULT_CACHE_MAX_ENTRIES = 512
+
+
+class CachedResponse:
+    """The body of a cached GET response and what is needed to serve or revalidate it."""
+
+    __slots__ = ("content", "content_type", "etag", "expires_at")
+
+    def __init__(self, content: bytes, content_type: str, etag: str | None, expires_at: float) -> None:
+        self.content = content
+        self.content_type = content_type
+        self.etag = etag
+        # time.time() timestamp, so entries read back from disk keep their expiry.
+        self.expires_at = expires_at
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def to_response(self) -> httpx.Response:
+        return httpx.Response(200, content=self.content, headers={"content-type": self.content_type})
+
+
+def cache_key(request_kwargs: dict[str, Any]) -> str:
+    """Hash what identifies a GET: URL, query and the API key it is sent with."""
+    digest = hashlib.sha256()
+    digest.update(request_kwargs["headers"].get("Authorization", "").encode())
+    digest.update(f"\n{request_kwargs['url']}\n".encode())
+    params = request_kwargs.get("params")
+    if params:
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def resource_scope(path: str) -> str:
+    """The top-level resource a request path belongs to, e.g. ``/v1/workflows`` for ``/v1/workflows/wf_1/spec``."""
+    return "/" + "/".join(path.split("?", 1)[0].strip("/").split("/")[:2])
+
+
+def _lifetime(headers: httpx.Headers, etag: str | None, default_ttl: float) -> float | None:
+    """Seconds a response stays fresh, or None when it must not be stored."""
+    directives: dict[str, str] = {}
+    for directive in headers.get("cache-control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        lifetime = 0.0
+    elif "max-age" in directives:
+        lifetime = _seconds(directives["max-age"]) - _seconds(headers.get("age"))
+    else:
+        lifetime = default_ttl
+    if lifetime <= 0 and not etag:
+        return None
+    return max(lifetime, 0.0)
+
+
+def _seconds(value: str | None) -> float:
+    try:
+        return float(value) if value else 0.0
+    except ValueError:
+        return 0.0
+
+
+class ResponseCache:
+    """LRU cache of GET responses, optionally backed by a directory.
+
+    Args:
+        max_entries (int): Responses kept in memory. Defaults to 512
+        directory (str | os.PathLike, optional): Also keep responses on disk there, shared by the clients and
+            processes that use it. In memory only when omitted
+        default_ttl (float): Seconds a response without ``Cache-Control: max-age`` is served without asking the
+            server. Defaults to 0: such responses are only kept when they have an ``ETag``, and revalidated on
+            every read
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_CACHE_MAX_ENTRIES, directory: str | os.PathLike[str] | None = None, default_ttl: float = 0.0) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        if default_ttl < 0:
+            raise ValueError("default_ttl must be >= 0")
+        self.max_entries = max_entries
+        self.directory = os.fspath(directory) if directory is not None else None
+        self.default_ttl = default_ttl
+        self._lock = threading.Lock()
+        # key -> (resource scope, entry), least recently used first
+        self._entries: OrderedDict[str, tuple[str, CachedResponse]] = OrderedDict()
+        # Bumped by invalidate(): a GET sent before a mutation must not store what it read.
+        self._generations: dict[str, int] = {}
+
+    def generation(self, scope: str) -> int:
+        """Number of invalidations of ``scope`` so far; pass it back to `store` / `renew`."""
+        with self._lock:
+            return self._generations.get(scope, 0)
+
+    def get(self, key: str, scope: str) -> CachedResponse | None:
+        """Return the entry stored under ``key`` (fresh or not), or None."""
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None:
+                self._entries.move_to_end(key)
+                return item[1]
+        if self.directory is None:
+            return None
+        entry = self._read(key, scope)
+        if entry is not None:
+            self._remember(key, scope, entry, None)
+        return entry
+
+    def store(self, key: str, scope: str, response: httpx.Response, generation: int) -> None:
+        """Keep a successful GET response if its headers allow it and ``scope`` was not invalidated since ``generation``."""
+        if response.status_code != 200:
+            return
+        etag = response.headers.get("etag")
+        lifetime = _lifetime(response.headers, etag, self.default_ttl)
+        if lifetime is None:
+            # The resource may have stopped being cacheable: forget the old copy as well.
+            self._discard(key, scope)
+            return
+        entry = CachedResponse(response.content, response.headers.get("content-type", ""), etag, time.time() + lifetime)
+        if self._remember(key, scope, entry, generation) and self.directory is not None:
+            self._write(key, scope, entry)
+
+    def renew(self, key: str, scope: str, entry: CachedResponse, response: httpx.Response, generation: int) -> None:
+        """Extend ``entry`` after the server answered its revalidation with ``304 Not Modified``."""
+        etag = response.headers.get("etag", entry.etag)
+        lifetime = _lifetime(response.headers, etag, self.default_ttl)
+        if lifetime is None:
+            self._discard(key, scope)
+            return
+        renewed = CachedResponse(entry.content, entry.content_type, etag, time.time() + lifetime)
+        if self._remember(key, scope, renewed, generation) and self.directory is not None:
+            self._write(key, scope, renewed)
+
+    def invalidate(self, path: str) -> None:
+        """Drop every response cached for the top-level resource of ``path`` (e.g. ``"/v1/workflows"``)."""
+        scope = resource_scope(path)
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+            for key in [key for key, (entry_scope, _) in self._entries.items() if entry_scope == scope]:
+                del self._entries[key]
+        if self.directory is not None:
+            shutil.rmtree(self._scope_dir(scope), ignore_errors=True)
+
+    def clear(self) -> None:
+        """Drop every cached response, on disk included."""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is not None:
+            for name in os.listdir(self.directory):
+                shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def __len__(self) -> int:
+        """Number of responses held in memory."""
+        return len(self._entries)
+
+    def _remember(self, key: str, scope: str, entry: CachedResponse, generation: int | None) -> bool:
+        with self._lock:
+            if generation is not None and self._generations.get(scope, 0) != generation:
+                return False
+            self._entries[key] = (scope, entry)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def _discard(self, key: str, scope: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+        if self.directory is not None:
+            try:
+                os.remove(self._entry_path(key, scope))
+            except FileNotFoundError:
+                pass
+
+    def _scope_dir(self, scope: str) -> str:
+        assert self.directory is not None
+        return os.path.join(self.directory, hashlib.sha256(scope.encode()).hexdigest()[:16])
+
+    def _entry_path(self, key: str, scope: str) -> str:
+        return os.path.join(self._scope_dir(scope), key)
+
+    def _read(self, key: str, scope: str) -> CachedResponse | None:
+        # One file per entry: a JSON header line, then the body bytes.
+        try:
+            with open(self._entry_path(key, scope), "rb") as fh:
+                header = json.loads(fh.readline())
+                content = fh.read()
+        except (OSError, ValueError):
+            return None
+        return CachedResponse(content, header["content_type"], header["etag"], header["expires_at"])
+
+    def _write(self, key: str, scope: str, entry: CachedResponse) -> None:
+        path = self._entry_path(key, scope)
+        header = {"content_type": entry.content_type, "etag": entry.etag, "expires_at": entry.expires_at}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp, "wb") as fh:
+                fh.write(json.dumps(header).encode() + b"\n")
+                fh.write(entry.content)
+            os.replace(tmp, path)
+        except OSError:
+            # The disk is a second level: the entry stays cached in memory.
+            pass
+
+    def __repr__(self) -> str:
+        return f"ResponseCache(max_entries={self.max_entries}, directory={self.directory!r}, default_ttl={self.default_ttl}, entries={len(self._entries)})"
@@ -0,0 +1,189 @@
+"""Per-route circuit breaker shared by every resource of one client.
+
+When one backend route degrades (``POST /v1/splits`` answering 500s), retrying
+every caller up to ``max_retries`` ties workers up for minutes while the rest
+of the API is healthy. `CircuitBreaker` keeps one circuit per
+``"<METHOD> <route template>"`` and moves it through three states:
+
+* **closed**: requests flow; ``failure_threshold`` consecutive failures open it.
+* **open**: requests fail immediately with `CircuitOpenError`, which is not
+  retried, for ``recovery_timeout`` seconds.
+* **half-open**: up to ``half_open_max_calls`` trial requests are let through;
+  ``success_threshold`` successes close the circuit, any failure re-opens it.
+
+Only server-side trouble counts as a failure (5xx, timeouts, connection
+errors, connections dropped mid-request). A 4xx answer proves the route is up
+and counts as a success. An attempt cut short by the caller's own
+``timeout=`` / ``deadline=`` budget (`DeadlineExceededError`), like a
+cancelled one, says nothing about the route and is not counted either way.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable
+
+import httpx
+
+from .exceptions import APIConnectionError, CircuitOpenError, DeadlineExceededError, InternalServerError
+
+logger = logging.getLogger("retab")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Called with (route, previous state, new state).
+StateChangeHandler = Callable[[str, str, str], None]
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "successes", "opened_at", "trials")
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.successes = 0
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+class CircuitBreaker:
+    """Closed / open / half-open circuit per method and route template.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open a circuit. Defaults to 5
+        recovery_timeout (float): Seconds a circuit stays open before trial requests are allowed. Defaults to 30.0
+        half_open_max_calls (int): Trial requests allowed at once while half-open. Defaults to 1
+        success_threshold (int): Successful trials needed to close the circuit again. Defaults to 1
+        failure_on (tuple[type[BaseException], ...]): Exceptions that count as failures.
+            Defaults to ``(InternalServerError, APIConnectionError, httpx.TransportError)`` (5xx, timeouts, network errors)
+        on_state_change (Callable[[str, str, str], None], optional): Called with ``(route, old_state, new_state)``
+            on every transition
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        success_threshold: int = 1,
+        failure_on: tuple[type[BaseException], ...] = (InternalServerError, APIConnectionError, httpx.TransportError),
+        on_state_change: StateChangeHandler | None = None,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be >= 1")
+        if half_open_max_calls < 1 or success_threshold < 1:
+            raise ValueError("half_open_max_calls and success_threshold must be >= 1")
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.success_threshold = success_threshold
+        self.failure_on = failure_on
+        self.on_state_change = on_state_change
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, route: str) -> str:
+        """Current state of ``route``'s circuit (``"closed"``, ``"open"`` or ``"half_open"``)."""
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return CLOSED
+            if circuit.state == OPEN and time.monotonic() - circuit.opened_at >= self.recovery_timeout:
+                return HALF_OPEN
+            return circuit.state
+
+    def states(self) -> dict[str, str]:
+        """States of every route seen so far."""
+        return {route: self.state(route) for route in list(self._circuits)}
+
+    def before_request(self, route: str) -> None:
+        """Admit a request on ``route`` or fail fast.
+
+        Raises:
+            CircuitOpenError: If the circuit is open, or half-open with all trial slots taken
+        """
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            now = time.monotonic()
+            if circuit.state == OPEN:
+                remaining = self.recovery_timeout - (now - circuit.opened_at)
+                if remaining > 0:
+                    raise CircuitOpenError(f"Circuit open for {route}; retry in {remaining:.1f}s", route=route, retry_after=remaining)
+                self._transition(route, circuit, HALF_OPEN)
+            if circuit.trials >= self.half_open_max_calls:
+                raise CircuitOpenError(f"Circuit half-open for {route}; trial request in flight", route=route, retry_after=0.0)
+            circuit.trials += 1
+
+    def record(self, route: str, error: BaseException | None) -> None:
+        """Record the outcome of a request admitted by `before_request`."""
+        if error is not None and (not isinstance(error, Exception) or isinstance(error, DeadlineExceededError)):
+            # Cancelled, interrupted or out of the caller's budget: no verdict on the route, just free the trial slot.
+            with self._lock:
+                circuit = self._circuits.get(route)
+                if circuit is not None and circuit.state == HALF_OPEN:
+                    circuit.trials = max(circuit.trials - 1, 0)
+            return
+        if error is not None and isinstance(error, self.failure_on):
+            self._record_failure(route)
+        else:
+            self._record_success(route)
+
+    def reset(self, route: str | None = None) -> None:
+        """Close ``route``'s circuit, or every circuit when ``route`` is None."""
+        with self._lock:
+            if route is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(route, None)
+
+    def _record_success(self, route: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                return
+            if circuit.state == HALF_OPEN:
+                circuit.trials = max(circuit.trials - 1, 0)
+                circuit.successes += 1
+                if circuit.successes >= self.success_threshold:
+                    self._transition(route, circuit, CLOSED)
+            else:
+                circuit.failures = 0
+
+    def _record_failure(self, route: str) -> None:
+        with self._lock:
+            circuit = self._circuits.get(route)
+            if circuit is None:
+                circuit = self._circuits[route] = _Circuit()
+            if circuit.state == HALF_OPEN:
+                self._transition(route, circuit, OPEN)
+                return
+            circuit.failures += 1
+            if circuit.state == CLOSED and circuit.failures >= self.failure_threshold:
+                self._transition(route, circuit, OPEN)
+
+    def _transition(self, route: str, circuit: _Circuit, state: str) -> None:
+        # Called with the lock held.
+        previous = circuit.state
+        circuit.state = state
+        circuit.failures = 0
+        circuit.successes = 0
+        circuit.trials = 0
+        if state == OPEN:
+            circuit.opened_at = time.monotonic()
+            logger.warning("Retab circuit for %s opened; failing fast for %.1fs", route, self.recovery_timeout)
+        elif state == CLOSED:
+            logger.info("Retab circuit for %s closed", route)
+        if self.on_state_change is not None:
+            try:
+                self.on_state_change(route, previous, state)
+            except Exception:
+                logger.warning("Retab circuit on_state_change handler raised; ignoring", exc_info=True)
+
+    def __repr__(self) -> str:
+        return f"CircuitBreaker(failure_threshold={self.failure_threshold}, recovery_timeout={self.recovery_timeout}, half_open_max_calls={self.half_open_max_calls})"
@@ -0,0 +1,105 @@
+"""Single-flight coalescing of identical GET requests.
+
+Concurrent callers of one client often read the same object at the same
+moment: fifty coroutines extracting from the same `FileRef` each resolve it
+with ``files.get_download_link(file_id)`` before sending their document. A
+GET that is identical (same URL, query and conditional headers) to one
+already in flight does not go to the network again: it waits for the
+request in flight and gets its response, then decodes it on its own, so
+callers never share mutable results.
+
+A GET never joins a read that may predate a write of the same resource: a
+POST, PATCH, PUT or DELETE sent through the client bumps the generation of
+its top-level resource (``/v1/workflows`` for ``/v1/workflows/wf_1``) when it
+starts and again when it ends, and GETs only join requests of the current
+generation, so a read issued after a mutation sees its outcome.
+
+Only GETs without a call deadline are coalesced. The request in flight runs
+under its first caller's deadline, retries and hooks, so a call that brings a
+budget of its own sends its own request. Waiters give up on their own when
+cancelled; the shared request then still finishes for the others.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Run one ``fn`` per key at a time across threads; concurrent callers with the same key get its outcome."""
+
+    __slots__ = ("_lock", "_calls", "_generations")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[tuple[str, int, str], Future[T]] = {}
+        self._generations: dict[str, int] = {}
+
+    def do(self, key: str, fn: Callable[[], T], scope: str = "") -> T:
+        with self._lock:
+            slot = (scope, self._generations.get(scope, 0), key)
+            call = self._calls.get(slot)
+            leader = call is None
+            if call is None:
+                call = self._calls[slot] = Future()
+        if not leader:
+            return call.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            self._finish(slot)
+            call.set_exception(exc)
+            raise
+        self._finish(slot)
+        call.set_result(result)
+        return result
+
+    def invalidate(self, scope: str) -> None:
+        """Stop the calls issued from now on from joining the ones of ``scope`` already in flight."""
+        with self._lock:
+            self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def _finish(self, slot: tuple[str, int, str]) -> None:
+        # Forget the call before publishing its outcome: callers arriving after that send their own request.
+        with self._lock:
+            del self._calls[slot]
+
+
+class AsyncSingleFlight(Generic[T]):
+    """Run one ``fn()`` coroutine per key and event loop at a time; concurrent callers with the same key await it."""
+
+    __slots__ = ("_calls", "_generations")
+
+    def __init__(self) -> None:
+        self._calls: dict[tuple[asyncio.AbstractEventLoop, str, int, str], asyncio.Task[T]] = {}
+        self._generations: dict[str, int] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]], scope: str = "") -> T:
+        loop = asyncio.get_running_loop()
+        slot = (loop, scope, self._generations.get(scope, 0), key)
+        task = self._calls.get(slot)
+        if task is None or task.done():
+            # A task of its own, so cancelling whichever caller started it does not fail the others.
+            task = self._calls[slot] = loop.create_task(_run(fn))
+            task.add_done_callback(lambda done: self._finish(slot, done))
+        return await asyncio.shield(task)
+
+    def invalidate(self, scope: str) -> None:
+        """Stop the calls issued from now on from joining the ones of ``scope`` already in flight."""
+        self._generations[scope] = self._generations.get(scope, 0) + 1
+
+    def _finish(self, slot: tuple[asyncio.AbstractEventLoop, str, int, str], task: asyncio.Task[T]) -> None:
+        if self._calls.get(slot) is task:
+            del self._calls[slot]
+        if not task.cancelled():
+            # Every waiter may have been cancelled; the error must not be reported as never retrieved.
+            task.exception()
+
+
+async def _run(fn: Callable[[], Awaitable[T]]) -> T:
+    return await fn()
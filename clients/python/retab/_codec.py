@@ -0,0 +1,94 @@
+"""JSON encoding/decoding used on the request and response hot path.
+
+Request bodies are serialised once, to bytes, when the request is built,
+and the same bytes are re-sent on every retry. Responses (and each line of
+a JSON stream) are decoded with the same codec.
+
+`get_default_codec` picks the fastest backend available: ``orjson``, then
+``msgspec``, then the standard library. Neither fast backend is a hard
+dependency; pass ``codec=JSONCodec()`` to a client to force the stdlib.
+
+Every codec raises ``ValueError`` for malformed input, whatever the
+backend's own exception type.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+
+class JSONCodec:
+    """Standard-library codec; also the base class for custom codecs."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        # Same settings httpx uses for ``json=``, so switching codecs does not change the wire format.
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
+
+    def loads(self, data: bytes | str) -> Any:
+        return json.loads(data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class OrjsonCodec(JSONCodec):
+    """``orjson``-backed codec (``pip install orjson``)."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        # Non-str keys are stringified, matching the stdlib instead of raising.
+        self._option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._option)
+
+    def loads(self, data: bytes | str) -> Any:
+        # orjson.JSONDecodeError subclasses ValueError.
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    """``msgspec``-backed codec (``pip install msgspec``)."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as exc:
+            raise ValueError(str(exc)) from exc
+
+
+_default_codec: JSONCodec | None = None
+
+
+def get_default_codec() -> JSONCodec:
+    """Return the process-wide default codec, preferring orjson, then msgspec, then the stdlib."""
+    global _default_codec
+    if _default_codec is None:
+        codec: JSONCodec | None = None
+        for candidate in (OrjsonCodec, MsgspecCodec):
+            try:
+                codec = candidate()
+            except ImportError:
+                continue
+            break
+        _default_codec = codec if codec is not None else JSONCodec()
+    return _default_codec
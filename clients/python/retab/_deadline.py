@@ -0,0 +1,134 @@
+"""Per-call deadlines.
+
+The client ``timeout`` bounds a single HTTP attempt. A call can still block
+for much longer across retries, backoff sleeps and reconnects. A deadline
+bounds the whole call instead: every resource method accepts ``timeout=``
+(seconds from now) or ``deadline=`` (an absolute ``datetime`` or epoch
+timestamp), and `PreparedRequest` carries the same two fields.
+
+The active deadline lives in a context variable so it reaches every layer
+without extra arguments:
+
+* each attempt's connect / read / write / pool timeouts are clamped to the
+  remaining budget, and an attempt is not started once the budget is spent
+  (`DeadlineExceededError`);
+* the retry loop gives up instead of sleeping when the backoff plus the
+  duration of the failed attempt no longer fits in the remaining budget.
+
+Nested scopes can only tighten the deadline, never extend it. Streamed calls
+(`iter_in_scope` / `aiter_in_scope`) enter their scope only while the next item
+is being produced, so the budget bounds the whole stream without leaking into
+the consumer's code between items.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar, Token
+from datetime import datetime
+from typing import Any, AsyncIterator, Iterable, Iterator, TypeVar, Union
+
+import httpx
+
+# Absolute ``time.time()`` timestamp or a datetime (naive datetimes are local time).
+Deadline = Union[float, datetime]
+
+T = TypeVar("T")
+
+_deadline: ContextVar[float | None] = ContextVar("retab_deadline", default=None)
+
+
+def remaining() -> float | None:
+    """Seconds left before the active deadline (negative once it passed), or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+class deadline_scope:
+    """Bound everything run inside the block by ``timeout`` seconds and/or an absolute ``deadline``.
+
+    A plain class rather than a ``@contextmanager`` generator: it wraps every prepared
+    request, and with neither bound given it must cost next to nothing.
+    """
+
+    __slots__ = ("_bound", "_token")
+
+    def __init__(self, timeout: float | None = None, deadline: Deadline | None = None) -> None:
+        self._bound = _to_monotonic(timeout, deadline) if timeout is not None or deadline is not None else None
+        self._token: Token[float | None] | None = None
+
+    def __enter__(self) -> None:
+        if self._bound is None:
+            return
+        current = _deadline.get()
+        self._token = _deadline.set(self._bound if current is None else min(current, self._bound))
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._token is not None:
+            _deadline.reset(self._token)
+            self._token = None
+
+
+def iter_in_scope(items: Iterable[T], timeout: float | None = None, deadline: Deadline | None = None) -> Iterator[T]:
+    """Yield from ``items``, producing every item inside one `deadline_scope` started on the first item."""
+    if timeout is None and deadline is None:
+        yield from items
+        return
+    scope = deadline_scope(timeout, deadline)
+    iterator = iter(items)
+    try:
+        while True:
+            with scope:
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+    finally:
+        # Release the underlying response now when the consumer stops early.
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            close()
+
+
+async def aiter_in_scope(items: AsyncIterator[T], timeout: float | None = None, deadline: Deadline | None = None) -> AsyncIterator[T]:
+    """Async variant of `iter_in_scope`."""
+    if timeout is None and deadline is None:
+        async for item in items:
+            yield item
+        return
+    scope = deadline_scope(timeout, deadline)
+    try:
+        while True:
+            with scope:
+                try:
+                    item = await items.__anext__()
+                except StopAsyncIteration:
+                    return
+            yield item
+    finally:
+        aclose = getattr(items, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+def clamp_timeout(timeout: httpx.Timeout, budget: float) -> httpx.Timeout:
+    """Return ``timeout`` with every phase capped at ``budget`` seconds."""
+
+    def cap(value: float | None) -> float:
+        return budget if value is None else min(value, budget)
+
+    return httpx.Timeout(connect=cap(timeout.connect), read=cap(timeout.read), write=cap(timeout.write), pool=cap(timeout.pool))
+
+
+def _to_monotonic(timeout: float | None, deadline: Deadline | None) -> float | None:
+    now = time.monotonic()
+    bounds: list[float] = []
+    if timeout is not None:
+        bounds.append(now + timeout)
+    if deadline is not None:
+        epoch = deadline.timestamp() if isinstance(deadline, datetime) else float(deadline)
+        bounds.append(now + (epoch - time.time()))
+    return min(bounds) if bounds else None
@@ -0,0 +1,163 @@
+"""Streaming downloads for binary endpoints.
+
+``_request_bytes`` returns ``response.content``, so a table export or a
+filled document is held in memory whole before the caller sees a byte.
+``client.iter_bytes(request)`` and ``client.download_to(request, path)``
+stream the body in fixed-size chunks instead, so memory stays at one chunk
+whatever the size of the file.
+
+When the connection drops mid-body the download resumes where it stopped:
+if the first response advertised ``Accept-Ranges: bytes`` and a validator
+(``ETag`` or ``Last-Modified``), the request is re-sent with ``Range`` and
+``If-Range``. Otherwise, or when the server ignores the range, the body is
+re-sent in full and the bytes already delivered are skipped, as long as the
+validator shows the content did not change in between. Downloads ask for
+``Accept-Encoding: identity`` so byte offsets match what the caller received.
+
+`download_to` writes to ``<path>.part`` and renames it into place only once
+the body is complete (and its checksum matches, if one was expected).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from typing import IO, Any, Union
+
+import httpx
+
+from .exceptions import ChecksumMismatchError, StreamInterruptedError
+
+DEFAULT_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+Destination = Union[str, "os.PathLike[str]", IO[bytes]]
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-\d+/(?:\d+|\*)")
+
+
+class DownloadResult:
+    """What `download_to` wrote.
+
+    Attributes:
+        path (str | None): Final file path, or None when writing to a caller-provided file object
+        bytes_written (int): Size of the body
+        checksum (str | None): Hex digest of the body with the requested algorithm
+        content_type (str | None): ``Content-Type`` of the response
+        resumed (int): How many times the download resumed after a dropped connection
+    """
+
+    __slots__ = ("path", "bytes_written", "checksum", "content_type", "resumed")
+
+    def __init__(self, path: str | None, bytes_written: int, checksum: str | None, content_type: str | None, resumed: int) -> None:
+        self.path = path
+        self.bytes_written = bytes_written
+        self.checksum = checksum
+        self.content_type = content_type
+        self.resumed = resumed
+
+    def __repr__(self) -> str:
+        return f"DownloadResult(path={self.path!r}, bytes_written={self.bytes_written}, checksum={self.checksum!r}, resumed={self.resumed})"
+
+
+class RangeResume:
+    """Remembers what the first response allows so a dropped body can be resumed."""
+
+    __slots__ = ("validator", "accepts_ranges", "content_type", "resumed")
+
+    def __init__(self) -> None:
+        self.validator: str | None = None
+        self.accepts_ranges = False
+        self.content_type: str | None = None
+        self.resumed = 0
+
+    def request_kwargs(self, request_kwargs: dict[str, Any], offset: int) -> dict[str, Any]:
+        """Return the request to send to continue from ``offset``."""
+        self.resumed += 1
+        if not (self.accepts_ranges and self.validator and offset):
+            return request_kwargs
+        return {**request_kwargs, "headers": {**request_kwargs["headers"], "Range": f"bytes={offset}-", "If-Range": self.validator}}
+
+    def skip(self, response: httpx.Response, offset: int) -> int:
+        """Return how many leading bytes of ``response`` the caller already has.
+
+        Raises:
+            StreamInterruptedError: If the response cannot continue the body delivered so far
+        """
+        validator = response.headers.get("etag") or response.headers.get("last-modified")
+        if offset == 0:
+            self.validator = validator
+            self.accepts_ranges = response.headers.get("accept-ranges", "").lower() == "bytes"
+            self.content_type = response.headers.get("content-type")
+            return 0
+        if response.status_code == 206:
+            match = _CONTENT_RANGE.match(response.headers.get("content-range", ""))
+            if match is not None and int(match.group(1)) <= offset:
+                return offset - int(match.group(1))
+        elif self.validator is None or validator == self.validator:
+            # Full body again (no range support, or the range was ignored): drop what was already delivered.
+            return offset
+        raise StreamInterruptedError(f"Download cannot resume at byte {offset}: the content changed on the server", delivered=offset)
+
+
+def new_hash(algorithm: str | None) -> Any:
+    """Return a ``hashlib`` object for ``algorithm`` (None disables checksumming).
+
+    Raises:
+        ValueError: If the algorithm is not supported by ``hashlib``
+    """
+    if algorithm is None:
+        return None
+    try:
+        return hashlib.new(algorithm)
+    except ValueError as exc:
+        raise ValueError(f"Unsupported checksum algorithm {algorithm!r}") from exc
+
+
+class DownloadSink:
+    """Writes chunks to a path (via ``<path>.part``) or to a caller-provided binary file object."""
+
+    def __init__(self, destination: Destination, checksum: str | None, expected_checksum: str | None) -> None:
+        if expected_checksum is not None and checksum is None:
+            raise ValueError("expected_checksum requires a checksum algorithm")
+        self.hash = new_hash(checksum)
+        self.expected_checksum = expected_checksum.lower() if expected_checksum is not None else None
+        self.bytes_written = 0
+        if isinstance(destination, (str, os.PathLike)):
+            self.path: str | None = os.fspath(destination)
+            self._part = self.path + ".part"
+            self._file: IO[bytes] = open(self._part, "wb")
+        else:
+            self.path = None
+            self._file = destination
+
+    def write(self, chunk: bytes) -> None:
+        self._file.write(chunk)
+        if self.hash is not None:
+            self.hash.update(chunk)
+        self.bytes_written += len(chunk)
+
+    def finish(self, resume: RangeResume) -> DownloadResult:
+        """Verify the checksum and move the file into place.
+
+        Raises:
+            ChecksumMismatchError: If the body does not match ``expected_checksum``
+        """
+        digest = self.hash.hexdigest() if self.hash is not None else None
+        if self.path is not None:
+            self._file.close()
+        if self.expected_checksum is not None and digest != self.expected_checksum:
+            self.abort()
+            raise ChecksumMismatchError(f"Checksum mismatch: expected {self.expected_checksum}, got {digest}", expected=self.expected_checksum, actual=digest or "")
+        if self.path is not None:
+            os.replace(self._part, self.path)
+        return DownloadResult(self.path, self.bytes_written, digest, resume.content_type, resume.resumed)
+
+    def abort(self) -> None:
+        """Drop the partial file (nothing to undo for caller-provided file objects)."""
+        if self.path is not None:
+            self._file.close()
+            try:
+                os.remove(self._part)
+            except FileNotFoundError:
+                pass
@@ -0,0 +1,163 @@
+"""Reuse of signed download links for stored files.
+
+Every primitive given a `FileRef` (extractions, parses, splits, partitions,
+classifications, edits, schemas, workflow runs) resolves it with
+``files.get_download_link(file_id)`` before sending the document, so running
+ten schemas over one stored file used to request ten links. The client keeps
+the links it fetched in a `FileLinkCache` and hands the same link out again
+while it is valid. Any other call on a file's path (a delete, a re-upload
+completing under the same id) forgets the links kept for that file.
+
+Only the links fetched to resolve documents are reused: a direct
+``client.files.get_download_link(...)`` call fetches a fresh link, whose full
+validity the caller may rely on, unless the cache was created with
+``direct_calls=True``. A reused link reports in ``expires_in`` the seconds it
+has left, not the validity it had when it was fetched.
+
+A link is only reused while at least ``min_validity`` seconds of it remain:
+the server may fetch the document some time after accepting a request, so a
+link about to expire is refreshed ahead of its expiry instead of being sent
+one last time. Links whose ``expires_in`` cannot be read (seconds, a
+``30m`` / ``1h`` style duration, or an ISO 8601 timestamp) are not kept.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import contextvars
+import datetime
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterator
+
+DEFAULT_MIN_LINK_VALIDITY = 300.0
+DEFAULT_FILE_LINK_CACHE_SIZE = 1024
+
+_DOWNLOAD_LINK_PATH = re.compile(r"^/?v1/files/([^/]+)/download-link$")
+# ``/v1/files/{id}...`` and the re-upload path ``/v1/files/upload/{id}/complete``.
+_FILE_PATH = re.compile(r"^/?v1/files/(?:upload/)?([^/?]+)")
+_FILE_COLLECTIONS = frozenset({"upload", "blueprints"})
+_DURATION = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*$", re.IGNORECASE)
+_UNIT_SECONDS = {"": 1, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_resolving_documents: contextvars.ContextVar[bool] = contextvars.ContextVar("retab_resolving_documents", default=False)
+
+
+@contextlib.contextmanager
+def resolving_documents() -> Iterator[None]:
+    """Mark the download links fetched inside the block as fetched to resolve ``FileRef`` documents."""
+    token = _resolving_documents.set(True)
+    try:
+        yield
+    finally:
+        _resolving_documents.reset(token)
+
+
+def download_link_file_id(endpoint: str) -> str | None:
+    """Return the file id of a ``files.get_download_link`` endpoint, or None for any other endpoint."""
+    match = _DOWNLOAD_LINK_PATH.match(endpoint)
+    return match.group(1) if match else None
+
+
+def file_path_id(path: str) -> str | None:
+    """Return the id of the file a ``/v1/files`` request path acts on, or None when it names no single file."""
+    match = _FILE_PATH.match(path)
+    return match.group(1) if match and match.group(1) not in _FILE_COLLECTIONS else None
+
+
+def link_expiry(expires_in: Any, fetched_at: float) -> float | None:
+    """Return when a link fetched at ``fetched_at`` expires (a ``time.time()`` timestamp), or None if unknown."""
+    if isinstance(expires_in, (int, float)) and not isinstance(expires_in, bool):
+        return fetched_at + expires_in
+    if not isinstance(expires_in, str):
+        return None
+    match = _DURATION.match(expires_in)
+    if match:
+        return fetched_at + float(match.group(1)) * _UNIT_SECONDS[match.group(2).lower()]
+    try:
+        expires_at = datetime.datetime.fromisoformat(expires_in.strip())
+    except ValueError:
+        return None
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+    return expires_at.timestamp()
+
+
+class FileLinkCache:
+    """Download links of stored files, reused until they get close to their expiry.
+
+    Args:
+        min_validity (float): Seconds a link must still be valid to be handed out again. Defaults to 300
+        max_entries (int): Links kept, least recently used dropped first. Defaults to 1024
+        direct_calls (bool): Also reuse links for direct ``files.get_download_link`` calls, not only for the links
+            fetched to resolve documents. Defaults to False
+    """
+
+    def __init__(self, min_validity: float = DEFAULT_MIN_LINK_VALIDITY, max_entries: int = DEFAULT_FILE_LINK_CACHE_SIZE, direct_calls: bool = False) -> None:
+        if min_validity < 0:
+            raise ValueError("min_validity must be >= 0")
+        if max_entries < 1:
+            raise ValueError("max_entries must be >= 1")
+        self.min_validity = min_validity
+        self.max_entries = max_entries
+        self.direct_calls = direct_calls
+        self._lock = threading.Lock()
+        # key -> (file id, expiry as a time.time() timestamp, decoded FileLink payload)
+        self._links: OrderedDict[str, tuple[str, float, dict[str, Any]]] = OrderedDict()
+
+    def applies(self) -> bool:
+        """Whether a download link requested now may be served from (and kept in) the cache."""
+        return self.direct_calls or _resolving_documents.get()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the link stored under ``key`` if it is still valid for ``min_validity`` seconds.
+
+        A relative ``expires_in`` (seconds or a duration) is replaced by the seconds the link has left.
+        """
+        with self._lock:
+            entry = self._links.get(key)
+            if entry is None:
+                return None
+            remaining = entry[1] - time.time()
+            if remaining < self.min_validity:
+                del self._links[key]
+                return None
+            self._links.move_to_end(key)
+            link = dict(entry[2])
+        expires_in = link.get("expires_in")
+        if isinstance(expires_in, (int, float)) and not isinstance(expires_in, bool):
+            link["expires_in"] = int(remaining)
+        elif isinstance(expires_in, str) and _DURATION.match(expires_in):
+            link["expires_in"] = str(int(remaining))
+        return link
+
+    def put(self, key: str, file_id: str, link: Any, fetched_at: float) -> None:
+        """Keep a decoded ``FileLink`` payload fetched at ``fetched_at``, if its expiry can be read."""
+        if not isinstance(link, dict):
+            return
+        expires_at = link_expiry(link.get("expires_in"), fetched_at)
+        if expires_at is None or expires_at - time.time() < self.min_validity:
+            return
+        with self._lock:
+            self._links[key] = (file_id, expires_at, dict(link))
+            self._links.move_to_end(key)
+            while len(self._links) > self.max_entries:
+                self._links.popitem(last=False)
+
+    def invalidate(self, file_id: str) -> None:
+        """Forget the links of ``file_id``."""
+        with self._lock:
+            for key in [key for key, entry in self._links.items() if entry[0] == file_id]:
+                del self._links[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._links.clear()
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def __repr__(self) -> str:
+        return f"FileLinkCache(min_validity={self.min_validity}, max_entries={self.max_entries}, direct_calls={self.direct_calls}, links={len(self._links)})"
@@ -0,0 +1,123 @@
+"""Request hedging for safe, idempotent methods.
+
+Polling reads (``extractions.get``, ``workflows.runs.get``,
+``files.get_download_link``...) are cheap on the server but their latency has
+a long tail: most answers come back quickly, a few are stuck behind a slow
+connection or a busy worker. Hedging sends a duplicate of a request that has
+not answered within the route's usual latency and keeps whichever copy
+returns first, cancelling the other.
+
+`HedgePolicy` tracks recent latencies per route template (``GET
+/v1/extractions/{id}``) and waits for their ``percentile`` before hedging, so
+only the slowest few percent of requests are duplicated. A token budget bounds
+the extra load: every eligible request earns ``budget`` tokens and every hedge
+spends one, so hedges never exceed ``budget`` of the traffic however slow the
+API gets.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+
+
+class _RouteLatency:
+    __slots__ = ("samples", "delay", "stale")
+
+    def __init__(self, window: int) -> None:
+        self.samples: deque[float] = deque(maxlen=window)
+        self.delay: float | None = None
+        self.stale = 0
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow idempotent request.
+
+    Args:
+        percentile (float): Latency percentile of the route after which the hedge is sent. Defaults to 0.95
+        budget (float): Maximum hedges as a fraction of eligible requests; 0.1 caps the extra load at 10%.
+            Defaults to 0.1
+        initial_delay (float): Hedge delay used until ``min_samples`` latencies of a route are known.
+            Defaults to 1.0
+        min_delay (float): Lower bound on the hedge delay, in seconds. Defaults to 0.01
+        max_delay (float): Upper bound on the hedge delay, in seconds. Defaults to 30.0
+        min_samples (int): Latencies needed before the percentile is trusted. Defaults to 20
+        window (int): Recent latencies kept per route. Defaults to 256
+        max_burst (float): Cap on accumulated budget tokens, i.e. how many hedges can be sent back to
+            back after a quiet period. Defaults to 10.0
+        methods (tuple[str, ...]): Methods that may be hedged. Only safe, idempotent methods belong here.
+            Defaults to ``("GET", "HEAD")``
+    """
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.1,
+        initial_delay: float = 1.0,
+        min_delay: float = 0.01,
+        max_delay: float = 30.0,
+        min_samples: int = 20,
+        window: int = 256,
+        max_burst: float = 10.0,
+        methods: tuple[str, ...] = ("GET", "HEAD"),
+    ) -> None:
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be between 0 and 1")
+        if not 0.0 <= budget <= 1.0:
+            raise ValueError("budget must be between 0 and 1")
+        if min_samples < 1 or window < min_samples:
+            raise ValueError("window must be >= min_samples >= 1")
+        self.percentile = percentile
+        self.budget = budget
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.max_burst = max_burst
+        self.methods = tuple(method.upper() for method in methods)
+        self._routes: dict[str, _RouteLatency] = {}
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def delay(self, route: str) -> float:
+        """Seconds to wait for the first attempt on ``route`` before hedging it."""
+        latency = self._routes.get(route)
+        if latency is None or len(latency.samples) < self.min_samples:
+            delay = self.initial_delay
+        else:
+            # Re-sorting the window on every request would cost more than the request bookkeeping itself.
+            if latency.delay is None or latency.stale >= 16:
+                with self._lock:
+                    ordered = sorted(latency.samples)
+                    latency.delay = ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+                    latency.stale = 0
+            delay = latency.delay
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    def record(self, route: str, seconds: float) -> None:
+        """Record the latency of a successful attempt on ``route``."""
+        with self._lock:
+            latency = self._routes.get(route)
+            if latency is None:
+                latency = self._routes[route] = _RouteLatency(self.window)
+            latency.samples.append(seconds)
+            latency.stale += 1
+
+    def admit(self) -> None:
+        """Credit the hedge budget for one eligible request."""
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget, self.max_burst)
+
+    def try_hedge(self) -> bool:
+        """Spend one hedge from the budget; False when the budget is exhausted."""
+        with self._lock:
+            # Tolerate float drift: ten credits of 0.1 must buy one hedge.
+            if self._tokens < 1.0 - 1e-9:
+                return False
+            self._tokens -= 1.0
+            return True
+
+    def __repr__(self) -> str:
+        return f"HedgePolicy(percentile={self.percentile}, budget={self.budget}, initial_delay={self.initial_delay}, methods={self.methods})"
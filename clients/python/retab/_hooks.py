@@ -0,0 +1,269 @@
+"""Request lifecycle hooks.
+
+A *call* is one logical SDK operation such as ``client.extractions.create(...)``.
+It spans document preparation, every HTTP attempt (retries included) and the
+validation of the response into models. Resource methods open a `CallScope`
+automatically; a bare ``client._request`` opens an implicit one named after the
+route.
+
+Observers subclass `RequestHooks` and are passed to the client as ``hooks=[...]``.
+The ``on_request`` / ``on_response`` / ``on_retry`` / ``on_error`` client
+arguments are a shortcut for plain callables. `OpenTelemetryHooks` (in
+``retab._otel``) is built on the same interface.
+
+Everything here is a no-op unless the client has at least one hook: resource
+methods and phases check for an active call and return immediately otherwise.
+"""
+
+from __future__ import annotations
+
+import functools
+import logging
+import re
+import time
+from contextvars import ContextVar, Token
+from typing import Any, Callable, Sequence
+
+import httpx
+
+logger = logging.getLogger("retab")
+
+Hook = Callable[["RequestEvent"], None]
+
+# API routes are lowercase words joined by hyphens; any other path segment (IDs, names) is a parameter.
+_PARAMETER_SEGMENT = re.compile(r"(?<=/)(?!(?:[a-z][a-z-]*|v\d+)(?:/|$))[^/]+")
+
+_current_call: ContextVar["CallScope | None"] = ContextVar("retab_current_call", default=None)
+
+
+class RequestHooks:
+    """Base class for lifecycle observers; override any subset of the methods.
+
+    Hooks run inline on the request path, so they should be fast. Exceptions
+    raised by a hook are logged and swallowed, never propagated to the caller.
+    """
+
+    def on_call_start(self, call: CallScope) -> None:
+        """A logical call started."""
+
+    def on_call_end(self, call: CallScope) -> None:
+        """A logical call finished; ``call.error`` is set if it failed."""
+
+    def on_request(self, event: RequestEvent) -> None:
+        """An HTTP attempt is about to be sent. ``event.request`` may still be modified."""
+
+    def on_response(self, event: RequestEvent) -> None:
+        """An HTTP attempt received a response. ``event.error`` is set for non-2xx statuses."""
+
+    def on_retry(self, event: RequestEvent) -> None:
+        """An attempt failed with ``event.error``; the next one starts after ``event.delay`` seconds."""
+
+    def on_error(self, event: RequestEvent) -> None:
+        """The call failed for good with ``event.error``."""
+
+    def on_phase(self, call: CallScope, name: str, started_ns: int, ended_ns: int) -> None:
+        """An SDK-side phase of the call (``prepare_mime_document``, ``model_validate``) completed."""
+
+
+class CallbackHooks(RequestHooks):
+    """Adapts the ``on_request`` / ``on_response`` / ``on_retry`` / ``on_error`` client arguments."""
+
+    def __init__(self, on_request: Hook | None = None, on_response: Hook | None = None, on_retry: Hook | None = None, on_error: Hook | None = None) -> None:
+        for name, callback in (("on_request", on_request), ("on_response", on_response), ("on_retry", on_retry), ("on_error", on_error)):
+            if callback is not None:
+                setattr(self, name, callback)
+
+
+class CallScope:
+    """One logical SDK call and everything measured about it.
+
+    Attributes:
+        resource (str | None): Resource class name, e.g. ``"Extractions"``; None for implicit calls
+        operation (str): Method name, e.g. ``"create"``, or ``"<METHOD> <path>"`` for implicit calls
+        attempts (int): HTTP attempts made so far, hedges included
+        hedges (int): Duplicate attempts sent by request hedging
+        status_code (int | None): Status code of the last response
+        last_response (httpx.Response | None): Last response received
+        request_bytes (int): Request body bytes sent, summed over attempts
+        response_bytes (int): Response body bytes received, summed over attempts (streamed bodies
+            count only what was read before the call returned)
+        error (BaseException | None): Exception the call ended with
+        context (dict): Scratch space for hooks to carry their own state
+    """
+
+    __slots__ = (
+        "hooks",
+        "resource",
+        "operation",
+        "started_ns",
+        "ended_ns",
+        "attempts",
+        "hedges",
+        "status_code",
+        "last_response",
+        "request_bytes",
+        "response_bytes",
+        "error",
+        "context",
+        "last_event",
+        "response_ns",
+        "_token",
+    )
+
+    def __init__(self, hooks: Sequence[RequestHooks], resource: str | None, operation: str) -> None:
+        self.hooks = hooks
+        self.resource = resource
+        self.operation = operation
+        self.started_ns = 0
+        self.ended_ns = 0
+        self.attempts = 0
+        self.hedges = 0
+        self.status_code: int | None = None
+        self.last_response: httpx.Response | None = None
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.error: BaseException | None = None
+        self.context: dict[str, Any] = {}
+        self.last_event: RequestEvent | None = None
+        self.response_ns = 0
+        self._token: Token[CallScope | None] | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.resource}.{self.operation}" if self.resource else self.operation
+
+    @property
+    def request_id(self) -> str | None:
+        """``x-request-id`` of the last response."""
+        return self.last_response.headers.get("x-request-id") if self.last_response is not None else None
+
+    @property
+    def retries(self) -> int:
+        return max(self.attempts - self.hedges - 1, 0)
+
+    @property
+    def duration(self) -> float:
+        """Seconds from start to end (or to now while the call is running)."""
+        return ((self.ended_ns or time.time_ns()) - self.started_ns) / 1e9
+
+    def response_decoded(self) -> None:
+        """Mark the end of an HTTP request's decoding; what follows is the caller's validation."""
+        self.response_ns = time.time_ns()
+
+    def report_validation(self) -> None:
+        """Report the time since the last decoded response as the ``model_validate`` phase."""
+        if self.response_ns:
+            dispatch(self.hooks, "on_phase", self, "model_validate", self.response_ns, time.time_ns())
+            self.response_ns = 0
+
+    def __enter__(self) -> CallScope:
+        self.started_ns = time.time_ns()
+        self._token = _current_call.set(self)
+        dispatch(self.hooks, "on_call_start", self)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        self.ended_ns = time.time_ns()
+        if exc is not None and self.error is None:
+            self.error = exc
+        try:
+            dispatch(self.hooks, "on_call_end", self)
+        finally:
+            if self._token is not None:
+                _current_call.reset(self._token)
+                self._token = None
+
+
+class RequestEvent:
+    """One HTTP attempt of a call, passed to ``on_request`` / ``on_response`` / ``on_retry`` / ``on_error``.
+
+    The same object is passed to every hook fired for a given attempt, so
+    ``context`` can carry state (a timer, a span) from ``on_request`` onwards.
+    """
+
+    __slots__ = ("call", "attempt", "request", "response", "error", "started_ns", "ended_ns", "delay", "is_async", "context")
+
+    def __init__(self, call: CallScope, request: httpx.Request, is_async: bool) -> None:
+        call.attempts += 1
+        call.last_event = self
+        self.call = call
+        self.attempt = call.attempts
+        self.request = request
+        self.response: httpx.Response | None = None
+        self.error: BaseException | None = None
+        self.started_ns = time.time_ns()
+        self.ended_ns = 0
+        self.delay: float | None = None
+        self.is_async = is_async
+        self.context: dict[str, Any] = {}
+
+    @property
+    def method(self) -> str:
+        return self.request.method
+
+    @property
+    def url(self) -> str:
+        return str(self.request.url)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds the attempt took: up to the full body for regular requests, up to the headers for streams."""
+        return ((self.ended_ns or time.time_ns()) - self.started_ns) / 1e9
+
+
+class _Phase:
+    __slots__ = ("call", "name", "started_ns")
+
+    def __init__(self, call: CallScope, name: str) -> None:
+        self.call = call
+        self.name = name
+        self.started_ns = 0
+
+    def __enter__(self) -> None:
+        self.started_ns = time.time_ns()
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        dispatch(self.call.hooks, "on_phase", self.call, self.name, self.started_ns, time.time_ns())
+
+
+class _NoPhase:
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        return None
+
+
+_NO_PHASE = _NoPhase()
+
+
+@functools.lru_cache(maxsize=4096)
+def route_template(path: str) -> str:
+    """Collapse the parameter segments of an API path, e.g. ``/v1/files/file_1/download-link`` -> ``/v1/files/{id}/download-link``.
+
+    Keeps metric labels and span names low-cardinality. Cached: polling loops label the same paths over and over.
+    """
+    return _PARAMETER_SEGMENT.sub("{id}", path)
+
+
+def current_call() -> CallScope | None:
+    """Return the call being traced in this context, if any."""
+    return _current_call.get()
+
+
+def phase(name: str) -> _Phase | _NoPhase:
+    """Time a block as a named phase of the current call (a no-op outside a traced call)."""
+    call = _current_call.get()
+    if call is None:
+        return _NO_PHASE
+    return _Phase(call, name)
+
+
+def dispatch(hooks: Sequence[RequestHooks], method: str, *args: Any) -> None:
+    for hook in hooks:
+        try:
+            getattr(hook, method)(*args)
+        except Exception:
+            logger.warning("Retab %s hook %r raised; ignoring", method, hook, exc_info=True)
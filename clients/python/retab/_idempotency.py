@@ -0,0 +1,180 @@
+"""Automatic idempotency keys for POST requests.
+
+Retries re-send a POST after a 5xx, a 429 or a dropped connection, and the
+first attempt may already have started an expensive job on the server (an
+extraction, a parse, a workflow run). Every POST without an explicit
+``idempotency_key`` is therefore sent with a generated ``Idempotency-Key``.
+The request kwargs are built once per call, so every attempt of that call
+(retries, stream reconnects, hedges) carries the same key and the server
+runs the work once.
+
+A key generated in memory does not survive the process. To resubmit safely
+after a crash or a restart, pass an `IdempotencyStore` with a ``path``: keys
+are then derived per request fingerprint (method, URL, query and body) and
+written to disk until the server gives a final answer, so re-running the
+same request after a restart reuses the key of the attempt that was lost.
+
+The store file is a journal with one JSON line per change (a key issued or
+settled), so a POST costs one small append rather than a rewrite of every
+pending key. It is replayed when the store is opened, and rewritten with only
+the pending keys once most of its lines are stale; a line cut short by a
+crash is skipped.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Any
+
+from .exceptions import APIError, ConflictError, InternalServerError, RateLimitError
+
+DEFAULT_IDEMPOTENCY_TTL = 24 * 3600.0
+# The journal is compacted once it holds this many lines and four times more than there are pending keys.
+_COMPACT_MIN_RECORDS = 256
+
+
+def new_idempotency_key() -> str:
+    return str(uuid.uuid4())
+
+
+def request_fingerprint(request_kwargs: dict[str, Any]) -> str:
+    """Hash what identifies a request: method, URL, query and body (JSON bytes, form fields and files)."""
+    digest = hashlib.sha256()
+    digest.update(f"{request_kwargs['method']} {request_kwargs['url']}\n".encode())
+    params = request_kwargs.get("params")
+    if params:
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    content = request_kwargs.get("content")
+    if content is not None:
+        digest.update(content)
+    form_data = request_kwargs.get("data")
+    if form_data:
+        digest.update(json.dumps(form_data, sort_keys=True, default=str).encode())
+    files = request_kwargs.get("files")
+    if files:
+        for name, value in files.items() if isinstance(files, dict) else files:
+            digest.update(str(name).encode())
+            for part in value if isinstance(value, tuple) else (value,):
+                digest.update(part if isinstance(part, bytes) else repr(part).encode())
+    return digest.hexdigest()
+
+
+def is_final(error: BaseException | None) -> bool:
+    """Whether the server gave an answer that makes resubmitting under the same key pointless.
+
+    Success and client errors are final. A 5xx, a 429, a 409 (the key is still in use) or a
+    request that never got an answer may be retried later, so its key must be kept.
+    """
+    if error is None:
+        return True
+    return isinstance(error, APIError) and not isinstance(error, (InternalServerError, RateLimitError, ConflictError))
+
+
+class IdempotencyStore:
+    """Remembers the idempotency key of every POST that has not been answered for good.
+
+    Identical requests (same fingerprint) share a key while one of them is pending, so a call
+    re-run after a failure, or after a restart when ``path`` is set, is deduplicated by the server.
+    A key is dropped once its call succeeds or fails with a client error, or after ``ttl``.
+
+    Args:
+        path (str | os.PathLike, optional): Journal file the pending keys are persisted to. In memory only
+            when omitted. One store file per process; it is not safe to share it between processes
+        ttl (float): Seconds a pending key is reused; match the server's key retention. Keys older than
+            that are dropped when the store is opened. Defaults to 24 hours
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, ttl: float = DEFAULT_IDEMPOTENCY_TTL) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be > 0")
+        self.path = os.fspath(path) if path is not None else None
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        # fingerprint -> (key, created at as a time.time() timestamp)
+        self._pending: dict[str, tuple[str, float]] = {}
+        self._fingerprints: dict[str, str] = {}
+        # Lines in the journal file.
+        self._records = 0
+        if self.path is not None and os.path.exists(self.path):
+            self._load()
+
+    def key_for(self, request_kwargs: dict[str, Any]) -> str:
+        """Return the pending key of this request, or register a new one."""
+        fingerprint = request_fingerprint(request_kwargs)
+        now = time.time()
+        with self._lock:
+            entry = self._pending.get(fingerprint)
+            if entry is not None and now - entry[1] < self.ttl:
+                return entry[0]
+            if entry is not None:
+                del self._fingerprints[entry[0]]
+            key = new_idempotency_key()
+            self._pending[fingerprint] = (key, now)
+            self._fingerprints[key] = fingerprint
+            self._append(fingerprint, key, now)
+            return key
+
+    def settle(self, key: str | None, error: BaseException | None) -> None:
+        """Forget ``key`` if ``error`` is final (see `is_final`); keys this store did not issue are ignored."""
+        if key is None or not is_final(error):
+            return
+        with self._lock:
+            fingerprint = self._fingerprints.pop(key, None)
+            if fingerprint is None:
+                return
+            del self._pending[fingerprint]
+            self._append(fingerprint, None, 0.0)
+
+    def pending(self) -> dict[str, str]:
+        """Fingerprint -> key of every request still awaiting a final answer."""
+        with self._lock:
+            return {fingerprint: key for fingerprint, (key, _) in self._pending.items()}
+
+    def _load(self) -> None:
+        assert self.path is not None
+        with open(self.path, encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    fingerprint, key, created_at = json.loads(line)
+                except (ValueError, TypeError):
+                    continue
+                self._records += 1
+                previous = self._pending.pop(fingerprint, None)
+                if previous is not None:
+                    del self._fingerprints[previous[0]]
+                if key is not None:
+                    self._pending[fingerprint] = (key, created_at)
+                    self._fingerprints[key] = fingerprint
+        now = time.time()
+        for fingerprint, (key, created_at) in list(self._pending.items()):
+            if now - created_at >= self.ttl:
+                del self._pending[fingerprint], self._fingerprints[key]
+        if self._records > len(self._pending):
+            self._compact()
+
+    def _append(self, fingerprint: str, key: str | None, created_at: float) -> None:
+        # Called with the lock held; a key of None records that the fingerprint was settled.
+        if self.path is None:
+            return
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps([fingerprint, key, created_at]) + "\n")
+        self._records += 1
+        if self._records >= _COMPACT_MIN_RECORDS and self._records > 4 * len(self._pending):
+            self._compact()
+
+    def _compact(self) -> None:
+        # Rewrite the journal with one line per pending key.
+        assert self.path is not None
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as fh:
+            fh.writelines(json.dumps([fingerprint, key, created_at]) + "\n" for fingerprint, (key, created_at) in self._pending.items())
+        os.replace(tmp, self.path)
+        self._records = len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"IdempotencyStore(path={self.path!r}, pending={len(self._pending)})"
@@ -0,0 +1,274 @@
+"""Incremental decoding of list responses, one item at a time.
+
+List endpoints answer with an envelope ``{"data": [...], "list_metadata": {...}}``.
+Decoding it with ``response.json()`` buffers the whole body, materialises every
+item as dicts and only then hands them to pydantic, so a page of large
+``Extraction`` objects lives in memory twice over.
+
+`JSONListDecoder` is fed the body chunk by chunk as it arrives. It scans for
+the boundaries of each element of the ``data`` array and decodes elements
+individually, so only one item (plus the unread tail of the current chunk) is
+held at a time. Every other top-level key is collected into ``envelope``.
+
+The scanner only tracks nesting depth and string state; the actual decoding of
+each item is done by the client's `JSONCodec`, so the fast backends still apply.
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any, Iterable, Iterator
+
+from ._codec import JSONCodec
+
+_WHITESPACE = b" \t\r\n"
+# Outside strings only quotes and brackets matter; inside them, quotes and backslashes.
+_STRUCTURAL = re.compile(rb'["\[\]{}]')
+_STRING_SPECIAL = re.compile(rb'["\\]')
+_SCALAR_END = re.compile(rb"[,\]}\s]")
+
+_NEED_MORE = object()
+
+# Parser states.
+_START, _KEY, _COLON, _VALUE, _OBJ_NEXT, _ITEMS_START, _FIRST_ITEM, _ITEM, _ITEM_NEXT, _DONE = range(10)
+
+
+def _drop_path(obj: Any, path: list[str]) -> None:
+    if isinstance(obj, list):
+        for element in obj:
+            _drop_path(element, path)
+    elif isinstance(obj, dict):
+        if len(path) == 1:
+            obj.pop(path[0], None)
+        elif path[0] in obj:
+            _drop_path(obj[path[0]], path[1:])
+
+
+class JSONListDecoder:
+    """Push decoder yielding the elements of a list response as they complete.
+
+    Args:
+        codec: Codec used to decode each item and envelope value
+        items_key: Top-level key holding the array to stream. Defaults to ``"data"``. A
+            body that is itself a JSON array is streamed as-is
+        drop: Dotted paths removed from every item before it is returned, e.g.
+            ``["consensus.choices"]``. A path crossing a list applies to each of its elements
+
+    Attributes:
+        envelope (dict): Top-level keys other than ``items_key`` seen so far (e.g. ``list_metadata``)
+        count (int): Number of items returned so far
+    """
+
+    def __init__(self, codec: JSONCodec | None = None, items_key: str = "data", drop: Iterable[str] | None = None) -> None:
+        self.codec = codec if codec is not None else JSONCodec()
+        self.items_key = items_key
+        self.drop = [path.split(".") for path in drop or ()]
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state, e.g. before re-reading a response from the start."""
+        self.envelope: dict[str, Any] = {}
+        self.count = 0
+        self._buffer = bytearray()
+        self._pos = 0
+        self._state = _START
+        self._key: str | None = None
+        self._top_level_list = False
+        # Resumable scan of the value currently being read.
+        self._value_start = -1
+        self._depth = 0
+        self._in_string = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes) -> Iterator[Any]:
+        """Consume ``chunk`` and yield every item it completes.
+
+        Raises:
+            ValueError: If the body is not a JSON object or array, or an item is malformed
+        """
+        self._buffer += chunk
+        while True:
+            item = self._advance(final=False)
+            if item is _NEED_MORE:
+                break
+            yield item
+        # Drop the consumed prefix so the buffer never holds more than the current item.
+        consumed = self._value_start if self._value_start >= 0 else self._pos
+        if consumed:
+            del self._buffer[:consumed]
+            self._pos -= consumed
+            if self._value_start >= 0:
+                self._value_start = 0
+
+    def close(self) -> Iterator[Any]:
+        """Signal the end of the body and yield any final item.
+
+        Raises:
+            ValueError: If the body ended before the top-level value was complete
+        """
+        while True:
+            item = self._advance(final=True)
+            if item is _NEED_MORE:
+                break
+            yield item
+        if self._state != _DONE or self._buffer[self._pos :].strip(_WHITESPACE):
+            raise ValueError(f"Truncated or malformed JSON list response after {self.count} items")
+
+    # -- scanning ---------------------------------------------------------------------------
+
+    def _skip_whitespace(self) -> int | None:
+        """Advance past whitespace and return the next byte, or None if the buffer is exhausted."""
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _scan_value(self, final: bool) -> bytes | None:
+        """Return the raw bytes of the value starting at ``self._pos`` once it is complete."""
+        buffer = self._buffer
+        if self._value_start < 0:
+            self._value_start = self._pos
+            self._depth = 0
+            self._in_string = False
+        pos = self._pos
+        first = buffer[self._value_start]
+        if first not in b'{["':
+            match = _SCALAR_END.search(buffer, pos)
+            if match is None:
+                if not final:
+                    self._pos = len(buffer)
+                    return None
+                end = len(buffer)
+            else:
+                end = match.start()
+            return self._finish_value(end)
+        if pos == self._value_start and first == ord('"'):
+            pos += 1
+            self._in_string = True
+        while True:
+            if self._in_string:
+                match = _STRING_SPECIAL.search(buffer, pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return None
+                pos = match.start()
+                if buffer[pos] == ord("\\"):
+                    if pos + 1 >= len(buffer):
+                        # Resume on the backslash once the escaped byte arrives.
+                        self._pos = pos
+                        return None
+                    pos += 2
+                    continue
+                pos += 1
+                self._in_string = False
+                if self._depth == 0:
+                    return self._finish_value(pos)
+                continue
+            match = _STRUCTURAL.search(buffer, pos)
+            if match is None:
+                self._pos = len(buffer)
+                return None
+            pos = match.start()
+            token = buffer[pos]
+            pos += 1
+            if token == ord('"'):
+                self._in_string = True
+            elif token in b"{[":
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    return self._finish_value(pos)
+
+    def _finish_value(self, end: int) -> bytes:
+        raw = bytes(self._buffer[self._value_start : end])
+        self._pos = end
+        self._value_start = -1
+        return raw
+
+    def _expect(self, byte: int, allowed: bytes) -> None:
+        if byte not in allowed:
+            raise ValueError(f"Unexpected {chr(byte)!r} in JSON list response after {self.count} items; expected one of {allowed.decode()!r}")
+        self._pos += 1
+
+    def _item(self, raw: bytes) -> Any:
+        item = self.codec.loads(raw)
+        for path in self.drop:
+            _drop_path(item, path)
+        self.count += 1
+        return item
+
+    def _advance(self, final: bool) -> Any:
+        """Run the state machine until it yields an item or needs more input."""
+        while True:
+            state = self._state
+            if state == _DONE:
+                return _NEED_MORE
+            if self._value_start >= 0:
+                # Resuming a value that straddles chunks.
+                byte: int | None = self._buffer[self._value_start]
+            else:
+                byte = self._skip_whitespace()
+                if byte is None:
+                    return _NEED_MORE
+
+            if state == _START:
+                self._expect(byte, b"{[")
+                self._top_level_list = byte == ord("[")
+                self._state = _FIRST_ITEM if self._top_level_list else _KEY
+            elif state == _KEY:
+                if byte == ord("}"):
+                    self._pos += 1
+                    self._state = _DONE
+                    continue
+                raw = self._scan_value(final)
+                if raw is None:
+                    return _NEED_MORE
+                key = self.codec.loads(raw)
+                if not isinstance(key, str):
+                    raise ValueError("Object keys in JSON list response must be strings")
+                self._key = key
+                self._state = _COLON
+            elif state == _COLON:
+                self._expect(byte, b":")
+                self._state = _ITEMS_START if self._key == self.items_key else _VALUE
+            elif state == _VALUE:
+                raw = self._scan_value(final)
+                if raw is None:
+                    return _NEED_MORE
+                assert self._key is not None
+                self.envelope[self._key] = self.codec.loads(raw)
+                self._state = _OBJ_NEXT
+            elif state == _OBJ_NEXT:
+                self._expect(byte, b",}")
+                self._state = _KEY if byte == ord(",") else _DONE
+            elif state == _ITEMS_START:
+                if byte != ord("["):
+                    # e.g. "data": null; keep it in the envelope like any other value.
+                    self._state = _VALUE
+                    continue
+                self._pos += 1
+                self._state = _FIRST_ITEM
+            elif state == _FIRST_ITEM:
+                if byte == ord("]"):
+                    self._pos += 1
+                    self._state = _DONE if self._top_level_list else _OBJ_NEXT
+                else:
+                    self._state = _ITEM
+            elif state == _ITEM:
+                raw = self._scan_value(final)
+                if raw is None:
+                    return _NEED_MORE
+                self._state = _ITEM_NEXT
+                return self._item(raw)
+            elif state == _ITEM_NEXT:
+                self._expect(byte, b",]")
+                if byte == ord(","):
+                    self._state = _ITEM
+                else:
+                    self._state = _DONE if self._top_level_list else _OBJ_NEXT
@@ -0,0 +1,324 @@
+"""Opt-in, in-process client metrics.
+
+`MetricsRegistry` is a `RequestHooks` observer that a client installs when
+created with ``metrics=True`` (exposed as ``client.metrics``). It is off by
+default so clients nobody reads metrics from skip the hook chain. It keeps
+plain counters and fixed-bucket histograms in dicts keyed by label tuples,
+guarded by a single lock, so recording a call costs a handful of dict updates
+rather than a log line.
+
+Labels are ``resource`` (e.g. ``Extractions``) and ``operation`` (e.g.
+``create``). Requests made outside a resource method have an empty resource
+and ``"<METHOD> <route template>"`` as the operation.
+
+``snapshot()`` returns plain nested dicts for programmatic use (autoscalers,
+tests); ``to_prometheus()`` renders the Prometheus text exposition format so
+the registry can be served from any HTTP handler without extra dependencies.
+"""
+
+from __future__ import annotations
+
+import threading
+from bisect import bisect_left
+from typing import Any, Iterable
+
+from ._hooks import CallScope, RequestEvent, RequestHooks
+
+# Seconds. Retab calls range from a few milliseconds (metadata) to minutes (large extractions).
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+Labels = tuple[str, ...]
+GaugeKey = tuple[str, tuple[tuple[str, str], ...]]
+
+_OPEN = "metrics.open"
+
+
+class Histogram:
+    """Fixed-bucket histogram; not thread-safe on its own (the registry holds the lock)."""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.buckets = buckets
+        # One slot per bucket plus the +Inf overflow.
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation within its bucket (as Prometheus' ``histogram_quantile`` does)."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                return lower + (self.buckets[index] - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+    def snapshot(self) -> dict[str, Any]:
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, bucket_count in zip((*self.buckets, float("inf")), self.counts):
+            cumulative += bucket_count
+            buckets[_format_bound(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "p50": self.quantile(0.5), "p95": self.quantile(0.95), "p99": self.quantile(0.99), "buckets": buckets}
+
+
+class _Series:
+    """Every metric of one ``(resource, operation)`` pair, so recording an event is a single dict lookup."""
+
+    __slots__ = ("calls", "errors", "status_codes", "retries", "hedges", "bytes_sent", "bytes_received", "latency", "attempt_latency", "phases")
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        self.calls = 0
+        self.errors: dict[str, int] = {}
+        self.status_codes: dict[int, int] = {}
+        self.retries = 0
+        self.hedges = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.latency = Histogram(buckets)
+        self.attempt_latency = Histogram(buckets)
+        self.phases: dict[str, Histogram] = {}
+
+
+class MetricsRegistry(RequestHooks):
+    """Counters, gauges and histograms for one client.
+
+    Args:
+        buckets: Upper bounds (seconds) of the latency histogram buckets. Defaults to
+            ``DEFAULT_LATENCY_BUCKETS``
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Zero every metric (the in-flight gauge is kept, since those requests are still running)."""
+        with self._lock:
+            self._series: dict[Labels, _Series] = {}
+            self._gauges: dict[GaugeKey, float] = {}
+
+    @property
+    def in_flight(self) -> int:
+        """HTTP attempts currently waiting on the network."""
+        return self._in_flight
+
+    # -- RequestHooks -----------------------------------------------------------------------
+
+    def on_request(self, event: RequestEvent) -> None:
+        event.context[_OPEN] = True
+        with self._lock:
+            self._in_flight += 1
+            # Attempts that end without a hook of their own (cancelled, hedge losers) are closed with their call.
+            attempts = event.call.context.get(_OPEN)
+            if attempts is None:
+                event.call.context[_OPEN] = [event]
+            else:
+                attempts.append(event)
+
+    def _close(self, event: RequestEvent) -> None:
+        # Called with the lock held; counts each attempt down once, whichever hook sees it end first.
+        if event.context.pop(_OPEN, False):
+            self._in_flight -= 1
+
+    def on_response(self, event: RequestEvent) -> None:
+        status = event.response.status_code if event.response is not None else 0
+        elapsed = event.elapsed
+        with self._lock:
+            self._close(event)
+            series = self._get_series(event.call)
+            series.status_codes[status] = series.status_codes.get(status, 0) + 1
+            series.attempt_latency.observe(elapsed)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._close(event)
+            self._get_series(event.call).retries += 1
+
+    def on_error(self, event: RequestEvent) -> None:
+        with self._lock:
+            self._close(event)
+
+    def on_call_end(self, call: CallScope) -> None:
+        duration = call.duration
+        with self._lock:
+            for event in call.context.pop(_OPEN, ()):
+                self._close(event)
+            series = self._get_series(call)
+            series.calls += 1
+            if call.error is not None:
+                error = type(call.error).__name__
+                series.errors[error] = series.errors.get(error, 0) + 1
+            series.hedges += call.hedges
+            series.bytes_sent += call.request_bytes
+            series.bytes_received += call.response_bytes
+            series.latency.observe(duration)
+
+    def on_phase(self, call: CallScope, name: str, started_ns: int, ended_ns: int) -> None:
+        with self._lock:
+            phases = self._get_series(call).phases
+            histogram = phases.get(name)
+            if histogram is None:
+                histogram = phases[name] = Histogram(self.buckets)
+            histogram.observe((ended_ns - started_ns) / 1e9)
+
+    # -- Extension points -------------------------------------------------------------------
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """Record an SDK-internal gauge, e.g. an adaptively chosen page size."""
+        key = (name, tuple(sorted((label, str(label_value)) for label, label_value in labels.items())))
+        with self._lock:
+            self._gauges[key] = value
+
+    # -- Export -----------------------------------------------------------------------------
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return a point-in-time copy of every metric as plain dicts.
+
+        Per-operation metrics are keyed by ``"<resource>.<operation>"`` (or just the
+        operation for requests made outside a resource method).
+        """
+        with self._lock:
+            operations: dict[str, dict[str, Any]] = {}
+            phases: dict[str, dict[str, Any]] = {}
+            for labels, series in self._series.items():
+                name = _name(labels)
+                operations[name] = {
+                    "calls": series.calls,
+                    "errors": dict(series.errors),
+                    "status_codes": dict(series.status_codes),
+                    "retries": series.retries,
+                    "hedges": series.hedges,
+                    "bytes_sent": series.bytes_sent,
+                    "bytes_received": series.bytes_received,
+                    "latency": series.latency.snapshot(),
+                    "attempt_latency": series.attempt_latency.snapshot(),
+                }
+                for phase, histogram in series.phases.items():
+                    phases.setdefault(phase, {})[name] = histogram.snapshot()
+            gauges = {_gauge_name(name, labels): value for (name, labels), value in self._gauges.items()}
+            return {"in_flight": self._in_flight, "operations": operations, "phases": phases, "gauges": gauges}
+
+    def to_prometheus(self, prefix: str = "retab") -> str:
+        """Render every metric in the Prometheus text exposition format (version 0.0.4)."""
+        operation = ("resource", "operation")
+        lines: list[str] = []
+        with self._lock:
+            series = sorted(self._series.items())
+            _counter(lines, f"{prefix}_calls_total", "SDK calls completed.", operation, [(labels, s.calls) for labels, s in series if s.calls])
+            _counter(
+                lines,
+                f"{prefix}_call_errors_total",
+                "SDK calls that raised, by exception type.",
+                (*operation, "error"),
+                [((*labels, error), count) for labels, s in series for error, count in sorted(s.errors.items())],
+            )
+            _counter(
+                lines,
+                f"{prefix}_responses_total",
+                "HTTP responses received, by status code.",
+                (*operation, "status"),
+                [((*labels, str(status)), count) for labels, s in series for status, count in sorted(s.status_codes.items())],
+            )
+            _counter(lines, f"{prefix}_retries_total", "HTTP attempts that were retried.", operation, [(labels, s.retries) for labels, s in series if s.retries])
+            _counter(lines, f"{prefix}_hedges_total", "Duplicate HTTP attempts sent by request hedging.", operation, [(labels, s.hedges) for labels, s in series if s.hedges])
+            _counter(lines, f"{prefix}_request_bytes_total", "Request body bytes sent.", operation, [(labels, s.bytes_sent) for labels, s in series if s.calls])
+            _counter(lines, f"{prefix}_response_bytes_total", "Response body bytes received.", operation, [(labels, s.bytes_received) for labels, s in series if s.calls])
+            lines.append(f"# HELP {prefix}_in_flight_requests HTTP attempts in flight.")
+            lines.append(f"# TYPE {prefix}_in_flight_requests gauge")
+            lines.append(f"{prefix}_in_flight_requests {self._in_flight}")
+            _histograms(
+                lines, f"{prefix}_call_duration_seconds", "SDK call latency, retries included.", operation, [(labels, s.latency) for labels, s in series if s.latency.count]
+            )
+            _histograms(
+                lines,
+                f"{prefix}_request_duration_seconds",
+                "Latency of individual HTTP attempts.",
+                operation,
+                [(labels, s.attempt_latency) for labels, s in series if s.attempt_latency.count],
+            )
+            _histograms(
+                lines,
+                f"{prefix}_phase_duration_seconds",
+                "Time spent in SDK-side phases.",
+                (*operation, "phase"),
+                [((*labels, phase), histogram) for labels, s in series for phase, histogram in sorted(s.phases.items())],
+            )
+            gauges_by_name: dict[str, list[tuple[tuple[tuple[str, str], ...], float]]] = {}
+            for (name, labels), value in self._gauges.items():
+                gauges_by_name.setdefault(name, []).append((labels, value))
+            for name, samples in sorted(gauges_by_name.items()):
+                lines.append(f"# TYPE {prefix}_{name} gauge")
+                for labels, value in samples:
+                    pairs = ",".join(f'{key}="{_escape(label)}"' for key, label in labels)
+                    lines.append(f"{prefix}_{name}{{{pairs}}} {_format_value(value)}" if pairs else f"{prefix}_{name} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get_series(self, call: CallScope) -> _Series:
+        # Called with the lock held.
+        labels = (call.resource or "", call.operation)
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = _Series(self.buckets)
+        return series
+
+
+def _name(labels: Labels) -> str:
+    resource, operation = labels
+    return f"{resource}.{operation}" if resource else operation
+
+
+def _gauge_name(name: str, labels: tuple[tuple[str, str], ...]) -> str:
+    if not labels:
+        return name
+    return f"{name}{{{','.join(f'{key}={value}' for key, value in labels)}}}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _label_pairs(names: tuple[str, ...], values: Labels) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+
+
+def _counter(lines: list[str], name: str, help_text: str, label_names: tuple[str, ...], samples: list[tuple[Labels, int]]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for labels, value in samples:
+        lines.append(f"{name}{{{_label_pairs(label_names, labels)}}} {value}")
+
+
+def _histograms(lines: list[str], name: str, help_text: str, label_names: tuple[str, ...], samples: list[tuple[Labels, Histogram]]) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in samples:
+        pairs = _label_pairs(label_names, labels)
+        cumulative = 0
+        for bound, bucket_count in zip((*histogram.buckets, float("inf")), histogram.counts):
+            cumulative += bucket_count
+            lines.append(f'{name}_bucket{{{pairs},le="{_format_bound(bound)}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{pairs}}} {_format_value(histogram.sum)}")
+        lines.append(f"{name}_count{{{pairs}}} {histogram.count}")
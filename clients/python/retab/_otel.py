@@ -0,0 +1,139 @@
+"""OpenTelemetry tracing for Retab clients (``pip install retab[otel]``).
+
+Pass ``hooks=[OpenTelemetryHooks()]`` to a client to emit:
+
+* one ``INTERNAL`` span per SDK call, named ``"<Resource>.<method>"`` (e.g.
+  ``Extractions.create``), tagged with the resource, the last ``x-request-id``,
+  request/response payload bytes and the retry count;
+* one ``CLIENT`` child span per HTTP attempt, with connect / request-sent /
+  response-headers / response-body events from httpcore so TTFB and download
+  time can be told apart, and a ``traceparent`` header propagated to the API;
+* child spans for the SDK-side phases ``prepare_mime_document`` and
+  ``model_validate``.
+
+That is enough to attribute a slow call to document preparation, the
+network, the server or validation.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from ._hooks import CallScope, RequestEvent, RequestHooks, route_template
+
+_CALL_SPAN = "otel.span"
+_CALL_TOKEN = "otel.token"
+_ATTEMPT_SPAN = "otel.attempt_span"
+
+
+class OpenTelemetryHooks(RequestHooks):
+    """Lifecycle hooks that record OpenTelemetry spans.
+
+    Args:
+        tracer_provider: Provider to get the tracer from. Defaults to the global provider
+        propagate: Inject trace context headers (``traceparent``) into every request. Defaults to True
+
+    Raises:
+        ImportError: If ``opentelemetry-api`` is not installed
+    """
+
+    def __init__(self, tracer_provider: Any = None, propagate: bool = True) -> None:
+        try:
+            from opentelemetry import context, propagate as propagation, trace
+        except ImportError as exc:
+            raise ImportError("OpenTelemetryHooks requires the 'opentelemetry-api' package. Install it with `pip install retab[otel]`.") from exc
+        self._context = context
+        self._propagation = propagation if propagate else None
+        self._trace = trace
+        self._tracer = trace.get_tracer("retab", tracer_provider=tracer_provider)
+
+    def on_call_start(self, call: CallScope) -> None:
+        attributes: dict[str, Any] = {"retab.operation": call.operation}
+        if call.resource is not None:
+            attributes["retab.resource"] = call.resource
+        span = self._tracer.start_span(call.name, kind=self._trace.SpanKind.INTERNAL, attributes=attributes, start_time=call.started_ns)
+        call.context[_CALL_SPAN] = span
+        # Make the call span current so attempt and phase spans (and the caller's own spans) nest under it.
+        call.context[_CALL_TOKEN] = self._context.attach(self._trace.set_span_in_context(span))
+
+    def on_call_end(self, call: CallScope) -> None:
+        span = call.context.pop(_CALL_SPAN, None)
+        if span is None:
+            return
+        span.set_attribute("retab.retry_count", call.retries)
+        span.set_attribute("retab.request.bytes", call.request_bytes)
+        span.set_attribute("retab.response.bytes", call.response_bytes)
+        if call.request_id is not None:
+            span.set_attribute("retab.request_id", call.request_id)
+        if call.status_code is not None:
+            span.set_attribute("http.response.status_code", call.status_code)
+        if call.error is not None:
+            self._record_error(span, call.error)
+        span.end(end_time=call.ended_ns)
+        self._context.detach(call.context.pop(_CALL_TOKEN))
+
+    def on_request(self, event: RequestEvent) -> None:
+        request = event.request
+        attributes: dict[str, Any] = {"http.request.method": request.method, "url.full": str(request.url), "server.address": request.url.host}
+        if event.attempt > 1:
+            attributes["http.request.resend_count"] = event.attempt - 1
+        span = self._tracer.start_span(f"{request.method} {route_template(request.url.path)}", kind=self._trace.SpanKind.CLIENT, attributes=attributes, start_time=event.started_ns)
+        event.context[_ATTEMPT_SPAN] = span
+        if self._propagation is not None:
+            self._propagation.inject(request.headers, context=self._trace.set_span_in_context(span))
+        request.extensions["trace"] = self._async_trace(span) if event.is_async else self._sync_trace(span)
+
+    def on_response(self, event: RequestEvent) -> None:
+        span = event.context.pop(_ATTEMPT_SPAN, None)
+        if span is None or event.response is None:
+            return
+        response = event.response
+        span.set_attribute("http.response.status_code", response.status_code)
+        request_id = response.headers.get("x-request-id")
+        if request_id is not None:
+            span.set_attribute("retab.request_id", request_id)
+        if event.error is not None:
+            self._record_error(span, event.error)
+        span.end(end_time=event.ended_ns or None)
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self._end_failed_attempt(event)
+        call_span = event.call.context.get(_CALL_SPAN)
+        if call_span is not None:
+            call_span.add_event("retry", {"retab.attempt": event.attempt, "retab.retry_delay": event.delay or 0.0, "exception.type": type(event.error).__name__})
+
+    def on_error(self, event: RequestEvent) -> None:
+        self._end_failed_attempt(event)
+
+    def on_phase(self, call: CallScope, name: str, started_ns: int, ended_ns: int) -> None:
+        parent = call.context.get(_CALL_SPAN)
+        context = self._trace.set_span_in_context(parent) if parent is not None else None
+        span = self._tracer.start_span(name, context=context, start_time=started_ns)
+        span.end(end_time=ended_ns)
+
+    def _end_failed_attempt(self, event: RequestEvent) -> None:
+        # Attempts that got a response were already ended in on_response.
+        span = event.context.pop(_ATTEMPT_SPAN, None)
+        if span is None:
+            return
+        if event.error is not None:
+            self._record_error(span, event.error)
+        span.end(end_time=event.ended_ns or None)
+
+    def _record_error(self, span: Any, error: BaseException) -> None:
+        span.record_exception(error)
+        span.set_status(self._trace.Status(self._trace.StatusCode.ERROR, str(error)))
+
+    @staticmethod
+    def _sync_trace(span: Any) -> Any:
+        def trace(name: str, info: dict[str, Any]) -> None:
+            span.add_event(name)
+
+        return trace
+
+    @staticmethod
+    def _async_trace(span: Any) -> Any:
+        async def trace(name: str, info: dict[str, Any]) -> None:
+            span.add_event(name)
+
+        return trace
@@ -0,0 +1,89 @@
+"""Adaptive page sizes for list endpoints.
+
+The list methods default to ``limit=10`` (100 for workflow artifacts), so
+auto-paging a large collection is mostly round trips. A `PageSizePolicy`
+passed to the client makes ``request_page`` choose the ``limit`` of the
+pages it fetches while auto-paging: the size doubles while pages come back
+well within ``target_seconds`` and ``target_bytes``, up to the API's maximum,
+and shrinks in proportion as soon as a page goes over either target, so
+heavy items (``include_output=True`` extractions, documents with large
+consensus payloads) get smaller pages than light ones.
+
+Sizes are learned per route template and per set of boolean query flags
+(``GET /v1/extractions include_output``), so later listings of the same kind
+start from the size the earlier ones settled on. The first page of a listing
+keeps the ``limit`` the caller asked for; only the pages fetched after it
+follow the policy. The chosen sizes are reported as the ``page_size`` gauge
+of ``client.metrics``.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from typing import Any
+
+from ._hooks import route_template
+
+DEFAULT_MAX_PAGE_SIZE = 100
+DEFAULT_TARGET_PAGE_SECONDS = 1.0
+DEFAULT_TARGET_PAGE_BYTES = 1024 * 1024
+
+
+def page_size_key(method: str, url: str, params: dict[str, Any]) -> str:
+    """Return the key sizes are learned under, e.g. ``"GET /v1/extractions include_output"``."""
+    flags = sorted(name for name, value in params.items() if value is True)
+    return " ".join([method.upper(), route_template(url), *flags])
+
+
+class PageSizePolicy:
+    """How the ``limit`` of auto-paged list requests adapts to the pages the API returns.
+
+    Args:
+        max_page_size (int): Largest ``limit`` requested, i.e. the API's maximum page size. Defaults to 100
+        min_page_size (int): Smallest ``limit`` requested. Defaults to 1
+        target_seconds (float): Page latency (retries included) to stay under. Defaults to 1.0
+        target_bytes (int): Response body size of a page to stay under. Defaults to 1 MiB
+    """
+
+    def __init__(
+        self,
+        max_page_size: int = DEFAULT_MAX_PAGE_SIZE,
+        min_page_size: int = 1,
+        target_seconds: float = DEFAULT_TARGET_PAGE_SECONDS,
+        target_bytes: int = DEFAULT_TARGET_PAGE_BYTES,
+    ) -> None:
+        if min_page_size < 1 or max_page_size < min_page_size:
+            raise ValueError("max_page_size must be >= min_page_size >= 1")
+        if target_seconds <= 0 or target_bytes <= 0:
+            raise ValueError("target_seconds and target_bytes must be > 0")
+        self.max_page_size = max_page_size
+        self.min_page_size = min_page_size
+        self.target_seconds = target_seconds
+        self.target_bytes = target_bytes
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, limit: int, items: int, seconds: float, size: int) -> int:
+        """Record a page of ``items`` fetched with ``limit`` and return the ``limit`` of the next one."""
+        # How far the page could grow before reaching either target (below 1: by how much it overshot).
+        ratio = min(self.target_seconds / seconds if seconds > 0 else math.inf, self.target_bytes / size if size > 0 else math.inf)
+        with self._lock:
+            if ratio < 1.0:
+                chosen = int(limit * ratio)
+            else:
+                # Latency has a fixed part, so a full page only doubles even when it was far below the targets.
+                grown = limit * 2 if ratio >= 2.0 and items >= limit else limit
+                # A larger size learned by earlier listings is kept while this page suggests it still fits.
+                chosen = max(grown, min(self._sizes.get(key, 0), limit * ratio))
+            chosen = int(min(max(chosen, self.min_page_size), self.max_page_size))
+            self._sizes[key] = chosen
+        return chosen
+
+    def reset(self) -> None:
+        """Forget the learned sizes."""
+        with self._lock:
+            self._sizes.clear()
+
+    def __repr__(self) -> str:
+        return f"PageSizePolicy(max_page_size={self.max_page_size}, target_seconds={self.target_seconds}, target_bytes={self.target_bytes})"
@@ -0,0 +1,208 @@
+"""Client-side rate limiter shared by every resource of one client.
+
+`RateLimiter` combines a token bucket (requests per second, with a burst
+allowance) and an in-flight cap. It is adaptive: a 429 from the API
+multiplicatively lowers the refill rate and, when the response carried a
+``Retry-After``, pauses every caller until that instant. Successful
+responses then recover the rate additively back towards the configured
+ceiling (AIMD), which smooths throughput instead of oscillating between
+bursts of 429s and idle backoff.
+
+Both blocking (``acquire`` / ``release``) and asyncio (``aacquire`` /
+``arelease``) entry points are provided; the bucket state itself is
+guarded by a ``threading.Lock`` so it is safe from worker threads too.
+Acquiring takes an optional ``timeout`` (the call's remaining deadline) and
+holds nothing when it gives up or is cancelled, so an abandoned request never
+keeps an in-flight slot.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+
+class RateLimiter:
+    """Token-bucket + in-flight limiter with 429-driven adaptation.
+
+    Args:
+        requests_per_second (float, optional): Steady-state request rate. ``None`` disables the
+            token bucket (only ``max_in_flight`` and ``Retry-After`` pauses apply)
+        max_in_flight (int, optional): Maximum concurrent requests. ``None`` means unbounded
+        burst (int, optional): Bucket capacity. Defaults to ``max(1, requests_per_second)``
+        adaptive (bool): Lower the rate on 429 and recover it on success. Defaults to True
+        decrease_factor (float): Multiplier applied to the rate on each 429. Defaults to 0.5
+        min_requests_per_second (float): Floor for the adapted rate. Defaults to 0.1
+        recovery_per_success (float, optional): Rate increase per successful response.
+            Defaults to 2% of ``requests_per_second``
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float | None = None,
+        max_in_flight: int | None = None,
+        burst: int | None = None,
+        adaptive: bool = True,
+        decrease_factor: float = 0.5,
+        min_requests_per_second: float = 0.1,
+        recovery_per_success: float | None = None,
+    ) -> None:
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second must be > 0")
+        if max_in_flight is not None and max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if not 0.0 < decrease_factor < 1.0:
+            raise ValueError("decrease_factor must be between 0 and 1")
+        self.max_requests_per_second = requests_per_second
+        self.max_in_flight = max_in_flight
+        self.adaptive = adaptive
+        self.decrease_factor = decrease_factor
+        self.min_requests_per_second = min_requests_per_second
+        self.recovery_per_success = recovery_per_success if recovery_per_success is not None else (requests_per_second or 0.0) * 0.02
+
+        self._rate = requests_per_second
+        self._capacity = float(burst if burst is not None else max(1.0, requests_per_second or 1.0))
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._thread_slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight is not None else None
+        self._async_slots: asyncio.Semaphore | None = None
+
+    @property
+    def requests_per_second(self) -> float | None:
+        """The current (possibly adapted) refill rate."""
+        return self._rate
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    def _reserve(self, timeout: float | None = None) -> float | None:
+        """Take one token and return how long the caller must wait before sending.
+
+        Returns None, without taking the token, when that wait would exceed ``timeout``.
+        """
+        with self._lock:
+            now = time.monotonic()
+            wait = max(0.0, self._blocked_until - now)
+            if self._rate is None:
+                return wait if timeout is None or wait <= timeout else None
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Tokens may go negative: later callers queue up behind earlier
+            # reservations instead of racing for the next refill.
+            if self._tokens < 1.0:
+                wait = max(wait, (1.0 - self._tokens) / self._rate)
+            if timeout is not None and wait > timeout:
+                return None
+            self._tokens -= 1.0
+            return wait
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Block until a request may be sent.
+
+        Args:
+            timeout (float, optional): Longest wait in seconds, e.g. the call's remaining deadline
+
+        Returns:
+            bool: False, holding nothing, if the request could not be sent within ``timeout``
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self._thread_slots is not None and not self._thread_slots.acquire(timeout=None if timeout is None else max(0.0, timeout)):
+            return False
+        with self._lock:
+            self._in_flight += 1
+        try:
+            wait = self._reserve(None if deadline is None else deadline - time.monotonic())
+            if wait is None:
+                self.release()
+                return False
+            if wait > 0:
+                time.sleep(wait)
+        except BaseException:
+            self.release()
+            raise
+        return True
+
+    def release(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        if self._thread_slots is not None:
+            self._thread_slots.release()
+
+    async def aacquire(self, timeout: float | None = None) -> bool:
+        """Async counterpart of :meth:`acquire`; a task cancelled while waiting holds nothing either."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if self.max_in_flight is not None:
+            if self._async_slots is None:
+                self._async_slots = asyncio.Semaphore(self.max_in_flight)
+            if not await _acquire_slot(self._async_slots, timeout):
+                return False
+        with self._lock:
+            self._in_flight += 1
+        try:
+            wait = self._reserve(None if deadline is None else deadline - time.monotonic())
+            if wait is None:
+                self.arelease()
+                return False
+            if wait > 0:
+                await asyncio.sleep(wait)
+        except BaseException:
+            self.arelease()
+            raise
+        return True
+
+    def arelease(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        if self._async_slots is not None:
+            self._async_slots.release()
+
+    def record_rate_limited(self, retry_after: float | None = None) -> None:
+        """Feed back a 429: back off the rate and honour ``Retry-After`` for every caller."""
+        with self._lock:
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
+            if self.adaptive and self._rate is not None:
+                self._rate = max(self.min_requests_per_second, self._rate * self.decrease_factor)
+                self._tokens = min(self._tokens, 0.0)
+
+    def record_success(self) -> None:
+        """Feed back a non-429 response: recover the rate towards its ceiling."""
+        if not self.adaptive or self._rate is None or self.max_requests_per_second is None:
+            return
+        if self._rate >= self.max_requests_per_second:
+            return
+        with self._lock:
+            self._rate = min(self.max_requests_per_second, self._rate + self.recovery_per_success)
+
+    def __repr__(self) -> str:
+        return f"RateLimiter(requests_per_second={self._rate}, max_in_flight={self.max_in_flight}, in_flight={self._in_flight})"
+
+
+async def _acquire_slot(slots: asyncio.Semaphore, timeout: float | None) -> bool:
+    """Acquire ``slots`` within ``timeout`` seconds; on timeout or cancellation, no permit is kept."""
+    if timeout is None:
+        await slots.acquire()
+        return True
+    # Not asyncio.wait_for: before Python 3.12 it can time out after the semaphore was acquired, losing the permit.
+    acquiring = asyncio.ensure_future(slots.acquire())
+    try:
+        await asyncio.wait((acquiring,), timeout=max(0.0, timeout))
+    except BaseException:
+        _abandon(acquiring, slots)
+        raise
+    if acquiring.done():
+        return True
+    _abandon(acquiring, slots)
+    return False
+
+
+def _abandon(acquiring: asyncio.Future[Any], slots: asyncio.Semaphore) -> None:
+    acquiring.cancel()
+    # A permit granted before the cancellation took effect is handed back.
+    acquiring.add_done_callback(lambda task: None if task.cancelled() else slots.release())
@@ -16,13 +16,40 @@ The optional ``transform`` callback lets resources apply client-side
 post-processing to every page, not just the first one. Without it,
 auto-paging would silently return unprocessed data on subsequent pages
 because the closure would re-fetch the raw server response.
+
+Every public method a resource subclass defines (other than the pure
+``prepare_*`` builders) runs inside a `CallScope` when the client has
+lifecycle hooks, so tracing sees one call per SDK operation, and accepts
+``timeout=`` / ``deadline=`` to bound the whole operation, retries included,
+and ``validate_response=`` to override the client's ``validate_responses``
+for that call.
+
+With a `PageSizePolicy` on the client, the pages fetched while auto-paging
+request the ``limit`` the policy chose from the latency and body size of the
+page before them (see ``retab._page_size``).
+
+`iter_list_items` is the low-memory alternative to ``request_page``: it
+decodes each page incrementally and validates one item at a time, so peak
+memory tracks the largest item instead of the largest page.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
+import inspect
 import time
-from typing import TYPE_CHECKING, Any, Callable, Type, TypeVar
+import typing
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Type, TypeVar, cast
+
+from pydantic import BaseModel
+
+from ._deadline import aiter_in_scope, deadline_scope, iter_in_scope
+from ._file_links import resolving_documents
+from ._hooks import CallScope
+from ._json_stream import JSONListDecoder
+from ._page_size import PageSizePolicy, page_size_key
+from ._validation import unvalidated_call, validation_enabled
 
 from .types.pagination import (
     AsyncPaginatedList,
@@ -54,19 +81,70 @@ def _swap_after_cursor(params: dict[str, Any] | None, after: str) -> dict[str, A
     return next_params
 
 
-def _build_next_request(request: PreparedRequest, after: str) -> PreparedRequest:
+def _build_next_request(request: PreparedRequest, after: str, page_size: int | None = None) -> PreparedRequest:
+    params = _swap_after_cursor(request.params, after)
+    if page_size is not None:
+        params["limit"] = page_size
     return PreparedRequest(
         method=request.method,
         url=request.url,
         data=request.data,
-        params=_swap_after_cursor(request.params, after),
+        params=params,
         form_data=request.form_data,
         files=request.files,
         idempotency_key=None,  # next page is a fresh request
         raise_for_status=request.raise_for_status,
+        timeout=request.timeout,
+        deadline=request.deadline,
     )
 
 
+def _next_cursor(decoder: JSONListDecoder) -> str | None:
+    meta = decoder.envelope.get("list_metadata")
+    return meta.get("after") if isinstance(meta, dict) else None
+
+
+def _page_size_key(client: "Retab | AsyncRetab", request: PreparedRequest) -> str | None:
+    """Key of ``request`` in the client's `PageSizePolicy`, or None when its page size is not adapted."""
+    if not isinstance(getattr(client, "page_size_policy", None), PageSizePolicy) or request.method != "GET" or not isinstance((request.params or {}).get("limit"), int):
+        return None
+    return page_size_key(request.method, request.url, request.params or {})
+
+
+def _record_page(client: "Retab | AsyncRetab", key: str, request: PreparedRequest, response: Any, seconds: float, size: int) -> int:
+    """Feed a fetched page to the client's `PageSizePolicy` and return the ``limit`` of the next page."""
+    assert client.page_size_policy is not None and request.params is not None
+    items = response.get("data") if isinstance(response, dict) else None
+    page_size = client.page_size_policy.record(key, request.params["limit"], len(items) if isinstance(items, list) else 0, seconds, size)
+    if client.metrics is not None:
+        client.metrics.set_gauge("page_size", page_size, route=key)
+    return page_size
+
+
+def _fetch_page(client: "Retab", request: PreparedRequest) -> tuple[Any, int | None]:
+    """Run a list request; return its decoded response and the page size of the next page when it is adapted."""
+    key = _page_size_key(client, request)
+    if key is None:
+        return client._prepared_request(request), None
+    # Read as bytes: the policy needs the body size, which the decoded response no longer tells.
+    started = time.perf_counter()
+    body = client._prepared_request_bytes(request)
+    seconds = time.perf_counter() - started
+    response = client.codec.loads(body) if body else None
+    return response, _record_page(client, key, request, response, seconds, len(body))
+
+
+async def _afetch_page(client: "AsyncRetab", request: PreparedRequest) -> tuple[Any, int | None]:
+    key = _page_size_key(client, request)
+    if key is None:
+        return await client._prepared_request(request), None
+    started = time.perf_counter()
+    body = await client._prepared_request_bytes(request)
+    seconds = time.perf_counter() - started
+    response = client.codec.loads(body) if body else None
+    return response, _record_page(client, key, request, response, seconds, len(body))
+
+
 def _apply_transform(items: list[Any], transform: PageTransform | None) -> list[Any]:
     if transform is None:
         return items
@@ -80,16 +158,19 @@ def _new_sync_page(
     client: "Retab",
     request: PreparedRequest,
     transform: PageTransform | None = None,
+    validate: bool = True,
+    page_size: int | None = None,
 ) -> PaginatedList[T]:
     """Build a `PaginatedList[T]` from a wire response and wire the closure.
 
     The closure captures `client`, `request`, `model`, AND `transform`,
     then re-invokes this helper for each subsequent page with the
     ``after`` cursor swapped. So filter params, ordering, limits, AND
-    any client-side post-processing remain consistent across pages.
+    any client-side post-processing remain consistent across pages;
+    ``page_size`` replaces the limit when the client adapts it.
     """
     raw = response if isinstance(response, dict) else {}
-    items = _apply_transform(_validate_page_items(raw.get("data") or [], model), transform)
+    items = _apply_transform(_validate_page_items(raw.get("data") or [], model, validate), transform)
     meta_dict = raw.get("list_metadata") or {"before": None, "after": None}
     page: PaginatedList[T] = PaginatedList(
         data=items,
@@ -97,14 +178,16 @@ def _new_sync_page(
     )
 
     def _fetch_next(after: str) -> PaginatedList[T]:
-        next_request = _build_next_request(request, after)
-        next_response = client._prepared_request(next_request)
+        next_request = _build_next_request(request, after, page_size)
+        next_response, next_page_size = _fetch_page(client, next_request)
         return _new_sync_page(
             response=next_response,
             model=model,
             client=client,
             request=next_request,
             transform=transform,
+            validate=validate,
+            page_size=next_page_size,
         )
 
     page._fetch_next_page = _fetch_next
@@ -118,10 +201,12 @@ async def _new_async_page(
     client: "AsyncRetab",
     request: PreparedRequest,
     transform: PageTransform | None = None,
+    validate: bool = True,
+    page_size: int | None = None,
 ) -> AsyncPaginatedList[T]:
     """Build an `AsyncPaginatedList[T]` from a wire response and wire the closure."""
     raw = response if isinstance(response, dict) else {}
-    items = _apply_transform(_validate_page_items(raw.get("data") or [], model), transform)
+    items = _apply_transform(_validate_page_items(raw.get("data") or [], model, validate), transform)
     meta_dict = raw.get("list_metadata") or {"before": None, "after": None}
     page: AsyncPaginatedList[T] = AsyncPaginatedList(
         data=items,
@@ -129,23 +214,210 @@ async def _new_async_page(
     )
 
     async def _fetch_next(after: str) -> AsyncPaginatedList[T]:
-        next_request = _build_next_request(request, after)
-        next_response = await client._prepared_request(next_request)
+        next_request = _build_next_request(request, after, page_size)
+        next_response, next_page_size = await _afetch_page(client, next_request)
         return await _new_async_page(
             response=next_response,
             model=model,
             client=client,
             request=next_request,
             transform=transform,
+            validate=validate,
+            page_size=next_page_size,
         )
 
     page._fetch_next_page = _fetch_next
     return page
 
 
+@functools.cache
+def _return_model(fn: Callable[..., Any]) -> type[BaseModel] | None:
+    """The pydantic model a resource method returns, if it returns a single one."""
+    try:
+        hint = typing.get_type_hints(fn).get("return")
+    except Exception:
+        return None
+    # Pages are built from the raw envelope by request_page, which skips item validation itself.
+    if not isinstance(hint, type) or not issubclass(hint, BaseModel) or issubclass(hint, (PaginatedList, AsyncPaginatedList)):
+        return None
+    return hint
+
+
+def _list_request(resource: Any, list_method: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any]) -> tuple[PreparedRequest, type[BaseModel]]:
+    """Prepare the request a list method of ``resource`` would send, and return it with the model of its items."""
+    name = getattr(list_method, "__name__", "")
+    prepare = getattr(resource, f"prepare_{name}", None)
+    try:
+        hint = typing.get_type_hints(inspect.unwrap(list_method)).get("return")
+    except Exception:
+        hint = None
+    metadata = getattr(hint, "__pydantic_generic_metadata__", None) or {}
+    if getattr(list_method, "__self__", None) is not resource or prepare is None or metadata.get("origin") not in (PaginatedList, AsyncPaginatedList):
+        raise ValueError(f"{name or list_method!r} is not a list method of {type(resource).__name__}")
+    return prepare(*args, **kwargs), metadata["args"][0]
+
+
+def _validates(self: Any, kwargs: dict[str, Any]) -> bool:
+    validate = kwargs.pop("validate_response", None)
+    return getattr(self._client, "validate_responses", True) if validate is None else validate
+
+
+def _resolving_documents(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Run ``fn`` under `resolving_documents`."""
+    if inspect.iscoroutinefunction(fn):
+
+        async def resolving_async(*args: Any, **kwargs: Any) -> Any:
+            with resolving_documents():
+                return await fn(*args, **kwargs)
+
+        return resolving_async
+
+    def resolving(*args: Any, **kwargs: Any) -> Any:
+        with resolving_documents():
+            return fn(*args, **kwargs)
+
+    return resolving
+
+
+# Keyword arguments the wrappers below add to the resource methods: (name, annotation, description).
+_TIMEOUT_OPTION = ("timeout", "float | None", "Seconds the call may take, retries and backoff included")
+_DEADLINE_OPTION = ("deadline", "float | datetime | None", "Time the call must be done by, a ``time.time()`` timestamp or a datetime")
+_VALIDATE_OPTION = ("validate_response", "bool | None", "Validate the response into its model; overrides the client's ``validate_responses``")
+
+
+def _with_options(wrapper: Callable[..., Any], fn: Callable[..., Any], options: list[tuple[str, str, str]], heading: str) -> Callable[..., Any]:
+    """Show the keyword ``options`` a wrapper accepts on top of ``fn``'s in its signature and docstring."""
+    if not options:
+        return wrapper
+    signature = inspect.signature(fn)
+    parameters = list(signature.parameters.values())
+    # Keyword-only, before ``**extra_params`` (which every generated method ends with).
+    at = len(parameters) - 1 if parameters and parameters[-1].kind is inspect.Parameter.VAR_KEYWORD else len(parameters)
+    added = [inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=None, annotation=annotation) for name, annotation, _ in options]
+    wrapper.__signature__ = signature.replace(parameters=[*parameters[:at], *added, *parameters[at:]])  # type: ignore[attr-defined]
+    lines = "\n".join(f"    {name} ({annotation.removesuffix(' | None')}, optional): {description}" for name, annotation, description in options)
+    wrapper.__doc__ = f"{(fn.__doc__ or '').rstrip()}\n\n{heading}:\n{lines}\n"
+    return wrapper
+
+
+def _prepare_method(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a ``prepare_*`` method so that ``timeout=`` / ``deadline=`` set the budget of the request it returns.
+
+    Without the wrapper they would end up in the request's query string. Methods taking documents
+    run marked as resolving them, like the calls they prepare.
+    """
+    parameters = set(inspect.signature(fn).parameters)
+    budgeted = not {"timeout", "deadline"} & parameters
+    target = _resolving_documents(fn) if {"document", "documents"} & parameters else fn
+    if not budgeted and target is fn:
+        return fn
+
+    @functools.wraps(fn)
+    def prepare(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if not budgeted or ("timeout" not in kwargs and "deadline" not in kwargs):
+            return target(self, *args, **kwargs)
+        timeout, deadline = kwargs.pop("timeout", None), kwargs.pop("deadline", None)
+        request = target(self, *args, **kwargs)
+        if isinstance(request, PreparedRequest):
+            request.timeout, request.deadline = timeout, deadline
+        return request
+
+    return _with_options(prepare, fn, [_TIMEOUT_OPTION, _DEADLINE_OPTION] if budgeted else [], "Request options")
+
+
+def _traced_method(fn: Callable[..., Any], resource: str, operation: str) -> Callable[..., Any]:
+    """Wrap a resource method so that it runs as one call when the client has hooks.
+
+    The wrapper also accepts ``timeout=`` / ``deadline=`` keyword arguments and runs the
+    method under that deadline (unless the method defines parameters of the same name),
+    and ``validate_response=`` to skip (or force) validation of the method's response;
+    both show in the wrapper's signature and docstring.
+    Methods taking documents run marked as resolving them, so the download links of their
+    ``FileRef`` documents may be served from the client's ``file_link_cache``.
+    """
+    parameters = set(inspect.signature(fn).parameters)
+    budgeted = not {"timeout", "deadline"} & parameters
+    switchable = "validate_response" not in parameters
+    target = _resolving_documents(fn) if {"document", "documents"} & parameters else fn
+    options = [*([_TIMEOUT_OPTION, _DEADLINE_OPTION] if budgeted else []), *([_VALIDATE_OPTION] if switchable else [])]
+    if inspect.iscoroutinefunction(fn):
+
+        async def validated_async(self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            validate = _validates(self, kwargs) if switchable else True
+            if validate and validation_enabled():
+                return await run_async(self, args, kwargs)
+            with unvalidated_call(validate, None if validate else _return_model(fn)):
+                return await run_async(self, args, kwargs)
+
+        async def run_async(self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+            hooks = getattr(self._client, "hooks", None)
+            if not hooks:
+                return await target(self, *args, **kwargs)
+            with CallScope(hooks, resource, operation) as call:
+                result = await target(self, *args, **kwargs)
+                call.report_validation()
+                return result
+
+        @functools.wraps(fn)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if budgeted and ("timeout" in kwargs or "deadline" in kwargs):
+                with deadline_scope(kwargs.pop("timeout", None), kwargs.pop("deadline", None)):
+                    return await validated_async(self, args, kwargs)
+            return await validated_async(self, args, kwargs)
+
+        return _with_options(async_wrapper, fn, options, "Call options")
+
+    def run(self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        hooks = getattr(self._client, "hooks", None)
+        if not hooks:
+            return target(self, *args, **kwargs)
+        with CallScope(hooks, resource, operation) as call:
+            result = target(self, *args, **kwargs)
+            # The generated methods validate the decoded response right before returning.
+            call.report_validation()
+            return result
+
+    def validated(self: Any, args: tuple[Any, ...], kwargs: dict[str, Any]) -> Any:
+        validate = _validates(self, kwargs) if switchable else True
+        # Also entered to switch validation back on inside a call that skips it.
+        if validate and validation_enabled():
+            return run(self, args, kwargs)
+        with unvalidated_call(validate, None if validate else _return_model(fn)):
+            return run(self, args, kwargs)
+
+    @functools.wraps(fn)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if budgeted and ("timeout" in kwargs or "deadline" in kwargs):
+            with deadline_scope(kwargs.pop("timeout", None), kwargs.pop("deadline", None)):
+                return validated(self, args, kwargs)
+        return validated(self, args, kwargs)
+
+    return _with_options(wrapper, fn, options, "Call options")
+
+
+def _trace_public_methods(cls: type) -> None:
+    resource = cls.__name__.removeprefix("Async")
+    for name in dir(cls):
+        attr = getattr(cls, name)
+        # The prepare_* methods come from the mixin shared by the sync and async resources.
+        if name.startswith("prepare_") and inspect.isfunction(attr) and not hasattr(attr, "__wrapped__"):
+            setattr(cls, name, _prepare_method(attr))
+    for name, attr in list(vars(cls).items()):
+        if name.startswith("_") or name.startswith("prepare_") or not inspect.isfunction(attr):
+            continue
+        # Generators would leave the call open across yields; none of the resources define one.
+        if inspect.isgeneratorfunction(attr) or inspect.isasyncgenfunction(attr):
+            continue
+        setattr(cls, name, _traced_method(attr, resource, name))
+
+
 class SyncAPIResource:
     _client: "Retab"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _trace_public_methods(cls)
+
     def __init__(self, client: "Retab") -> None:
         self._client = client
 
@@ -172,20 +444,99 @@ class SyncAPIResource:
         items list and returns a new list; it's applied to EVERY page
         (initial + each closure call) so ``auto_paging_iter`` stays
         consistent.
+
+        When the client has a ``page_size_policy``, the pages fetched after
+        this one request the ``limit`` the policy adapts from each page's
+        latency and size, and the chosen sizes are reported as the
+        ``page_size`` gauge of ``client.metrics``.
         """
-        response = self._client._prepared_request(request)
+        response, page_size = _fetch_page(self._client, request)
         return _new_sync_page(
             response=response,
             model=model,
             client=self._client,
             request=request,
             transform=transform,
+            validate=validation_enabled(),
+            page_size=page_size,
         )
 
+    def iter_list_items(
+        self,
+        request: PreparedRequest,
+        *,
+        model: Type[T],
+        drop: Iterable[str] | None = None,
+    ) -> Iterator[T]:
+        """Iterate over every item of a list endpoint, decoding pages incrementally.
+
+        Unlike ``request_page``, a page is never materialised as a whole:
+        items are decoded and validated one at a time as the response body
+        arrives, then the next page is requested once the current one is
+        exhausted. ``drop`` removes heavy subtrees from each item before
+        validation, e.g. ``drop=["consensus.choices"]``. `iter_items` does the
+        same from a list method and its arguments.
+
+        Example:
+            >>> request = client.extractions.prepare_list(limit=100)
+            >>> for extraction in client.extractions.iter_list_items(request, model=Extraction, drop=["consensus.choices"]):
+            ...     print(extraction.id)
+        """
+        # The request's timeout= / deadline= bounds the whole iteration, every page included.
+        return iter_in_scope(self._iter_list_items(request, model, drop), request.timeout, request.deadline)
+
+    def _iter_list_items(self, request: PreparedRequest, model: Type[T], drop: Iterable[str] | None) -> Iterator[T]:
+        decoder = JSONListDecoder(codec=self._client.codec, drop=drop)
+        validate = self._client.validate_responses and validation_enabled()
+        while True:
+            for item in self._client._request_items(
+                request.method,
+                request.url,
+                decoder,
+                data=request.data,
+                params=request.params,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            ):
+                yield _validate_page_items([item], model, validate)[0]
+            after = _next_cursor(decoder)
+            if after is None:
+                return
+            request = _build_next_request(request, after)
+
+    def iter_items(
+        self,
+        list_method: Callable[..., PaginatedList[T]],
+        /,
+        *args: Any,
+        drop: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> Iterator[T]:
+        """Iterate over every item a list method of this resource pages through, decoding pages incrementally.
+
+        ``list_method`` is the bound method (``client.extractions.list``), called with the
+        remaining arguments; its items are then yielded as `iter_list_items` decodes them,
+        instead of one `PaginatedList` per page. ``drop`` removes heavy subtrees from each
+        item before validation.
+
+        Example:
+            >>> for extraction in client.extractions.iter_items(client.extractions.list, limit=100, drop=["consensus.choices"]):
+            ...     print(extraction.id)
+
+        Raises:
+            ValueError: If ``list_method`` is not a list method of this resource
+        """
+        request, model = _list_request(self, list_method, args, kwargs)
+        return self.iter_list_items(request, model=cast(Type[T], model), drop=drop)
+
 
 class AsyncAPIResource:
     _client: "AsyncRetab"
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _trace_public_methods(cls)
+
     def __init__(self, client: "AsyncRetab") -> None:
         self._client = client
 
@@ -203,13 +554,57 @@ class AsyncAPIResource:
 
         Returns an ``AsyncPaginatedList[T]`` whose closure awaits each
         subsequent page, so callers can use ``async for item in page:``.
-        Honours ``transform`` the same way as the sync version.
+        Honours ``transform`` and the client's ``page_size_policy`` the same
+        way as the sync version.
         """
-        response = await self._client._prepared_request(request)
+        response, page_size = await _afetch_page(self._client, request)
         return await _new_async_page(
             response=response,
             model=model,
             client=self._client,
             request=request,
             transform=transform,
+            validate=validation_enabled(),
+            page_size=page_size,
         )
+
+    def iter_list_items(
+        self,
+        request: PreparedRequest,
+        *,
+        model: Type[T],
+        drop: Iterable[str] | None = None,
+    ) -> AsyncIterator[T]:
+        """Async variant of ``SyncAPIResource.iter_list_items``."""
+        return aiter_in_scope(self._iter_list_items(request, model, drop), request.timeout, request.deadline)
+
+    async def _iter_list_items(self, request: PreparedRequest, model: Type[T], drop: Iterable[str] | None) -> AsyncIterator[T]:
+        decoder = JSONListDecoder(codec=self._client.codec, drop=drop)
+        validate = self._client.validate_responses and validation_enabled()
+        while True:
+            async for item in self._client._request_items(
+                request.method,
+                request.url,
+                decoder,
+                data=request.data,
+                params=request.params,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            ):
+                yield _validate_page_items([item], model, validate)[0]
+            after = _next_cursor(decoder)
+            if after is None:
+                return
+            request = _build_next_request(request, after)
+
+    def iter_items(
+        self,
+        list_method: Callable[..., Awaitable[AsyncPaginatedList[T]]],
+        /,
+        *args: Any,
+        drop: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[T]:
+        """Async variant of ``SyncAPIResource.iter_items``: ``async for run in client.workflows.runs.iter_items(client.workflows.runs.list)``."""
+        request, model = _list_request(self, list_method, args, kwargs)
+        return self.iter_list_items(request, model=cast(Type[T], model), drop=drop)
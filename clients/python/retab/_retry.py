@@ -0,0 +1,203 @@
+"""Retry policy used by `Retab` / `AsyncRetab` for every request.
+
+`RetryPolicy` decides whether a failed attempt is retried and how long to
+wait first. It honours the server's ``Retry-After`` / ``retry-after-ms``
+headers when present and otherwise falls back to capped exponential
+backoff with jitter, so that many workers hitting the same 429 do not all
+come back at the same instant.
+
+`retry_call` / `aretry_call` run a zero-argument callable under a policy.
+They replace the per-method ``backoff.on_exception`` decorators so every
+request path (JSON, bytes, streams) shares one retry loop. Under a call
+deadline (see ``retab._deadline``) they also give up early when the backoff
+plus another attempt like the failed one would overrun the remaining budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import email.utils
+import random
+import time
+from typing import Any, Awaitable, Callable, Mapping, TypeVar
+
+from ._deadline import remaining
+from .exceptions import InternalServerError, RateLimitError
+
+T = TypeVar("T")
+
+# Receives a ``backoff.types.Details``-shaped dict; see ``retab.client.raise_max_tries_exceeded``.
+GiveupHandler = Callable[[Any], None]
+# Called with (attempt number, exception, delay in seconds) before sleeping for a retry.
+RetryHandler = Callable[[int, Exception, float], None]
+
+
+def parse_retry_after(headers: Mapping[str, str] | None) -> float | None:
+    """Return the server-requested delay in seconds, or ``None`` when absent.
+
+    Understands ``retry-after-ms``, ``Retry-After`` as delta-seconds, and
+    ``Retry-After`` as an HTTP date.
+    """
+    if not headers:
+        return None
+    retry_after_ms = headers.get("retry-after-ms")
+    if retry_after_ms:
+        try:
+            return max(float(retry_after_ms) / 1000.0, 0.0)
+        except ValueError:
+            pass
+    retry_after = headers.get("retry-after")
+    if not retry_after:
+        return None
+    try:
+        return max(float(retry_after), 0.0)
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(retry_after)
+    except (TypeError, ValueError):
+        return None
+    return max(parsed.timestamp() - time.time(), 0.0)
+
+
+class RetryPolicy:
+    """Decides which failures are retried and how long to back off.
+
+    Args:
+        max_retries (int): Retries after the first attempt. Defaults to 3
+        initial_delay (float): Backoff before the first retry, in seconds. Defaults to 1.0
+        max_delay (float): Upper bound for the computed exponential backoff. Defaults to 60.0
+        multiplier (float): Growth factor between consecutive backoffs. Defaults to 2.0
+        jitter (float): Fraction of each delay that is randomised (0 disables jitter, 1 is
+            "full jitter"). Defaults to 1.0
+        respect_retry_after (bool): Wait for the server's ``Retry-After`` when it sends one.
+            Defaults to True
+        max_retry_after (float): Cap on an honoured ``Retry-After``; longer requests give up
+            instead of sleeping. Defaults to 300.0
+        retry_on (tuple[type[BaseException], ...]): Exception types that are retried.
+            Defaults to ``(InternalServerError, RateLimitError)``
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        initial_delay: float = 1.0,
+        max_delay: float = 60.0,
+        multiplier: float = 2.0,
+        jitter: float = 1.0,
+        respect_retry_after: bool = True,
+        max_retry_after: float = 300.0,
+        retry_on: tuple[type[BaseException], ...] = (InternalServerError, RateLimitError),
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must be >= 0")
+        if not 0.0 <= jitter <= 1.0:
+            raise ValueError("jitter must be between 0 and 1")
+        self.max_retries = max_retries
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.retry_on = retry_on
+
+    @property
+    def max_tries(self) -> int:
+        return self.max_retries + 1
+
+    def is_retryable(self, exc: BaseException) -> bool:
+        return isinstance(exc, self.retry_on)
+
+    def retry_after(self, exc: BaseException) -> float | None:
+        if not self.respect_retry_after:
+            return None
+        return parse_retry_after(getattr(exc, "headers", None))
+
+    def compute_delay(self, attempt: int, exc: BaseException | None = None) -> float | None:
+        """Return the sleep before retry number ``attempt`` (1-based), or ``None`` to give up."""
+        if attempt > self.max_retries:
+            return None
+        server_delay = self.retry_after(exc) if exc is not None else None
+        if server_delay is not None:
+            if server_delay > self.max_retry_after:
+                return None
+            # Spread callers that received the same Retry-After over a short window
+            # past it instead of having them all return on the same tick.
+            return server_delay + random.uniform(0.0, self.jitter * min(server_delay, self.initial_delay) * 0.5)
+        delay = min(self.max_delay, self.initial_delay * (self.multiplier ** (attempt - 1)))
+        return delay - random.uniform(0.0, self.jitter * delay)
+
+    def __repr__(self) -> str:
+        return (
+            f"RetryPolicy(max_retries={self.max_retries}, initial_delay={self.initial_delay}, max_delay={self.max_delay}, "
+            f"multiplier={self.multiplier}, jitter={self.jitter}, respect_retry_after={self.respect_retry_after})"
+        )
+
+
+def _fits_deadline(delay: float, attempt_started: float) -> bool:
+    # The failed attempt's duration is the best estimate of what the next one will take.
+    budget = remaining()
+    return budget is None or delay + (time.monotonic() - attempt_started) < budget
+
+
+def _giveup_details(fn: Callable[..., Any], tries: int, start: float, exc: BaseException) -> dict[str, Any]:
+    # Same shape as ``backoff.types.Details`` so existing on_giveup handlers keep working.
+    return {"target": fn, "args": (), "kwargs": {}, "tries": tries, "elapsed": time.monotonic() - start, "exception": exc}
+
+
+def retry_call(
+    fn: Callable[[], T],
+    policy: RetryPolicy,
+    *,
+    on_giveup: GiveupHandler,
+    on_retry: RetryHandler | None = None,
+) -> T:
+    """Call ``fn`` until it succeeds, a non-retryable error occurs, or the policy (or the call deadline) gives up.
+
+    ``on_retry`` is notified of every failed attempt that will be retried.
+    """
+    start = time.monotonic()
+    tries = 0
+    while True:
+        tries += 1
+        attempt_started = time.monotonic()
+        try:
+            return fn()
+        except Exception as exc:
+            if not policy.is_retryable(exc):
+                raise
+            delay = policy.compute_delay(tries, exc)
+            if delay is None or not _fits_deadline(delay, attempt_started):
+                on_giveup(_giveup_details(fn, tries, start, exc))
+                raise
+            if on_retry is not None:
+                on_retry(tries, exc, delay)
+        time.sleep(delay)
+
+
+async def aretry_call(
+    fn: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    *,
+    on_giveup: GiveupHandler,
+    on_retry: RetryHandler | None = None,
+) -> T:
+    """Async counterpart of :func:`retry_call`."""
+    start = time.monotonic()
+    tries = 0
+    while True:
+        tries += 1
+        attempt_started = time.monotonic()
+        try:
+            return await fn()
+        except Exception as exc:
+            if not policy.is_retryable(exc):
+                raise
+            delay = policy.compute_delay(tries, exc)
+            if delay is None or not _fits_deadline(delay, attempt_started):
+                on_giveup(_giveup_details(fn, tries, start, exc))
+                raise
+            if on_retry is not None:
+                on_retry(tries, exc, delay)
+        await asyncio.sleep(delay)
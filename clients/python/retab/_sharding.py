@@ -0,0 +1,249 @@
+"""Time-sharded listing for bulk exports.
+
+Cursor pagination is one chain of requests: pulling a month of extractions
+page by page is bounded by the round-trip time, not by how much the client
+and the API could serve in parallel. `Retab.list_sharded` /
+`AsyncRetab.list_sharded` split the ``from_date`` / ``to_date`` range of a
+list method (``extractions.list``, ``parses.list``, ``files.list``,
+``usage.list_primitives``...) into day windows and page through them
+concurrently.
+
+Windows adapt to the data: one whose first page shows more is coming is
+split in two (down to single days, up to ``max_shards`` windows) and its
+halves are listed instead, so dense periods are spread over more cursor
+chains while sparse ones cost a single request.
+
+The list filters take dates, and whether the API counts ``to_date`` in or
+out is not something callers should have to know: each window asks for one
+day more and keeps the items whose ``created_at`` (in UTC) falls in it, so
+every item is yielded once. Items without a ``created_at`` are yielded as
+received. Results come either as they arrive (``ordered=False``) or in the
+list's order across the whole range (``ordered=True``), which holds back the
+windows that finish ahead of their turn.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator
+
+if TYPE_CHECKING:
+    from .types.pagination import AsyncPaginatedList, PaginatedList, PaginationOrder
+
+_DAY = datetime.timedelta(days=1)
+
+
+class _Window:
+    """Days ``start`` to ``end`` (both included) of the range, and the items received for them."""
+
+    __slots__ = ("start", "end", "items", "finished")
+
+    def __init__(self, start: datetime.date, end: datetime.date) -> None:
+        self.start = start
+        self.end = end
+        self.items: list[Any] = []
+        self.finished = False
+
+    @property
+    def days(self) -> int:
+        return (self.end - self.start).days + 1
+
+    def filters(self) -> dict[str, str]:
+        # One day more than the window: the API may treat to_date as exclusive; the extra day is filtered out in accept().
+        return {"from_date": self.start.isoformat(), "to_date": (self.end + _DAY).isoformat()}
+
+    def accept(self, items: list[Any]) -> None:
+        for item in items:
+            created_at = getattr(item, "created_at", None)
+            if isinstance(created_at, datetime.datetime):
+                day = created_at.astimezone(datetime.timezone.utc).date() if created_at.tzinfo else created_at.date()
+                if not self.start <= day <= self.end:
+                    continue
+            self.items.append(item)
+
+
+class _ShardPlan:
+    """Which windows to list and in which order their items are handed out; no I/O."""
+
+    def __init__(self, start: datetime.date, end: datetime.date, shards: int, max_shards: int, order: PaginationOrder, ordered: bool) -> None:
+        if end < start:
+            raise ValueError("to_date must not be before from_date")
+        if shards < 1 or max_shards < shards:
+            raise ValueError("shards must be >= 1 and max_shards >= shards")
+        self.max_shards = max_shards
+        self.descending = order == "desc"
+        self.ordered = ordered
+        total = (end - start).days + 1
+        shards = min(shards, total)
+        bounds = [start + datetime.timedelta(days=total * index // shards) for index in range(shards + 1)]
+        # Kept in the order of the list, so ordered results go from the first window to the last.
+        self.windows = [_Window(bounds[index], bounds[index + 1] - _DAY) for index in range(shards)]
+        if self.descending:
+            self.windows.reverse()
+        # Windows listed so far, finished ones included.
+        self.shards = shards
+
+    def split(self, window: _Window) -> list[_Window] | None:
+        """Split a window whose first page was not its last in two, or return None when it must be paged through."""
+        if window.days < 2 or self.shards >= self.max_shards:
+            return None
+        self.shards += 1
+        middle = window.start + datetime.timedelta(days=window.days // 2)
+        halves = [_Window(window.start, middle - _DAY), _Window(middle, window.end)]
+        if self.descending:
+            halves.reverse()
+        index = self.windows.index(window)
+        self.windows[index : index + 1] = halves
+        return halves
+
+    def take(self) -> list[Any]:
+        """Return the items that can be handed out now, in order when ``ordered``."""
+        taken: list[Any] = []
+        for window in list(self.windows):
+            taken.extend(window.items)
+            window.items = []
+            if self.ordered and not window.finished:
+                break
+            if window.finished:
+                self.windows.remove(window)
+        return taken
+
+
+def _plan(from_date: str | datetime.date, to_date: str | datetime.date, shards: int, max_shards: int | None, order: PaginationOrder, ordered: bool) -> _ShardPlan:
+    return _ShardPlan(_as_date(from_date), _as_date(to_date), shards, max_shards if max_shards is not None else shards * 4, order, ordered)
+
+
+def _as_date(value: str | datetime.date) -> datetime.date:
+    if isinstance(value, datetime.datetime):
+        return value.date()
+    if isinstance(value, datetime.date):
+        return value
+    return datetime.date.fromisoformat(value[:10])
+
+
+def iter_sharded(
+    executor: ThreadPoolExecutor,
+    list_method: Callable[..., PaginatedList[Any]],
+    from_date: str | datetime.date,
+    to_date: str | datetime.date,
+    *,
+    shards: int,
+    max_shards: int | None,
+    max_workers: int,
+    order: PaginationOrder,
+    ordered: bool,
+    filters: dict[str, Any],
+) -> Iterator[Any]:
+    """Return the items of ``list_method`` over the range, paging at most ``max_workers`` windows at once on ``executor``."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be >= 1")
+    # Planned here rather than in the generator, so bad ranges are reported by the call itself.
+    plan = _plan(from_date, to_date, shards, max_shards, order, ordered)
+    return _iter_windows(plan, executor, max_workers, list_method, order, filters)
+
+
+def _iter_windows(
+    plan: _ShardPlan, executor: ThreadPoolExecutor, max_workers: int, list_method: Callable[..., PaginatedList[Any]], order: PaginationOrder, filters: dict[str, Any]
+) -> Iterator[Any]:
+    pending: dict[Future[PaginatedList[Any]], tuple[_Window, bool]] = {}
+    # Page requests waiting for one of this call's max_workers slots; the executor may be shared with larger calls.
+    queued: deque[tuple[Callable[[], PaginatedList[Any]], _Window, bool]] = deque()
+
+    def drain() -> None:
+        while queued and len(pending) < max_workers:
+            call, window, first = queued.popleft()
+            pending[executor.submit(call)] = (window, first)
+
+    def submit(call: Callable[[], PaginatedList[Any]], window: _Window, first: bool) -> None:
+        queued.append((call, window, first))
+        drain()
+
+    def start(window: _Window) -> None:
+        submit(lambda: list_method(order=order, **filters, **window.filters()), window, True)
+
+    for window in plan.windows:
+        start(window)
+    try:
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                window, first = pending.pop(future)
+                page = future.result()
+                more = page.has_more and page._fetch_next_page is not None
+                halves = plan.split(window) if first and more else None
+                if halves is not None:
+                    # The probe page is dropped: each half lists its own days from the start.
+                    for half in halves:
+                        start(half)
+                    continue
+                window.accept(page.data)
+                if more:
+                    submit(page._next_page, window, False)
+                else:
+                    window.finished = True
+            drain()
+            yield from plan.take()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def aiter_sharded(
+    list_method: Callable[..., Awaitable[AsyncPaginatedList[Any]]],
+    from_date: str | datetime.date,
+    to_date: str | datetime.date,
+    *,
+    shards: int,
+    max_shards: int | None,
+    concurrency: int,
+    order: PaginationOrder,
+    ordered: bool,
+    filters: dict[str, Any],
+) -> AsyncIterator[Any]:
+    """Return the items of ``list_method`` over the range, with at most ``concurrency`` page requests in flight."""
+    plan = _plan(from_date, to_date, shards, max_shards, order, ordered)
+    return _aiter_windows(plan, list_method, concurrency, order, filters)
+
+
+async def _aiter_windows(
+    plan: _ShardPlan, list_method: Callable[..., Awaitable[AsyncPaginatedList[Any]]], concurrency: int, order: PaginationOrder, filters: dict[str, Any]
+) -> AsyncIterator[Any]:
+    semaphore = asyncio.Semaphore(concurrency)
+    pending: dict[asyncio.Task[AsyncPaginatedList[Any]], tuple[_Window, bool]] = {}
+
+    async def fetch(call: Callable[[], Awaitable[Any]]) -> Any:
+        async with semaphore:
+            return await call()
+
+    def start(window: _Window) -> None:
+        pending[asyncio.ensure_future(fetch(lambda: list_method(order=order, **filters, **window.filters())))] = (window, True)
+
+    for window in plan.windows:
+        start(window)
+    try:
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                window, first = pending.pop(task)
+                page = task.result()
+                more = page.has_more and page._fetch_next_page is not None
+                halves = plan.split(window) if first and more else None
+                if halves is not None:
+                    for half in halves:
+                        start(half)
+                    continue
+                window.accept(page.data)
+                if more:
+                    pending[asyncio.ensure_future(fetch(page._next_page))] = (window, False)
+                else:
+                    window.finished = True
+            for item in plan.take():
+                yield item
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,51 @@
+"""Process-wide TLS context for the SDK's HTTP clients.
+
+Clients used to call ``truststore.inject_into_ssl()`` in their constructor,
+which monkeypatches the ``ssl`` module for the whole process, and each new
+``httpx.Client`` then built its own ``SSLContext`` and loaded the trust
+store again. Services that create a client per request or per tenant paid
+that on every construction.
+
+`ssl_context` builds one truststore-backed context (verification against
+the operating system's trust store) the first time it is needed and hands
+the same object to every client after that. Contexts are never shared with
+a forked child: OpenSSL state does not survive ``fork()`` reliably, so the
+cache is cleared in the child.
+"""
+
+from __future__ import annotations
+
+import os
+import ssl
+import threading
+
+import truststore
+
+_lock = threading.Lock()
+# Keyed by ``http2``: httpcore sets the ALPN protocols on the context for every new
+# connection, so HTTP/1.1-only and HTTP/2 clients must not share one context.
+_contexts: dict[bool, ssl.SSLContext] = {}
+
+
+def ssl_context(http2: bool = False) -> ssl.SSLContext:
+    """Return the shared truststore ``SSLContext`` for HTTP/1.1 or HTTP/2 clients."""
+    context = _contexts.get(http2)
+    if context is not None:
+        return context
+    with _lock:
+        context = _contexts.get(http2)
+        if context is None:
+            context = truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            _contexts[http2] = context
+        return context
+
+
+def _reset_after_fork() -> None:
+    global _lock
+    # The parent may have held the lock while forking; the child starts with fresh state.
+    _lock = threading.Lock()
+    _contexts.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
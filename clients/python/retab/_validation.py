@@ -0,0 +1,195 @@
+"""Unvalidated responses for throughput-bound callers.
+
+Every resource method ends with ``Model.model_validate(response)``. For an
+`Extraction` with a large ``output`` and ``consensus.choices`` / ``likelihoods``,
+or a `Split` / `Partition` result, validating trees the caller never reads
+dominates client CPU. With ``Retab(validate_responses=False)``, or
+``validate_response=False`` on a single call, responses are instead built with
+`construct`: the same model classes, nested models included, assembled from
+the decoded JSON without validating it.
+
+What is skipped is the checking, not the typing: nested models, enums and
+datetimes are still converted, while ``dict[str, Any]`` / ``list[Any]``
+payloads are handed over as decoded, without being copied. A malformed
+response is not reported and may surface later as an unexpected value.
+
+The mode is a context variable set by the resource method wrapper (see
+``retab._resource``), so the client's ``_prepared_request`` can build the
+call's return model before the generated code calls ``model_validate``, which
+returns an instance of the model unchanged.
+"""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import functools
+import types
+from contextvars import ContextVar
+from typing import Any, Callable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+# False: validate (the default). True: don't validate. A model class: don't validate, and the
+# running call returns that model, built from the response of its request.
+_unvalidated_call: ContextVar[type[BaseModel] | bool] = ContextVar("retab_unvalidated_call", default=False)
+
+Converter = Callable[[Any], Any]
+
+_MISSING = object()
+# Defaults that can be shared between instances instead of copied.
+_IMMUTABLE = (type(None), bool, int, float, str, bytes, tuple, frozenset, enum.Enum)
+
+_plans: dict[type[BaseModel], "_Plan"] = {}
+_converters: dict[Any, Converter | None] = {}
+
+
+def validation_enabled() -> bool:
+    """Whether responses of the running call are validated."""
+    return _unvalidated_call.get() is False
+
+
+class unvalidated_call:
+    """Set whether the responses of the resource call run inside the block are validated.
+
+    ``model`` is the call's return model when it is built from a single response.
+    """
+
+    __slots__ = ("_value", "_token")
+
+    def __init__(self, validate: bool, model: type[BaseModel] | None) -> None:
+        self._value: type[BaseModel] | bool = (model or True) if not validate else False
+        self._token: Any = None
+
+    def __enter__(self) -> None:
+        self._token = _unvalidated_call.set(self._value)
+
+    def __exit__(self, *exc_info: Any) -> None:
+        _unvalidated_call.reset(self._token)
+
+
+def construct_response(response: Any) -> Any:
+    """Build the running call's return model from ``response`` when the call skips validation."""
+    target = _unvalidated_call.get()
+    if isinstance(target, bool) or not isinstance(response, dict):
+        return response
+    return construct(target, response)
+
+
+def construct(model: type[BaseModel], data: Any) -> Any:
+    """Build ``model`` (and the models nested in it) from decoded JSON without validating it."""
+    if not isinstance(data, dict):
+        return data
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+    values: dict[str, Any] = {}
+    for name, key, alias, convert in plan.fields:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
+            if alias is None:
+                continue
+            value = data.get(alias, _MISSING)
+            if value is _MISSING:
+                continue
+        values[name] = convert(value) if convert is not None and value is not None else value
+    if plan.private:
+        return model.model_construct(_fields_set=set(values), **values)
+    fields_set = set(values)
+    if len(fields_set) < plan.size:
+        for name, default, factory in plan.defaults:
+            if name not in values:
+                values[name] = default if factory is None else factory()
+    # What model_construct does, minus its per-call field introspection: this runs once per nested object.
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", fields_set)
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+class _Plan:
+    """How to build one model: where each field is in the payload, how to convert it, and its default."""
+
+    __slots__ = ("fields", "defaults", "size", "private")
+
+    def __init__(self, model: type[BaseModel]) -> None:
+        # (field name, payload key, other accepted key or None, converter or None)
+        self.fields: list[tuple[str, str, str | None, Converter | None]] = []
+        # (field name, constant default, or a factory returning a fresh one)
+        self.defaults: list[tuple[str, Any, Callable[[], Any] | None]] = []
+        for name, field in model.model_fields.items():
+            # populate_by_name: the payload uses the alias, the field name is accepted too.
+            alias = field.alias if field.alias and field.alias != name else None
+            self.fields.append((name, alias or name, name if alias else None, _converter(field.annotation)))
+            if field.is_required():
+                continue
+            if field.default_factory is None and isinstance(field.default, _IMMUTABLE):
+                self.defaults.append((name, field.default, None))
+            elif field.default_factory is None and type(field.default) in (list, dict, set) and not field.default:
+                self.defaults.append((name, None, type(field.default)))
+            else:
+                self.defaults.append((name, None, functools.partial(field.get_default, call_default_factory=True)))
+        self.size = len(self.fields)
+        self.private = bool(model.__private_attributes__)
+
+
+def _converter(annotation: Any) -> Converter | None:
+    """Return how to turn a decoded JSON value into ``annotation`` (None: use it as is)."""
+    try:
+        return _converters[annotation]
+    except KeyError:
+        pass
+    except TypeError:  # unhashable annotation
+        return None
+    converter = _build_converter(annotation)
+    _converters[annotation] = converter
+    return converter
+
+
+def _build_converter(annotation: Any) -> Converter | None:
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        members = [member for member in get_args(annotation) if member is not type(None)]
+        if len(members) == 1:
+            return _converter(members[0])
+        models = [member for member in members if isinstance(member, type) and issubclass(member, BaseModel)]
+        return (lambda value: _construct_union(models, value)) if models else None
+    if origin in (list, set, frozenset, tuple):
+        args = get_args(annotation)
+        item = _converter(args[0]) if args else None
+        return (lambda value: [item(v) if v is not None else v for v in value] if isinstance(value, list) else value) if item is not None else None
+    if origin is dict:
+        args = get_args(annotation)
+        item = _converter(args[1]) if len(args) == 2 else None
+        return (lambda value: {k: item(v) if v is not None else v for k, v in value.items()} if isinstance(value, dict) else value) if item is not None else None
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, BaseModel):
+        return lambda value: construct(annotation, value)
+    if issubclass(annotation, enum.Enum):
+        return lambda value: _parse(annotation, value)
+    if annotation is datetime.datetime:
+        return lambda value: _parse(datetime.datetime.fromisoformat, value)
+    if annotation is datetime.date:
+        return lambda value: _parse(datetime.date.fromisoformat, value)
+    return None
+
+
+def _parse(parser: Callable[[Any], Any], value: Any) -> Any:
+    try:
+        return parser(value)
+    except (TypeError, ValueError):
+        return value
+
+
+def _construct_union(models: list[type[BaseModel]], value: Any) -> Any:
+    # Pick the first member whose required fields are all present; this is a best effort
+    # since nothing is validated.
+    if not isinstance(value, dict):
+        return value
+    for model in models:
+        if all(name in value or (field.alias and field.alias in value) for name, field in model.model_fields.items() if field.is_required()):
+            return construct(model, value)
+    return value
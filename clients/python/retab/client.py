@@ -1,13 +1,19 @@
-import json
+import asyncio
+import contextlib
+import contextvars
+import datetime
+import functools
+import importlib
 import logging
 import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from types import TracebackType
-from typing import Any, AsyncIterator, Iterator, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
 
-import backoff
 import backoff.types
 import httpx
-import truststore
 
 from .exceptions import (
     APIConnectionError,
@@ -15,17 +21,60 @@ from .exceptions import (
     APITimeoutError,
     AuthenticationError,
     ConflictError,
+    DeadlineExceededError,
     InternalServerError,
     NotFoundError,
     PermissionDeniedError,
     RateLimitError,
+    StreamDecodeError,
+    StreamInterruptedError,
     ValidationError,
 )
-from .resources import files, schemas, extractions, classifications, consensus, parses, splits, partitions, edits, workflows, tables, secrets, usage
+from ._batch import BatchItem, BatchResult, BatchResults, ProgressCallback, SyncBatchItem, run_sync_item, abatch, abatch_as_completed, threaded_map
+from ._cache import CachedResponse, ResponseCache, cache_key, resource_scope
+from ._circuit import CircuitBreaker
+from ._coalesce import AsyncSingleFlight, SingleFlight
+from ._codec import JSONCodec, get_default_codec
+from ._compression import DEFAULT_COMPRESSION_THRESHOLD, get_compressor
+from ._deadline import aiter_in_scope, clamp_timeout, deadline_scope, iter_in_scope, remaining
+from ._file_links import FileLinkCache, download_link_file_id, file_path_id
+from ._page_size import PageSizePolicy
+from ._download import DEFAULT_DOWNLOAD_CHUNK_SIZE, Destination, DownloadResult, DownloadSink, RangeResume
+from ._hedge import HedgePolicy
+from ._hooks import CallbackHooks, CallScope, Hook, RequestEvent, RequestHooks, current_call, dispatch, route_template
+from ._idempotency import IdempotencyStore, new_idempotency_key
+from ._json_stream import JSONListDecoder
+from ._metrics import MetricsRegistry
+from ._rate_limit import RateLimiter
+from ._retry import RetryPolicy, aretry_call, parse_retry_after, retry_call
+from ._sharding import aiter_sharded, iter_sharded
+from ._tls import ssl_context
+from ._validation import construct_response
 from .types.standards import PreparedRequest
 
+if TYPE_CHECKING:
+    from .resources.classifications import AsyncClassifications, Classifications
+    from .resources.consensus import AsyncConsensus, Consensus
+    from .resources.edits import AsyncEdits, Edits
+    from .resources.extractions import AsyncExtractions, Extractions
+    from .resources.files import AsyncFiles, Files
+    from .resources.parses import AsyncParses, Parses
+    from .resources.partitions import AsyncPartitions, Partitions
+    from .resources.schemas import AsyncSchemas, Schemas
+    from .resources.secrets import AsyncSecrets, Secrets
+    from .resources.splits import AsyncSplits, Splits
+    from .resources.tables import AsyncTables, Tables
+    from .resources.usage import AsyncUsage, Usage
+    from .resources.workflows import AsyncWorkflows, Workflows
+    from .types.pagination import AsyncPaginatedList, PaginatedList, PaginationOrder
+
 logger = logging.getLogger("retab")
 
+T = TypeVar("T")
+
+# Returned by ``_decode_stream_line`` for lines that produce no item.
+_SKIP_LINE = object()
+
 
 class MaxRetriesExceeded(Exception):
     pass
@@ -53,6 +102,74 @@ _STATUS_CODE_TO_EXCEPTION: dict[int, type[APIError]] = {
 }
 
 
+# Sized for fan-out workloads (hundreds of concurrent extractions through one
+# client). httpx's own default (100 connections / 20 keep-alive / 5s expiry)
+# makes requests queue on the pool and re-handshake TLS between bursts.
+DEFAULT_CONNECTION_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=30.0)
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Delegates to a caller-owned transport without closing it on ``Retab.close()``.
+
+    Lets several clients share one connection pool: the caller created the
+    transport, so the caller decides when it is torn down.
+    """
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncSharedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`_SharedTransport`."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self._transport = transport
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._transport.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+def _discard_response(future: "Future[httpx.Response]") -> None:
+    # Loser of a hedged race: its body was already read, just release the connection.
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
+
+
+class _LazyResource:
+    """Client attribute that imports its resource module and builds the resource on first access.
+
+    Resource modules pull in hundreds of pydantic models (and PIL for document inputs), so
+    building all of them in ``__init__`` dominated cold start. The built resource is stored in
+    the instance ``__dict__``, which shadows this non-data descriptor on later lookups.
+    """
+
+    __slots__ = ("module", "attr", "name")
+
+    def __init__(self, module: str, attr: str) -> None:
+        self.module = module
+        self.attr = attr
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Any:
+        if instance is None:
+            return self
+        resource = getattr(importlib.import_module(self.module, __package__), self.attr)(client=instance)
+        # setdefault: two threads racing on first access end up sharing one resource.
+        return instance.__dict__.setdefault(self.name, resource)
+
+
 class BaseRetab:
     """Base class for Retab clients that handles authentication and configuration.
 
@@ -62,20 +179,93 @@ class BaseRetab:
     Args:
         api_key (str, optional): Retab API key. If not provided, will look for RETAB_API_KEY env variable.
         base_url (str, optional): Base URL for API requests. Defaults to https://api.retab.com
-        timeout (float): Request timeout in seconds. Defaults to 1800.0 (30 minutes)
+        timeout (float | httpx.Timeout): Timeout of each HTTP attempt in seconds, or an ``httpx.Timeout`` for split
+            connect/read/write/pool timeouts. Defaults to 1800.0 (30 minutes). To bound a whole call, retries
+            included, pass ``timeout=`` / ``deadline=`` to the resource method (or set them on a ``PreparedRequest``)
         max_retries (int): Maximum number of retries for failed requests. Defaults to 3
-        openai_api_key (str, optional): OpenAI API key. Will look for OPENAI_API_KEY env variable if not provided
+        retry_policy (RetryPolicy, optional): Retry/backoff policy. Defaults to ``RetryPolicy(max_retries=max_retries)``,
+            which honours ``Retry-After`` and applies jittered exponential backoff
+        rate_limiter (RateLimiter, optional): Client-side token bucket / in-flight cap shared by every
+            resource of this client; adapts its rate when the API answers 429
+        codec (JSONCodec, optional): JSON encoder/decoder for request bodies and responses. Defaults to
+            the fastest installed backend (orjson, then msgspec, then the standard library)
+        compression (str, optional): Compress JSON request bodies with ``"gzip"`` or ``"zstd"`` (requires
+            ``zstandard`` before Python 3.14) and send them with a ``Content-Encoding`` header. Off by default
+        compression_threshold (int): Only bodies of at least this many bytes are compressed. Defaults to 64 KiB
+        hooks (Iterable[RequestHooks], optional): Lifecycle observers, e.g. ``OpenTelemetryHooks()``. Each
+            resource method is one call; its HTTP attempts, retries and SDK-side phases are reported to every hook
+        on_request (Callable[[RequestEvent], None], optional): Called before each HTTP attempt
+        on_response (Callable[[RequestEvent], None], optional): Called when an attempt receives a response
+        on_retry (Callable[[RequestEvent], None], optional): Called when a failed attempt is about to be retried
+        on_error (Callable[[RequestEvent], None], optional): Called when a call fails for good
+        metrics (bool): Collect in-process counters and latency histograms, exposed as ``client.metrics``
+            (``snapshot()`` / ``to_prometheus()``). Off by default, so no per-attempt bookkeeping runs unless asked for
+        hedge_policy (HedgePolicy, optional): Send a duplicate of a GET that is slower than the route's usual
+            latency and keep whichever copy answers first. Off by default
+        circuit_breaker (CircuitBreaker, optional): Fail fast with ``CircuitOpenError`` on routes that keep
+            failing server-side, instead of retrying every caller. Off by default
+        auto_idempotency_keys (bool): Send a generated ``Idempotency-Key`` with every POST that has none, reused by
+            all retries of the call so the server never runs the same job twice. Defaults to True
+        idempotency_store (IdempotencyStore, optional): Derive those keys per request and keep them (optionally on
+            disk) until the server answers for good, so a request re-run after a failure or a restart reuses its key
+        validate_responses (bool): Validate responses into their models. With False, responses are built into the same
+            model classes without validation, which is much cheaper for large results; override per call with
+            ``validate_response=``. Defaults to True
+        response_cache (ResponseCache, optional): Serve repeated JSON GETs from a cache honouring ``Cache-Control`` and
+            revalidating with ``ETag``; mutations sent through the client drop the entries of their resource. Off by default
+        coalesce_requests (bool): Send one request for identical GETs made concurrently (same URL and query, no call
+            deadline) and give every caller its response; a GET issued after a mutation of its resource started never
+            joins a read sent before. Defaults to True
+        file_link_cache (FileLinkCache | bool): Reuse the download links fetched to resolve ``FileRef`` documents while
+            they stay valid for ``min_validity`` seconds, so primitives run over one stored file fetch one link. Direct
+            ``files.get_download_link`` calls still fetch a fresh link unless the cache has ``direct_calls=True``. True
+            (the default) gives the client a cache of its own; False fetches a link for every call
+        page_size_policy (PageSizePolicy, optional): Adapt the ``limit`` of the pages fetched while auto-paging a list to
+            their latency and size, up to the API's maximum; with ``metrics=True`` the chosen sizes are the ``page_size`` gauge of
+            ``client.metrics``. Off by default
+        limits (httpx.Limits, optional): Connection pool limits (max connections, max keep-alive
+            connections, keep-alive expiry). Defaults to ``DEFAULT_CONNECTION_LIMITS``
+        http2 (bool): Enable HTTP/2 multiplexing. Requires the ``h2`` package (``pip install retab[http2]``)
+        transport (httpx.BaseTransport | httpx.AsyncBaseTransport, optional): Caller-owned transport, e.g. to
+            share one connection pool between several clients. It is not closed when the client is closed,
+            and ``limits`` / ``http2`` are ignored when it is given
 
     Raises:
         ValueError: If no API key is provided through arguments or environment variables
     """
 
+    # Set by the sync and async clients when ``coalesce_requests`` is on.
+    _in_flight: SingleFlight[httpx.Response] | AsyncSingleFlight[httpx.Response] | None = None
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        timeout: float = 1800.0,
+        timeout: float | httpx.Timeout = 1800.0,
         max_retries: int = 3,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[RequestHooks] | None = None,
+        on_request: Hook | None = None,
+        on_response: Hook | None = None,
+        on_retry: Hook | None = None,
+        on_error: Hook | None = None,
+        metrics: bool = False,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        auto_idempotency_keys: bool = True,
+        idempotency_store: IdempotencyStore | None = None,
+        validate_responses: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        file_link_cache: FileLinkCache | bool = True,
+        page_size_policy: PageSizePolicy | None = None,
     ) -> None:
         if api_key is None:
             api_key = os.environ.get("RETAB_API_KEY")
@@ -92,7 +282,6 @@ class BaseRetab:
             base_url = os.environ.get("RETAB_API_BASE_URL", "https://api.retab.com")
         assert base_url is not None
 
-        truststore.inject_into_ssl()
         self.api_key = api_key
         normalized = base_url.rstrip("/")
         # Back-compat: older SDKs baked /v<N> into the base URL and stripped
@@ -115,18 +304,49 @@ class BaseRetab:
             normalized = trimmed
         self.base_url = normalized
         self.timeout = timeout
-        self.max_retries = max_retries
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy(max_retries=max_retries)
+        self.max_retries = self.retry_policy.max_retries
+        self.rate_limiter = rate_limiter
+        self.codec = codec if codec is not None else get_default_codec()
+        self.compression = compression
+        self.compression_threshold = compression_threshold
+        self._compress = get_compressor(compression) if compression is not None else None
+        self.metrics = MetricsRegistry() if metrics else None
+        self.hooks: list[RequestHooks] = ([self.metrics] if self.metrics is not None else []) + list(hooks or ())
+        if any(callback is not None for callback in (on_request, on_response, on_retry, on_error)):
+            self.hooks.append(CallbackHooks(on_request=on_request, on_response=on_response, on_retry=on_retry, on_error=on_error))
+        self.hedge_policy = hedge_policy
+        self.circuit_breaker = circuit_breaker
+        self.auto_idempotency_keys = auto_idempotency_keys
+        self.idempotency_store = idempotency_store
+        self.validate_responses = validate_responses
+        self.response_cache = response_cache
+        self.coalesce_requests = coalesce_requests
+        self.file_link_cache = file_link_cache if isinstance(file_link_cache, FileLinkCache) else FileLinkCache() if file_link_cache else None
+        self.page_size_policy = page_size_policy
+        self.limits = limits if limits is not None else DEFAULT_CONNECTION_LIMITS
+        self.http2 = http2
+        self.transport = transport
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
 
+    def _http_client_kwargs(self) -> dict[str, Any]:
+        """Keyword arguments shared by the ``httpx.Client`` / ``httpx.AsyncClient`` constructors."""
+        timeout = self.timeout if isinstance(self.timeout, httpx.Timeout) else httpx.Timeout(self.timeout)
+        # One truststore-backed SSL context per process instead of a fresh one (and a trust store load) per client.
+        return {"timeout": timeout, "limits": self.limits, "http2": self.http2, "verify": ssl_context(self.http2)}
+
     def _prepare_url(self, endpoint: str) -> str:
         return f"{self.base_url}/{endpoint.lstrip('/')}"
 
     def _validate_response(self, response_object: httpx.Response) -> None:
         if response_object.is_success:
             return
+        if response_object.status_code == 304 and "if-none-match" in response_object.request.headers:
+            # A cached GET revalidated by the response cache: its entry is still current.
+            return
 
         status_code = response_object.status_code
         body = response_object.text
@@ -166,6 +386,7 @@ class BaseRetab:
             request_id=request_id,
             method=method,
             url=url,
+            headers=response_object.headers,
         )
 
     def _get_headers(self, idempotency_key: str | None = None) -> dict[str, Any]:
@@ -174,6 +395,245 @@ class BaseRetab:
             headers["Idempotency-Key"] = idempotency_key
         return headers
 
+    def _build_request_kwargs(
+        self,
+        method: str,
+        endpoint: str,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        form_data: Optional[dict[str, Any]] = None,
+        files: Optional[dict[str, Any] | list] = None,
+        idempotency_key: str | None = None,
+        accept: str | None = None,
+    ) -> dict[str, Any]:
+        """Translate SDK request arguments into ``httpx.Client.build_request`` kwargs."""
+        headers = self._get_headers(idempotency_key)
+        if accept is not None:
+            headers["Accept"] = accept
+        request_kwargs: dict[str, Any] = {
+            "method": method,
+            "url": self._prepare_url(endpoint),
+            "params": params,
+            "headers": headers,
+        }
+
+        # Handle different content types
+        if files or form_data:
+            # For multipart/form-data requests
+            if form_data:
+                request_kwargs["data"] = form_data
+            if files:
+                request_kwargs["files"] = files
+            # Remove Content-Type header to let httpx set it automatically for multipart
+            headers.pop("Content-Type", None)
+        elif data is not None:
+            # For JSON requests (empty {} / [] are valid bodies). Encoded once here,
+            # so retries re-send the same bytes instead of re-serialising.
+            body = self.codec.dumps(data)
+            if self._compress is not None and len(body) >= self.compression_threshold:
+                compressed = self._compress(body)
+                if len(compressed) < len(body):
+                    body = compressed
+                    headers["Content-Encoding"] = self.compression
+            request_kwargs["content"] = body
+        if idempotency_key is None and self.auto_idempotency_keys and method == "POST":
+            # Built once per call, so every retry of the call carries the same key.
+            headers["Idempotency-Key"] = self.idempotency_store.key_for(request_kwargs) if self.idempotency_store is not None else new_idempotency_key()
+        return request_kwargs
+
+    def _call_started(self, request_kwargs: dict[str, Any]) -> None:
+        """Keep the GETs issued once a mutation starts from joining reads of its resource already in flight."""
+        if self._in_flight is not None and request_kwargs["method"] not in ("GET", "HEAD"):
+            self._in_flight.invalidate(resource_scope(request_kwargs["url"][len(self.base_url) :]))
+
+    def _call_finished(self, request_kwargs: dict[str, Any], error: BaseException | None) -> None:
+        """Settle the call's idempotency key and drop the cached responses, in-flight reads and download links a mutation may have made stale."""
+        if self.idempotency_store is not None:
+            self.idempotency_store.settle(request_kwargs["headers"].get("Idempotency-Key"), error)
+        if request_kwargs["method"] not in ("GET", "HEAD"):
+            path = request_kwargs["url"][len(self.base_url) :]
+            if self.response_cache is not None:
+                self.response_cache.invalidate(path)
+            if self.file_link_cache is not None and (file_id := file_path_id(path)) is not None:
+                self.file_link_cache.invalidate(file_id)
+            if self._in_flight is not None:
+                # Reads started while the mutation ran may not see it either.
+                self._in_flight.invalidate(resource_scope(path))
+
+    def _cache_lookup(self, request_kwargs: dict[str, Any]) -> tuple[str, str, CachedResponse | None]:
+        """Return the cache key and resource scope of a GET, and its cached entry if any."""
+        assert self.response_cache is not None
+        key, scope = cache_key(request_kwargs), resource_scope(request_kwargs["url"][len(self.base_url) :])
+        return key, scope, self.response_cache.get(key, scope)
+
+    @staticmethod
+    def _flight_key(request_kwargs: dict[str, Any], raise_for_status: bool) -> str:
+        """What identical GETs share: URL, query, API key, and the conditional header and error mode that shape the response."""
+        return f"{cache_key(request_kwargs)} {request_kwargs['headers'].get('If-None-Match', '')} {raise_for_status}"
+
+    @staticmethod
+    def _revalidation_kwargs(request_kwargs: dict[str, Any], entry: CachedResponse | None) -> dict[str, Any]:
+        """Make a GET conditional on the ETag of its stale cache entry, when there is one."""
+        if entry is None or entry.etag is None:
+            return request_kwargs
+        return {**request_kwargs, "headers": {**request_kwargs["headers"], "If-None-Match": entry.etag}}
+
+    def _cache_response(self, key: str, scope: str, generation: int, entry: CachedResponse | None, response: httpx.Response) -> httpx.Response:
+        """Store or renew the cache entry of a GET from its response, and return the response to parse."""
+        assert self.response_cache is not None
+        if response.status_code == 304 and entry is not None:
+            self.response_cache.renew(key, scope, entry, response, generation)
+            return entry.to_response()
+        self.response_cache.store(key, scope, response, generation)
+        return response
+
+    def _observe_response(self, response: httpx.Response) -> None:
+        """Feed the response status back into the client-side rate limiter."""
+        if self.rate_limiter is None:
+            return
+        if response.status_code == 429:
+            self.rate_limiter.record_rate_limited(parse_retry_after(response.headers))
+        else:
+            self.rate_limiter.record_success()
+
+    def _route(self, request_kwargs: dict[str, Any]) -> str:
+        """``"<METHOD> <route template>"`` of a request, e.g. ``"GET /v1/extractions/{id}"``."""
+        # URLs are always built by _prepare_url, so the path is what follows the base URL.
+        return f"{request_kwargs['method']} {route_template(request_kwargs['url'][len(self.base_url) :])}"
+
+    def _hedge_route(self, request_kwargs: dict[str, Any], stream: bool) -> str | None:
+        """Return the route hedging tracks latencies under, or None if the request must not be hedged."""
+        if self.hedge_policy is None or stream or request_kwargs["method"] not in self.hedge_policy.methods:
+            return None
+        return self._route(request_kwargs)
+
+    def _count_hedge(self) -> None:
+        call = current_call()
+        if call is not None and call.hooks is self.hooks:
+            call.hedges += 1
+
+    def _apply_deadline(self, request: httpx.Request) -> float | None:
+        """Clamp an attempt's timeouts to the call's remaining budget and return that budget (None without a deadline).
+
+        Raises:
+            DeadlineExceededError: If the budget is already spent
+        """
+        budget = remaining()
+        if budget is None:
+            return None
+        if budget <= 0:
+            raise DeadlineExceededError(f"Deadline exceeded before sending {request.method} {request.url}")
+        request.extensions["timeout"] = clamp_timeout(httpx.Timeout(**request.extensions["timeout"]), budget).as_dict()
+        return budget
+
+    def _call_scope(self, request_kwargs: dict[str, Any]) -> CallScope | contextlib.nullcontext[None]:
+        """Open an implicit call for a request made outside a resource method."""
+        call = current_call()
+        if call is not None and call.hooks is self.hooks:
+            return contextlib.nullcontext()
+        return CallScope(self.hooks, None, self._route(request_kwargs))
+
+    def _start_attempt(self, request: httpx.Request, is_async: bool) -> RequestEvent | None:
+        call = current_call()
+        if call is None or call.hooks is not self.hooks:
+            return None
+        event = RequestEvent(call, request, is_async)
+        try:
+            call.request_bytes += len(request.content)
+        except httpx.RequestNotRead:
+            # Multipart bodies are streamed; fall back to the declared length.
+            call.request_bytes += int(request.headers.get("content-length") or 0)
+        dispatch(self.hooks, "on_request", event)
+        return event
+
+    def _attempt_failed(self, event: RequestEvent | None, exc: Exception) -> Exception:
+        if event is not None:
+            event.ended_ns = time.time_ns()
+            event.error = exc
+        return exc
+
+    def _finish_attempt(self, event: RequestEvent, response: httpx.Response) -> None:
+        """Record the response on the attempt, notify ``on_response`` and raise for non-2xx statuses."""
+        event.ended_ns = time.time_ns()
+        event.response = response
+        call = event.call
+        call.status_code = response.status_code
+        call.last_response = response
+        # Responses built in memory (tests, cache hits) were never downloaded; use their declared length.
+        call.response_bytes += response.num_bytes_downloaded or int(response.headers.get("content-length") or 0)
+        try:
+            self._validate_response(response)
+        except APIError as exc:
+            event.error = exc
+            raise
+        finally:
+            dispatch(self.hooks, "on_response", event)
+
+    def _response_decoded(self) -> None:
+        call = current_call()
+        if call is not None:
+            call.response_decoded()
+
+    def _notify_retry(self, attempt: int, exc: Exception, delay: float) -> None:
+        call = current_call()
+        if call is None or call.last_event is None:
+            return
+        event = call.last_event
+        event.error = exc
+        event.delay = delay
+        dispatch(self.hooks, "on_retry", event)
+
+    def _notify_error(self, exc: Exception) -> None:
+        call = current_call()
+        if call is None or call.last_event is None:
+            return
+        call.error = exc
+        event = call.last_event
+        event.error = exc
+        dispatch(self.hooks, "on_error", event)
+
+    def _decode_stream_line(self, line: str, content_type: str, offset: int = 0) -> Any:
+        """Decode one line of a streamed response, or return ``_SKIP_LINE``.
+
+        Raises:
+            StreamDecodeError: If a line of a JSON stream is not valid JSON. ``offset`` is the
+                index of the event that failed to decode.
+        """
+        if not line:
+            return _SKIP_LINE
+        is_json_stream = "application/json" in content_type or "application/stream+json" in content_type
+        is_text_stream = "text/plain" in content_type or ("text/" in content_type and not is_json_stream)
+
+        if is_json_stream:
+            try:
+                return self.codec.loads(line)
+            except ValueError as exc:
+                raise StreamDecodeError(f"Malformed JSON in stream at event {offset}: {exc}", line=line, offset=offset) from exc
+        elif is_text_stream:
+            return line
+        else:
+            # Default behavior: try JSON first, fall back to text
+            try:
+                return self.codec.loads(line)
+            except ValueError:
+                return line
+
+    def _stream_reconnect_delay(self, reconnects: int, delivered: int, exc: httpx.TransportError, unit: str = "events") -> float:
+        """Return the pause before resuming a dropped stream, or raise once the retry budget is spent."""
+        delay = self.retry_policy.compute_delay(reconnects)
+        if delay is None:
+            raise StreamInterruptedError(f"Stream interrupted after {delivered} {unit} and {reconnects - 1} reconnects: {exc}", delivered=delivered) from exc
+        logger.debug("Stream dropped after %d %s (%s); reconnecting in %.2fs", delivered, unit, exc, delay)
+        return delay
+
+    def _download_kwargs(self, request: PreparedRequest) -> dict[str, Any]:
+        request_kwargs = self._build_request_kwargs(
+            request.method, request.url, request.data, request.params, request.form_data, request.files, request.idempotency_key, accept="*/*"
+        )
+        # Byte offsets used to resume must count the bytes the caller receives.
+        request_kwargs["headers"]["Accept-Encoding"] = "identity"
+        return request_kwargs
+
     def _parse_response(self, response: httpx.Response) -> Any:
         """Parse response based on content-type.
 
@@ -187,14 +647,14 @@ class BaseRetab:
 
         # Check if it's a JSON response
         if "application/json" in content_type or "application/stream+json" in content_type:
-            return response.json()
+            return self.codec.loads(response.content)
         # Check if it's a text response
         elif "text/plain" in content_type or "text/" in content_type:
             return response.text
         else:
             # Default to JSON parsing for backwards compatibility
             try:
-                return response.json()
+                return self.codec.loads(response.content)
             except Exception:
                 # If JSON parsing fails, return as text
                 return response.text
@@ -209,42 +669,266 @@ class Retab(BaseRetab):
     Args:
         api_key (str, optional): Retab API key. If not provided, will look for RETAB_API_KEY env variable.
         base_url (str, optional): Base URL for API requests. Defaults to https://api.retab.com
-        timeout (float): Request timeout in seconds. Defaults to 1800.0 (30 minutes)
+        timeout (float | httpx.Timeout): Request timeout in seconds. Defaults to 1800.0 (30 minutes)
         max_retries (int): Maximum number of retries for failed requests. Defaults to 3
+        retry_policy (RetryPolicy, optional): Retry/backoff policy; overrides ``max_retries``
+        rate_limiter (RateLimiter, optional): Client-side rate limiter shared by all resources
+        codec (JSONCodec, optional): JSON codec. Defaults to orjson/msgspec when installed, else the stdlib
+        compression (str, optional): ``"gzip"`` or ``"zstd"`` compression of large JSON request bodies
+        compression_threshold (int): Minimum body size in bytes to compress. Defaults to 64 KiB
+        hooks (Iterable[RequestHooks], optional): Lifecycle observers such as ``OpenTelemetryHooks()``
+        on_request, on_response, on_retry, on_error (Callable[[RequestEvent], None], optional): Lifecycle callbacks
+        metrics (bool): Collect in-process metrics as ``client.metrics``. Off by default
+        hedge_policy (HedgePolicy, optional): Hedge slow GETs with a duplicate request. Off by default
+        circuit_breaker (CircuitBreaker, optional): Per-route circuit breaker. Off by default
+        auto_idempotency_keys (bool): Send a generated ``Idempotency-Key`` with POSTs. Defaults to True
+        idempotency_store (IdempotencyStore, optional): Persist pending idempotency keys across failures and restarts
+        validate_responses (bool): Validate responses into their models (False builds them unvalidated). Defaults to True
+        response_cache (ResponseCache, optional): Cache GET responses (LRU, optionally on disk). Off by default
+        coalesce_requests (bool): Share one request between identical concurrent GETs. Defaults to True
+        file_link_cache (FileLinkCache | bool): Reuse the download links fetched to resolve ``FileRef`` documents until close to their expiry. Defaults to True
+        page_size_policy (PageSizePolicy, optional): Adapt the page size of auto-paged lists. Off by default
+        limits (httpx.Limits, optional): Connection pool limits. Defaults to ``DEFAULT_CONNECTION_LIMITS``
+        http2 (bool): Enable HTTP/2 multiplexing (requires ``h2``). Defaults to False
+        transport (httpx.BaseTransport, optional): Caller-owned transport shared across clients
 
     Attributes:
         files: Access to file operations
         schemas: Access to schema operations
+
+    Resource attributes are created on first access, so constructing a client does not import them.
     """
 
+    # Resources are created on first access (see _LazyResource).
+    if TYPE_CHECKING:
+        files: Files
+        extractions: Extractions
+        classifications: Classifications
+        consensus: Consensus
+        parses: Parses
+        splits: Splits
+        partitions: Partitions
+        schemas: Schemas
+        edits: Edits
+        workflows: Workflows
+        tables: Tables
+        secrets: Secrets
+        usage: Usage
+    else:
+        files = _LazyResource(".resources.files", "Files")
+        extractions = _LazyResource(".resources.extractions", "Extractions")
+        classifications = _LazyResource(".resources.classifications", "Classifications")
+        consensus = _LazyResource(".resources.consensus", "Consensus")
+        parses = _LazyResource(".resources.parses", "Parses")
+        splits = _LazyResource(".resources.splits", "Splits")
+        partitions = _LazyResource(".resources.partitions", "Partitions")
+        schemas = _LazyResource(".resources.schemas", "Schemas")
+        edits = _LazyResource(".resources.edits", "Edits")
+        workflows = _LazyResource(".resources.workflows", "Workflows")
+        tables = _LazyResource(".resources.tables", "Tables")
+        secrets = _LazyResource(".resources.secrets", "Secrets")
+        usage = _LazyResource(".resources.usage", "Usage")
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        timeout: float = 1800.0,
+        timeout: float | httpx.Timeout = 1800.0,
         max_retries: int = 3,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.BaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[RequestHooks] | None = None,
+        on_request: Hook | None = None,
+        on_response: Hook | None = None,
+        on_retry: Hook | None = None,
+        on_error: Hook | None = None,
+        metrics: bool = False,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        auto_idempotency_keys: bool = True,
+        idempotency_store: IdempotencyStore | None = None,
+        validate_responses: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        file_link_cache: FileLinkCache | bool = True,
+        page_size_policy: PageSizePolicy | None = None,
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            codec=codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            hooks=hooks,
+            on_request=on_request,
+            on_response=on_response,
+            on_retry=on_retry,
+            on_error=on_error,
+            metrics=metrics,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            auto_idempotency_keys=auto_idempotency_keys,
+            idempotency_store=idempotency_store,
+            validate_responses=validate_responses,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+            file_link_cache=file_link_cache,
+            page_size_policy=page_size_policy,
         )
 
-        self.client = httpx.Client(timeout=self.timeout)
-        self.files = files.Files(client=self)
-        self.extractions = extractions.Extractions(client=self)
-        self.classifications = classifications.Classifications(client=self)
-        self.consensus = consensus.Consensus(client=self)
-        self.parses = parses.Parses(client=self)
-        self.splits = splits.Splits(client=self)
-        self.partitions = partitions.Partitions(client=self)
-        self.schemas = schemas.Schemas(client=self)
-        self.edits = edits.Edits(client=self)
-        self.workflows = workflows.Workflows(client=self)
-        self.tables = tables.Tables(client=self)
-        self.secrets = secrets.Secrets(client=self)
-        self.usage = usage.Usage(client=self)
+        client_kwargs = self._http_client_kwargs()
+        if transport is not None:
+            client_kwargs["transport"] = _SharedTransport(transport)
+        self.client = httpx.Client(**client_kwargs)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_size = 0
+        # Pools replaced by a larger one; calls started on them may still be submitting, so they are shut down by close().
+        self._retired_executors: list[ThreadPoolExecutor] = []
+        self._executor_lock = threading.Lock()
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._in_flight: SingleFlight[httpx.Response] | None = SingleFlight() if coalesce_requests else None
+
+    def _send(self, request_kwargs: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Send one attempt through the circuit breaker (hedged when the policy allows) and raise the typed error for non-2xx responses."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._send_unguarded(request_kwargs, stream)
+        route = self._route(request_kwargs)
+        breaker.before_request(route)
+        try:
+            response = self._send_unguarded(request_kwargs, stream)
+        except BaseException as exc:
+            breaker.record(route, exc)
+            raise
+        breaker.record(route, None)
+        return response
+
+    def _send_unguarded(self, request_kwargs: dict[str, Any], stream: bool) -> httpx.Response:
+        route = self._hedge_route(request_kwargs, stream) if self.hedge_policy is not None else None
+        if route is None:
+            return self._send_once(request_kwargs, stream)
+        return self._send_hedged(request_kwargs, route)
+
+    def _send_hedged(self, request_kwargs: dict[str, Any], route: str) -> httpx.Response:
+        """Race the attempt against a duplicate sent once it is slower than the route's hedge delay.
+
+        Blocking requests cannot be interrupted, so the losing copy runs to completion in the
+        background and its response is discarded.
+        """
+        policy = self.hedge_policy
+        assert policy is not None
+        policy.admit()
+        pool = self._hedge_executor()
+        primary = pool.submit(contextvars.copy_context().run, self._timed_send, request_kwargs, route)
+        done, _ = wait([primary], timeout=policy.delay(route))
+        if done or not policy.try_hedge():
+            return primary.result()
+        self._count_hedge()
+        logger.debug("Hedging %s after %.3fs", route, policy.delay(route))
+        hedge = pool.submit(contextvars.copy_context().run, self._timed_send, request_kwargs, route)
+        pending: set[Future[httpx.Response]] = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None), None)
+            if winner is not None:
+                for future in pending:
+                    if not future.cancel():
+                        future.add_done_callback(_discard_response)
+                return winner.result()
+        # Both copies failed: surface the first attempt's error, as an unhedged request would.
+        return primary.result()
+
+    def _timed_send(self, request_kwargs: dict[str, Any], route: str) -> httpx.Response:
+        started = time.monotonic()
+        response = self._send_once(request_kwargs)
+        assert self.hedge_policy is not None
+        self.hedge_policy.record(route, time.monotonic() - started)
+        return response
+
+    def _hedge_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._hedge_pool is None:
+                # One thread per connection the pool can open; more could only queue behind the pool.
+                self._hedge_pool = ThreadPoolExecutor(max_workers=self.limits.max_connections or 100, thread_name_prefix="retab-hedge")
+            return self._hedge_pool
+
+    def _send_once(self, request_kwargs: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Send one attempt through the rate limiter and raise the typed error for non-2xx responses."""
+        method, url = request_kwargs["method"], request_kwargs["url"]
+        logger.debug("Request: %s %s", method, url)
+
+        request = self.client.build_request(**request_kwargs)
+        # The limiter waits at most the call's remaining budget; the attempt is then clamped to what is left of it.
+        if self.rate_limiter is not None and not self.rate_limiter.acquire(timeout=remaining()):
+            raise DeadlineExceededError(f"Deadline exceeded waiting for the rate limiter: {method} {url}")
+        try:
+            self._apply_deadline(request)
+            event = self._start_attempt(request, is_async=False) if self.hooks else None
+            response = self.client.send(request, stream=stream)
+        except httpx.TimeoutException as exc:
+            raise self._attempt_failed(event, APITimeoutError(f"Request timed out: {method} {url}")) from exc
+        except httpx.ConnectError as exc:
+            raise self._attempt_failed(event, APIConnectionError(f"Connection error: {method} {url}: {exc}")) from exc
+        except httpx.TransportError as exc:
+            raise self._attempt_failed(event, exc)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.release()
+
+        logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
+        self._observe_response(response)
+        if stream and not response.is_success:
+            # Error bodies are small; read them so _validate_response can parse the detail.
+            response.read()
+            response.close()
+        if event is not None:
+            self._finish_attempt(event, response)
+        else:
+            self._validate_response(response)
+        return response
+
+    def _with_retries(self, request_kwargs: dict[str, Any], fn: Callable[[], T], raise_for_status: bool) -> T:
+        if self.idempotency_store is None and self.response_cache is None and self._in_flight is None:
+            return self._retry(request_kwargs, fn, raise_for_status)
+        self._call_started(request_kwargs)
+        try:
+            result = self._retry(request_kwargs, fn, raise_for_status)
+        except Exception as exc:
+            self._call_finished(request_kwargs, exc)
+            raise
+        self._call_finished(request_kwargs, None)
+        return result
+
+    def _retry(self, request_kwargs: dict[str, Any], fn: Callable[[], T], raise_for_status: bool) -> T:
+        if not self.hooks:
+            if raise_for_status:
+                # If raise_for_status is True, we want to raise an exception if the request fails, not retry...
+                return fn()
+            return retry_call(fn, self.retry_policy, on_giveup=raise_max_tries_exceeded)
+        with self._call_scope(request_kwargs):
+            try:
+                if raise_for_status:
+                    result = fn()
+                else:
+                    result = retry_call(fn, self.retry_policy, on_giveup=raise_max_tries_exceeded, on_retry=self._notify_retry)
+            except Exception as exc:
+                self._notify_error(exc)
+                raise
+            self._response_decoded()
+            return result
 
     def _request(
         self,
@@ -275,54 +959,48 @@ class Retab(BaseRetab):
         Raises:
             APIError: If request fails (AuthenticationError, ValidationError, etc.)
         """
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key)
+        if method == "GET":
+            file_id = download_link_file_id(endpoint) if self.file_link_cache is not None and not params and self.file_link_cache.applies() else None
+            if file_id is not None:
+                return self._file_link(file_id, request_kwargs, raise_for_status)
+            if self.response_cache is not None:
+                return self._cached_request(request_kwargs, raise_for_status)
+            if self._in_flight is not None:
+                return self._parse_response(self._get(request_kwargs, raise_for_status))
+        return self._with_retries(request_kwargs, lambda: self._parse_response(self._send(request_kwargs)), raise_for_status)
+
+    def _file_link(self, file_id: str, request_kwargs: dict[str, Any], raise_for_status: bool) -> Any:
+        """Return the cached download link of ``file_id``, or fetch the link and cache it."""
+        assert self.file_link_cache is not None
+        key = cache_key(request_kwargs)
+        link = self.file_link_cache.get(key)
+        if link is None:
+            fetched_at = time.time()
+            link = self._parse_response(self._get(request_kwargs, raise_for_status))
+            self.file_link_cache.put(key, file_id, link, fetched_at)
+        return link
+
+    def _get(self, request_kwargs: dict[str, Any], raise_for_status: bool) -> httpx.Response:
+        """Send a GET, or wait for the identical one already in flight and take its response."""
+        if self._in_flight is None or remaining() is not None:
+            return self._with_retries(request_kwargs, lambda: self._send(request_kwargs), raise_for_status)
+        return self._in_flight.do(
+            self._flight_key(request_kwargs, raise_for_status),
+            lambda: self._with_retries(request_kwargs, lambda: self._send(request_kwargs), raise_for_status),
+            resource_scope(request_kwargs["url"][len(self.base_url) :]),
+        )
 
-        def raw_request() -> Any:
-            url = self._prepare_url(endpoint)
-            logger.debug("Request: %s %s", method, url)
-
-            # Prepare request kwargs
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-
-            # Handle different content types
-            if files or form_data:
-                # For multipart/form-data requests
-                if form_data:
-                    request_kwargs["data"] = form_data
-                if files:
-                    request_kwargs["files"] = files
-                # Remove Content-Type header to let httpx set it automatically for multipart
-                headers = request_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                request_kwargs["headers"] = headers
-            elif data is not None:
-                # For JSON requests (empty {} / [] are valid bodies)
-                request_kwargs["json"] = data
-
-            try:
-                response = self.client.request(**request_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
-            self._validate_response(response)
-            return self._parse_response(response)
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        def wrapped_request() -> Any:
-            return raw_request()
-
-        if raise_for_status:
-            # If raise_for_status is True, we want to raise an exception if the request fails, not retry...
-            return raw_request()
-        else:
-            return wrapped_request()
+    def _cached_request(self, request_kwargs: dict[str, Any], raise_for_status: bool) -> Any:
+        """Answer a GET from the response cache, or send it (conditionally when the entry has an ETag) and cache the answer."""
+        assert self.response_cache is not None
+        key, scope, entry = self._cache_lookup(request_kwargs)
+        if entry is not None and entry.is_fresh():
+            return self._parse_response(entry.to_response())
+        generation = self.response_cache.generation(scope)
+        request_kwargs = self._revalidation_kwargs(request_kwargs, entry)
+        response = self._get(request_kwargs, raise_for_status)
+        return self._parse_response(self._cache_response(key, scope, generation, entry, response))
 
     def _request_bytes(
         self,
@@ -336,49 +1014,8 @@ class Retab(BaseRetab):
         raise_for_status: bool = False,
     ) -> bytes:
         """Makes a synchronous HTTP request and returns the raw response body."""
-
-        def raw_request() -> bytes:
-            url = self._prepare_url(endpoint)
-            logger.debug("Bytes request: %s %s", method, url)
-
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-            request_kwargs["headers"]["Accept"] = "*/*"
-
-            if files or form_data:
-                if form_data:
-                    request_kwargs["data"] = form_data
-                if files:
-                    request_kwargs["files"] = files
-                headers = request_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                request_kwargs["headers"] = headers
-            elif data is not None:
-                request_kwargs["json"] = data
-
-            try:
-                response = self.client.request(**request_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
-            self._validate_response(response)
-            return response.content
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        def wrapped_request() -> bytes:
-            return raw_request()
-
-        if raise_for_status:
-            return raw_request()
-        else:
-            return wrapped_request()
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key, accept="*/*")
+        return self._with_retries(request_kwargs, lambda: self._send(request_kwargs).content, raise_for_status)
 
     def _request_stream(
         self,
@@ -393,6 +1030,12 @@ class Retab(BaseRetab):
     ) -> Iterator[Any]:
         """Makes a streaming synchronous HTTP request to the API.
 
+        Opening the stream is retried under the client's retry policy. If the
+        connection drops mid-stream, the request is re-sent and the events the
+        consumer already received are skipped, so each event is delivered
+        exactly once (this relies on the server replaying the same event
+        sequence, e.g. from its result cache or an idempotency key).
+
         Args:
             method (str): HTTP method (GET, POST, etc.)
             endpoint (str): API endpoint path
@@ -407,104 +1050,114 @@ class Retab(BaseRetab):
 
         Raises:
             APIError: If request fails (AuthenticationError, ValidationError, etc.)
+            StreamInterruptedError: If the stream keeps dropping after ``retry_policy.max_retries`` reconnects
+            StreamDecodeError: If a line of a JSON stream is malformed
         """
-
-        def raw_request() -> Iterator[Any]:
-            url = self._prepare_url(endpoint)
-            logger.debug("Stream request: %s %s", method, url)
-
-            # Prepare request kwargs
-            stream_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-
-            # Handle different content types
-            if files or form_data:
-                # For multipart/form-data requests
-                if form_data:
-                    stream_kwargs["data"] = form_data
-                if files:
-                    stream_kwargs["files"] = files
-                # Remove Content-Type header to let httpx set it automatically for multipart
-                headers = stream_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                stream_kwargs["headers"] = headers
-            elif data is not None:
-                # For JSON requests (empty {} / [] are valid bodies)
-                stream_kwargs["json"] = data
-
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key)
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), raise_for_status)
+            # A reconnect replays the stream from the start: skip what the consumer already has.
+            offset = 0
             try:
-                ctx_manager = self.client.stream(**stream_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            with ctx_manager as response_ctx_manager:
-                self._validate_response(response_ctx_manager)
-
-                content_type = response_ctx_manager.headers.get("content-type", "")
-                is_json_stream = "application/json" in content_type or "application/stream+json" in content_type
-                is_text_stream = "text/plain" in content_type or ("text/" in content_type and not is_json_stream)
-
-                for chunk in response_ctx_manager.iter_lines():
-                    if not chunk:
+                content_type = response.headers.get("content-type", "")
+                for line in response.iter_lines():
+                    item = self._decode_stream_line(line, content_type, offset)
+                    if item is _SKIP_LINE:
+                        continue
+                    offset += 1
+                    if offset <= delivered:
                         continue
+                    delivered = offset
+                    yield item
+                return
+            except httpx.TransportError as exc:
+                if raise_for_status:
+                    raise StreamInterruptedError(f"Stream interrupted after {delivered} events: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                time.sleep(self._stream_reconnect_delay(reconnects, delivered, exc))
+            finally:
+                response.close()
+
+    def _request_items(
+        self,
+        method: str,
+        endpoint: str,
+        decoder: JSONListDecoder,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        idempotency_key: str | None = None,
+        raise_for_status: bool = False,
+    ) -> Iterator[Any]:
+        """Makes a request to a list endpoint and yields the items of its ``data`` array as they arrive.
 
-                    if is_json_stream:
-                        try:
-                            yield json.loads(chunk)
-                        except Exception:
-                            pass
-                    elif is_text_stream:
-                        yield chunk
-                    else:
-                        # Default behavior: try JSON first, fall back to text
-                        try:
-                            yield json.loads(chunk)
-                        except Exception:
-                            yield chunk
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        def wrapped_request() -> Iterator[Any]:
-            for item in raw_request():
-                yield item
-
-        iterator_ = raw_request() if raise_for_status else wrapped_request()
-
-        for item in iterator_:
-            yield item
+        The body is decoded incrementally by ``decoder``, so only one item is held in memory at a
+        time. Once the iterator is exhausted, ``decoder.envelope`` holds the remaining top-level
+        keys (e.g. ``list_metadata``). Dropped connections are resumed like ``_request_stream``.
+
+        Raises:
+            APIError: If request fails (AuthenticationError, ValidationError, etc.)
+            StreamInterruptedError: If the connection keeps dropping after ``retry_policy.max_retries`` reconnects
+            ValueError: If the body is not valid JSON
+        """
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, idempotency_key=idempotency_key)
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), raise_for_status)
+            decoder.reset()
+            try:
+                for chunk in response.iter_bytes():
+                    for item in decoder.feed(chunk):
+                        if decoder.count > delivered:
+                            delivered = decoder.count
+                            yield item
+                for item in decoder.close():
+                    if decoder.count > delivered:
+                        delivered = decoder.count
+                        yield item
+                return
+            except httpx.TransportError as exc:
+                if raise_for_status:
+                    raise StreamInterruptedError(f"Response interrupted after {delivered} items: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                time.sleep(self._stream_reconnect_delay(reconnects, delivered, exc))
+            finally:
+                response.close()
 
     # Simplified request methods using standard PreparedRequest object
     def _prepared_request(self, request: PreparedRequest) -> Any:
-        return self._request(
-            method=request.method,
-            endpoint=request.url,
-            data=request.data,
-            params=request.params,
-            form_data=request.form_data,
-            files=request.files,
-            idempotency_key=request.idempotency_key,
-            raise_for_status=request.raise_for_status,
-        )
+        with deadline_scope(request.timeout, request.deadline):
+            response = self._request(
+                method=request.method,
+                endpoint=request.url,
+                data=request.data,
+                params=request.params,
+                form_data=request.form_data,
+                files=request.files,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            )
+        # Inside a call that skips validation, build its return model here; the generated
+        # code's model_validate() then returns that instance unchanged.
+        return construct_response(response)
 
     def _prepared_request_bytes(self, request: PreparedRequest) -> bytes:
-        return self._request_bytes(
-            method=request.method,
-            endpoint=request.url,
-            data=request.data,
-            params=request.params,
-            form_data=request.form_data,
-            files=request.files,
-            idempotency_key=request.idempotency_key,
-            raise_for_status=request.raise_for_status,
-        )
+        with deadline_scope(request.timeout, request.deadline):
+            return self._request_bytes(
+                method=request.method,
+                endpoint=request.url,
+                data=request.data,
+                params=request.params,
+                form_data=request.form_data,
+                files=request.files,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            )
 
     def _prepared_request_stream(self, request: PreparedRequest) -> Iterator[Any]:
-        for item in self._request_stream(
+        stream = self._request_stream(
             method=request.method,
             endpoint=request.url,
             data=request.data,
@@ -513,11 +1166,205 @@ class Retab(BaseRetab):
             files=request.files,
             idempotency_key=request.idempotency_key,
             raise_for_status=request.raise_for_status,
-        ):
-            yield item
+        )
+        yield from iter_in_scope(stream, request.timeout, request.deadline)
+
+    def iter_bytes(self, request: PreparedRequest, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+        """Stream the raw body of a prepared request in chunks instead of buffering it.
+
+        A dropped connection is resumed with a ``Range`` request when the server supports it
+        (otherwise the body is re-sent and the bytes already yielded are skipped).
+
+        Example:
+            >>> for chunk in client.iter_bytes(client.tables.prepare_download(table_id)):
+            ...     sink.write(chunk)
+
+        Raises:
+            APIError: If the request fails
+            StreamInterruptedError: If the body cannot be resumed, or keeps dropping past the retry budget
+        """
+        return iter_in_scope(self._iter_download(request, chunk_size, RangeResume()), request.timeout, request.deadline)
+
+    def download_to(
+        self,
+        request: PreparedRequest,
+        destination: Destination,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        checksum: str | None = "sha256",
+        expected_checksum: str | None = None,
+    ) -> DownloadResult:
+        """Stream the body of a prepared request to a file path or binary file object.
+
+        Paths are written through ``<path>.part`` and only renamed into place once the
+        download is complete, so a crash never leaves a truncated file behind.
+
+        Args:
+            request (PreparedRequest): Request for a binary endpoint, e.g. ``client.tables.prepare_download(table_id)``
+            destination (str | os.PathLike | IO[bytes]): Where to write the body
+            chunk_size (int): Bytes read and written at a time. Defaults to 1 MiB
+            checksum (str, optional): ``hashlib`` algorithm to digest the body with; None disables it. Defaults to ``"sha256"``
+            expected_checksum (str, optional): Hex digest the body must match
+
+        Returns:
+            DownloadResult: Path, size, checksum and resume count
+
+        Raises:
+            ChecksumMismatchError: If ``expected_checksum`` is given and does not match
+            StreamInterruptedError: If the body cannot be resumed, or keeps dropping past the retry budget
+        """
+        sink = DownloadSink(destination, checksum, expected_checksum)
+        resume = RangeResume()
+        try:
+            for chunk in iter_in_scope(self._iter_download(request, chunk_size, resume), request.timeout, request.deadline):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.finish(resume)
+
+    def _iter_download(self, request: PreparedRequest, chunk_size: int, resume: RangeResume) -> Iterator[bytes]:
+        base_kwargs = self._download_kwargs(request)
+        request_kwargs = base_kwargs
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), request.raise_for_status)
+            try:
+                skip = resume.skip(response, delivered)
+                for chunk in response.iter_bytes(chunk_size):
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+                        chunk, skip = chunk[skip:], 0
+                    delivered += len(chunk)
+                    yield chunk
+                return
+            except httpx.TransportError as exc:
+                if request.raise_for_status:
+                    raise StreamInterruptedError(f"Download interrupted after {delivered} bytes: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                time.sleep(self._stream_reconnect_delay(reconnects, delivered, exc, unit="bytes"))
+                request_kwargs = resume.request_kwargs(base_kwargs, delivered)
+            finally:
+                response.close()
+
+    def _batch_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Return the client's shared batch thread pool, growing it if ``max_workers`` exceeds its size.
+
+        Each call bounds its own concurrency to ``max_workers``; the pool only has to be large enough for the largest.
+        """
+        with self._executor_lock:
+            executor = self._executor
+            if executor is None or self._executor_size < max_workers:
+                if executor is not None:
+                    # Calls already running on the smaller pool keep submitting to it until they finish.
+                    self._retired_executors.append(executor)
+                executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="retab-batch")
+                self._executor = executor
+                self._executor_size = max_workers
+            return executor
+
+    def map(
+        self,
+        fn: Callable[[Any], T],
+        items: Iterable[Any],
+        *,
+        max_workers: int = 8,
+        on_progress: ProgressCallback | None = None,
+        stop_on_error: bool = False,
+    ) -> BatchResults[T]:
+        """Call ``fn(item)`` for every item on the client's thread pool.
+
+        All calls share this client's connection pool. Results come back in input
+        order, each carrying either its value or its exception.
+
+        Args:
+            fn (Callable): Called once per item, e.g. ``lambda doc: client.extractions.create(document=doc, json_schema=schema)``
+            items (Iterable): Inputs; consumed lazily, at most ``max_workers`` are in flight
+            max_workers (int): Maximum concurrent calls. Defaults to 8
+            on_progress (Callable[[BatchProgress], None], optional): Called after every finished item
+            stop_on_error (bool): Raise ``BatchAborted`` on the first failure and cancel items not yet
+                started. Defaults to False
+
+        Returns:
+            BatchResults: One ``BatchResult`` per item, plus a ``summary`` with throughput and latency percentiles
+        """
+        return threaded_map(self._batch_executor(max_workers), fn, items, max_workers=max_workers, on_progress=on_progress, stop_on_error=stop_on_error)
+
+    def run_batch(
+        self,
+        requests: Iterable[SyncBatchItem],
+        *,
+        max_workers: int = 8,
+        on_progress: ProgressCallback | None = None,
+        stop_on_error: bool = False,
+    ) -> BatchResults[Any]:
+        """Send ``prepare_*`` requests (or zero-argument callables) concurrently; see :meth:`map`."""
+        return self.map(functools.partial(run_sync_item, self), requests, max_workers=max_workers, on_progress=on_progress, stop_on_error=stop_on_error)
+
+    def list_sharded(
+        self,
+        list_method: Callable[..., "PaginatedList[T]"],
+        *,
+        from_date: str | datetime.date,
+        to_date: str | datetime.date,
+        shards: int = 8,
+        max_shards: int | None = None,
+        max_workers: int = 8,
+        order: "PaginationOrder" = "desc",
+        ordered: bool = False,
+        **filters: Any,
+    ) -> Iterator[T]:
+        """List every item of ``list_method`` between two dates, paging windows of the range concurrently.
+
+        The range is split into day windows, each paged through with its own cursor on the client's
+        thread pool; windows whose first page is full are split further (see ``retab._sharding``).
+
+        Args:
+            list_method (Callable): A list method of this client with ``from_date`` / ``to_date`` filters,
+                e.g. ``client.extractions.list`` or ``client.usage.list_primitives``
+            from_date (str | datetime.date): First day of the range (``YYYY-MM-DD``, UTC)
+            to_date (str | datetime.date): Last day of the range, included
+            shards (int): Windows the range is split into up front. Defaults to 8
+            max_shards (int, optional): Windows dense periods may be split into in total. Defaults to ``4 * shards``
+            max_workers (int): Maximum concurrent page requests. Defaults to 8
+            order (str): Order ``list_method`` lists in, ``"desc"`` (the default) or ``"asc"``
+            ordered (bool): Yield the items in ``order`` across the whole range rather than as pages arrive.
+                Defaults to False
+            **filters: Other arguments of ``list_method``, e.g. ``limit=100`` or ``status="completed"``
+
+        Returns:
+            Iterator: Every item of the range, once
+
+        Raises:
+            ValueError: If ``to_date`` is before ``from_date``
+        """
+        return iter_sharded(
+            self._batch_executor(max_workers),
+            list_method,
+            from_date,
+            to_date,
+            shards=shards,
+            max_shards=max_shards,
+            max_workers=max_workers,
+            order=order,
+            ordered=ordered,
+            filters=filters,
+        )
 
     def close(self) -> None:
         """Closes the HTTP client session."""
+        with self._executor_lock:
+            executors = [*self._retired_executors, *([self._executor] if self._executor is not None else [])]
+            self._retired_executors = []
+            self._executor = None
+        for executor in executors:
+            executor.shutdown(wait=True)
+        if self._hedge_pool is not None:
+            self._hedge_pool.shutdown(wait=True)
+            self._hedge_pool = None
         self.client.close()
 
     def __enter__(self) -> "Retab":
@@ -548,43 +1395,253 @@ class AsyncRetab(BaseRetab):
     Args:
         api_key (str, optional): Retab API key. If not provided, will look for RETAB_API_KEY env variable.
         base_url (str, optional): Base URL for API requests. Defaults to https://api.retab.com
-        timeout (float): Request timeout in seconds. Defaults to 1800.0 (30 minutes)
+        timeout (float | httpx.Timeout): Request timeout in seconds. Defaults to 1800.0 (30 minutes)
         max_retries (int): Maximum number of retries for failed requests. Defaults to 3
+        retry_policy (RetryPolicy, optional): Retry/backoff policy; overrides ``max_retries``
+        rate_limiter (RateLimiter, optional): Client-side rate limiter shared by all resources
+        codec (JSONCodec, optional): JSON codec. Defaults to orjson/msgspec when installed, else the stdlib
+        compression (str, optional): ``"gzip"`` or ``"zstd"`` compression of large JSON request bodies
+        compression_threshold (int): Minimum body size in bytes to compress. Defaults to 64 KiB
+        hooks (Iterable[RequestHooks], optional): Lifecycle observers such as ``OpenTelemetryHooks()``
+        on_request, on_response, on_retry, on_error (Callable[[RequestEvent], None], optional): Lifecycle callbacks
+        metrics (bool): Collect in-process metrics as ``client.metrics``. Off by default
+        hedge_policy (HedgePolicy, optional): Hedge slow GETs with a duplicate request. Off by default
+        circuit_breaker (CircuitBreaker, optional): Per-route circuit breaker. Off by default
+        auto_idempotency_keys (bool): Send a generated ``Idempotency-Key`` with POSTs. Defaults to True
+        idempotency_store (IdempotencyStore, optional): Persist pending idempotency keys across failures and restarts
+        validate_responses (bool): Validate responses into their models (False builds them unvalidated). Defaults to True
+        response_cache (ResponseCache, optional): Cache GET responses (LRU, optionally on disk). Off by default
+        coalesce_requests (bool): Share one request between identical concurrent GETs. Defaults to True
+        file_link_cache (FileLinkCache | bool): Reuse the download links fetched to resolve ``FileRef`` documents until close to their expiry. Defaults to True
+        page_size_policy (PageSizePolicy, optional): Adapt the page size of auto-paged lists. Off by default
+        limits (httpx.Limits, optional): Connection pool limits. Defaults to ``DEFAULT_CONNECTION_LIMITS``
+        http2 (bool): Enable HTTP/2 multiplexing (requires ``h2``). Defaults to False
+        transport (httpx.AsyncBaseTransport, optional): Caller-owned transport shared across clients
 
     Attributes:
         files: Access to asynchronous file operations
         schemas: Access to asynchronous schema operations
+
+    Resource attributes are created on first access, so constructing a client does not import them.
     """
 
+    # Resources are created on first access (see _LazyResource).
+    if TYPE_CHECKING:
+        files: AsyncFiles
+        extractions: AsyncExtractions
+        classifications: AsyncClassifications
+        consensus: AsyncConsensus
+        parses: AsyncParses
+        splits: AsyncSplits
+        partitions: AsyncPartitions
+        schemas: AsyncSchemas
+        edits: AsyncEdits
+        workflows: AsyncWorkflows
+        tables: AsyncTables
+        secrets: AsyncSecrets
+        usage: AsyncUsage
+    else:
+        files = _LazyResource(".resources.files", "AsyncFiles")
+        extractions = _LazyResource(".resources.extractions", "AsyncExtractions")
+        classifications = _LazyResource(".resources.classifications", "AsyncClassifications")
+        consensus = _LazyResource(".resources.consensus", "AsyncConsensus")
+        parses = _LazyResource(".resources.parses", "AsyncParses")
+        splits = _LazyResource(".resources.splits", "AsyncSplits")
+        partitions = _LazyResource(".resources.partitions", "AsyncPartitions")
+        schemas = _LazyResource(".resources.schemas", "AsyncSchemas")
+        edits = _LazyResource(".resources.edits", "AsyncEdits")
+        workflows = _LazyResource(".resources.workflows", "AsyncWorkflows")
+        tables = _LazyResource(".resources.tables", "AsyncTables")
+        secrets = _LazyResource(".resources.secrets", "AsyncSecrets")
+        usage = _LazyResource(".resources.usage", "AsyncUsage")
+
     def __init__(
         self,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
-        timeout: float = 1800.0,
+        timeout: float | httpx.Timeout = 1800.0,
         max_retries: int = 3,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+        transport: httpx.AsyncBaseTransport | None = None,
+        retry_policy: RetryPolicy | None = None,
+        rate_limiter: RateLimiter | None = None,
+        codec: JSONCodec | None = None,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        hooks: Iterable[RequestHooks] | None = None,
+        on_request: Hook | None = None,
+        on_response: Hook | None = None,
+        on_retry: Hook | None = None,
+        on_error: Hook | None = None,
+        metrics: bool = False,
+        hedge_policy: HedgePolicy | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        auto_idempotency_keys: bool = True,
+        idempotency_store: IdempotencyStore | None = None,
+        validate_responses: bool = True,
+        response_cache: ResponseCache | None = None,
+        coalesce_requests: bool = True,
+        file_link_cache: FileLinkCache | bool = True,
+        page_size_policy: PageSizePolicy | None = None,
     ) -> None:
         super().__init__(
             api_key=api_key,
             base_url=base_url,
             timeout=timeout,
             max_retries=max_retries,
+            limits=limits,
+            http2=http2,
+            transport=transport,
+            retry_policy=retry_policy,
+            rate_limiter=rate_limiter,
+            codec=codec,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            hooks=hooks,
+            on_request=on_request,
+            on_response=on_response,
+            on_retry=on_retry,
+            on_error=on_error,
+            metrics=metrics,
+            hedge_policy=hedge_policy,
+            circuit_breaker=circuit_breaker,
+            auto_idempotency_keys=auto_idempotency_keys,
+            idempotency_store=idempotency_store,
+            validate_responses=validate_responses,
+            response_cache=response_cache,
+            coalesce_requests=coalesce_requests,
+            file_link_cache=file_link_cache,
+            page_size_policy=page_size_policy,
         )
 
-        self.client = httpx.AsyncClient(timeout=self.timeout)
-
-        self.files = files.AsyncFiles(client=self)
-        self.extractions = extractions.AsyncExtractions(client=self)
-        self.classifications = classifications.AsyncClassifications(client=self)
-        self.consensus = consensus.AsyncConsensus(client=self)
-        self.parses = parses.AsyncParses(client=self)
-        self.splits = splits.AsyncSplits(client=self)
-        self.partitions = partitions.AsyncPartitions(client=self)
-        self.schemas = schemas.AsyncSchemas(client=self)
-        self.edits = edits.AsyncEdits(client=self)
-        self.workflows = workflows.AsyncWorkflows(client=self)
-        self.tables = tables.AsyncTables(client=self)
-        self.secrets = secrets.AsyncSecrets(client=self)
-        self.usage = usage.AsyncUsage(client=self)
+        client_kwargs = self._http_client_kwargs()
+        if transport is not None:
+            client_kwargs["transport"] = _AsyncSharedTransport(transport)
+        self.client = httpx.AsyncClient(**client_kwargs)
+        self._in_flight: AsyncSingleFlight[httpx.Response] | None = AsyncSingleFlight() if coalesce_requests else None
+
+    async def _send(self, request_kwargs: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Send one attempt through the circuit breaker (hedged when the policy allows) and raise the typed error for non-2xx responses."""
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return await self._send_unguarded(request_kwargs, stream)
+        route = self._route(request_kwargs)
+        breaker.before_request(route)
+        try:
+            response = await self._send_unguarded(request_kwargs, stream)
+        except BaseException as exc:
+            breaker.record(route, exc)
+            raise
+        breaker.record(route, None)
+        return response
+
+    async def _send_unguarded(self, request_kwargs: dict[str, Any], stream: bool) -> httpx.Response:
+        route = self._hedge_route(request_kwargs, stream) if self.hedge_policy is not None else None
+        if route is None:
+            return await self._send_once(request_kwargs, stream)
+        return await self._send_hedged(request_kwargs, route)
+
+    async def _send_hedged(self, request_kwargs: dict[str, Any], route: str) -> httpx.Response:
+        """Race the attempt against a duplicate sent once it is slower than the route's hedge delay; the loser is cancelled."""
+        policy = self.hedge_policy
+        assert policy is not None
+        policy.admit()
+        primary = asyncio.ensure_future(self._timed_send(request_kwargs, route))
+        pending: set[asyncio.Future[httpx.Response]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=policy.delay(route))
+            if done or not policy.try_hedge():
+                return await primary
+            self._count_hedge()
+            logger.debug("Hedging %s after %.3fs", route, policy.delay(route))
+            pending.add(asyncio.ensure_future(self._timed_send(request_kwargs, route)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Check every finished task so a failed loser's exception is not reported as never retrieved.
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+            # Both copies failed: surface the first attempt's error, as an unhedged request would.
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _timed_send(self, request_kwargs: dict[str, Any], route: str) -> httpx.Response:
+        started = time.monotonic()
+        response = await self._send_once(request_kwargs)
+        assert self.hedge_policy is not None
+        self.hedge_policy.record(route, time.monotonic() - started)
+        return response
+
+    async def _send_once(self, request_kwargs: dict[str, Any], stream: bool = False) -> httpx.Response:
+        """Send one attempt through the rate limiter and raise the typed error for non-2xx responses."""
+        method, url = request_kwargs["method"], request_kwargs["url"]
+        logger.debug("Request: %s %s", method, url)
+
+        request = self.client.build_request(**request_kwargs)
+        if self.rate_limiter is not None and not await self.rate_limiter.aacquire(timeout=remaining()):
+            raise DeadlineExceededError(f"Deadline exceeded waiting for the rate limiter: {method} {url}")
+        try:
+            budget = self._apply_deadline(request)
+            event = self._start_attempt(request, is_async=True) if self.hooks else None
+            if budget is None:
+                response = await self.client.send(request, stream=stream)
+            else:
+                # httpx timeouts bound each phase (and each read); the event loop can bound the whole attempt.
+                response = await asyncio.wait_for(self.client.send(request, stream=stream), budget)
+        except asyncio.TimeoutError as exc:
+            raise self._attempt_failed(event, DeadlineExceededError(f"Deadline exceeded: {method} {url}")) from exc
+        except httpx.TimeoutException as exc:
+            raise self._attempt_failed(event, APITimeoutError(f"Request timed out: {method} {url}")) from exc
+        except httpx.ConnectError as exc:
+            raise self._attempt_failed(event, APIConnectionError(f"Connection error: {method} {url}: {exc}")) from exc
+        except httpx.TransportError as exc:
+            raise self._attempt_failed(event, exc)
+        finally:
+            if self.rate_limiter is not None:
+                self.rate_limiter.arelease()
+
+        logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
+        self._observe_response(response)
+        if stream and not response.is_success:
+            await response.aread()
+            await response.aclose()
+        if event is not None:
+            self._finish_attempt(event, response)
+        else:
+            self._validate_response(response)
+        return response
+
+    async def _with_retries(self, request_kwargs: dict[str, Any], fn: Callable[[], Awaitable[T]], raise_for_status: bool) -> T:
+        if self.idempotency_store is None and self.response_cache is None and self._in_flight is None:
+            return await self._retry(request_kwargs, fn, raise_for_status)
+        self._call_started(request_kwargs)
+        try:
+            result = await self._retry(request_kwargs, fn, raise_for_status)
+        except Exception as exc:
+            self._call_finished(request_kwargs, exc)
+            raise
+        self._call_finished(request_kwargs, None)
+        return result
+
+    async def _retry(self, request_kwargs: dict[str, Any], fn: Callable[[], Awaitable[T]], raise_for_status: bool) -> T:
+        if not self.hooks:
+            if raise_for_status:
+                return await fn()
+            return await aretry_call(fn, self.retry_policy, on_giveup=raise_max_tries_exceeded)
+        with self._call_scope(request_kwargs):
+            try:
+                if raise_for_status:
+                    result = await fn()
+                else:
+                    result = await aretry_call(fn, self.retry_policy, on_giveup=raise_max_tries_exceeded, on_retry=self._notify_retry)
+            except Exception as exc:
+                self._notify_error(exc)
+                raise
+            self._response_decoded()
+            return result
 
     async def _request(
         self,
@@ -614,53 +1671,52 @@ class AsyncRetab(BaseRetab):
         Raises:
             APIError: If request fails (AuthenticationError, ValidationError, etc.)
         """
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key)
+        if method == "GET":
+            file_id = download_link_file_id(endpoint) if self.file_link_cache is not None and not params and self.file_link_cache.applies() else None
+            if file_id is not None:
+                return await self._file_link(file_id, request_kwargs, raise_for_status)
+            if self.response_cache is not None:
+                return await self._cached_request(request_kwargs, raise_for_status)
+            if self._in_flight is not None:
+                return self._parse_response(await self._get(request_kwargs, raise_for_status))
 
         async def raw_request() -> Any:
-            url = self._prepare_url(endpoint)
-            logger.debug("Request: %s %s", method, url)
-
-            # Prepare request kwargs
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-
-            # Handle different content types
-            if files or form_data:
-                # For multipart/form-data requests
-                if form_data:
-                    request_kwargs["data"] = form_data
-                if files:
-                    request_kwargs["files"] = files
-                # Remove Content-Type header to let httpx set it automatically for multipart
-                headers = request_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                request_kwargs["headers"] = headers
-            elif data is not None:
-                # For JSON requests (empty {} / [] are valid bodies)
-                request_kwargs["json"] = data
-
-            try:
-                response = await self.client.request(**request_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
-            self._validate_response(response)
-            return self._parse_response(response)
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        async def wrapped_request() -> Any:
-            return await raw_request()
-
-        if raise_for_status:
-            return await raw_request()
-        else:
-            return await wrapped_request()
+            return self._parse_response(await self._send(request_kwargs))
+
+        return await self._with_retries(request_kwargs, raw_request, raise_for_status)
+
+    async def _cached_request(self, request_kwargs: dict[str, Any], raise_for_status: bool) -> Any:
+        """Answer a GET from the response cache, or send it (conditionally when the entry has an ETag) and cache the answer."""
+        assert self.response_cache is not None
+        key, scope, entry = self._cache_lookup(request_kwargs)
+        if entry is not None and entry.is_fresh():
+            return self._parse_response(entry.to_response())
+        generation = self.response_cache.generation(scope)
+        request_kwargs = self._revalidation_kwargs(request_kwargs, entry)
+        response = await self._get(request_kwargs, raise_for_status)
+        return self._parse_response(self._cache_response(key, scope, generation, entry, response))
+
+    async def _file_link(self, file_id: str, request_kwargs: dict[str, Any], raise_for_status: bool) -> Any:
+        """Return the cached download link of ``file_id``, or fetch the link and cache it."""
+        assert self.file_link_cache is not None
+        key = cache_key(request_kwargs)
+        link = self.file_link_cache.get(key)
+        if link is None:
+            fetched_at = time.time()
+            link = self._parse_response(await self._get(request_kwargs, raise_for_status))
+            self.file_link_cache.put(key, file_id, link, fetched_at)
+        return link
+
+    async def _get(self, request_kwargs: dict[str, Any], raise_for_status: bool) -> httpx.Response:
+        """Send a GET, or wait for the identical one already in flight and take its response."""
+        if self._in_flight is None or remaining() is not None:
+            return await self._with_retries(request_kwargs, lambda: self._send(request_kwargs), raise_for_status)
+        return await self._in_flight.do(
+            self._flight_key(request_kwargs, raise_for_status),
+            lambda: self._with_retries(request_kwargs, lambda: self._send(request_kwargs), raise_for_status),
+            resource_scope(request_kwargs["url"][len(self.base_url) :]),
+        )
 
     async def _request_bytes(
         self,
@@ -674,49 +1730,12 @@ class AsyncRetab(BaseRetab):
         raise_for_status: bool = False,
     ) -> bytes:
         """Makes an asynchronous HTTP request and returns the raw response body."""
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key, accept="*/*")
 
         async def raw_request() -> bytes:
-            url = self._prepare_url(endpoint)
-            logger.debug("Bytes request: %s %s", method, url)
-
-            request_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-            request_kwargs["headers"]["Accept"] = "*/*"
-
-            if files or form_data:
-                if form_data:
-                    request_kwargs["data"] = form_data
-                if files:
-                    request_kwargs["files"] = files
-                headers = request_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                request_kwargs["headers"] = headers
-            elif data is not None:
-                request_kwargs["json"] = data
+            return (await self._send(request_kwargs)).content
 
-            try:
-                response = await self.client.request(**request_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            logger.debug("Response: %s (request_id=%s)", response.status_code, response.headers.get("x-request-id"))
-            self._validate_response(response)
-            return response.content
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        async def wrapped_request() -> bytes:
-            return await raw_request()
-
-        if raise_for_status:
-            return await raw_request()
-        else:
-            return await wrapped_request()
+        return await self._with_retries(request_kwargs, raw_request, raise_for_status)
 
     async def _request_stream(
         self,
@@ -731,6 +1750,12 @@ class AsyncRetab(BaseRetab):
     ) -> AsyncIterator[Any]:
         """Makes a streaming asynchronous HTTP request to the API.
 
+        Opening the stream is retried under the client's retry policy. If the
+        connection drops mid-stream, the request is re-sent and the events the
+        consumer already received are skipped, so each event is delivered
+        exactly once (this relies on the server replaying the same event
+        sequence, e.g. from its result cache or an idempotency key).
+
         Args:
             method (str): HTTP method (GET, POST, etc.)
             endpoint (str): API endpoint path
@@ -745,103 +1770,102 @@ class AsyncRetab(BaseRetab):
 
         Raises:
             APIError: If request fails (AuthenticationError, ValidationError, etc.)
+            StreamInterruptedError: If the stream keeps dropping after ``retry_policy.max_retries`` reconnects
+            StreamDecodeError: If a line of a JSON stream is malformed
         """
-
-        async def raw_request() -> AsyncIterator[Any]:
-            url = self._prepare_url(endpoint)
-            logger.debug("Stream request: %s %s", method, url)
-
-            # Prepare request kwargs
-            stream_kwargs = {
-                "method": method,
-                "url": url,
-                "params": params,
-                "headers": self._get_headers(idempotency_key),
-            }
-
-            # Handle different content types
-            if files or form_data:
-                # For multipart/form-data requests
-                if form_data:
-                    stream_kwargs["data"] = form_data
-                if files:
-                    stream_kwargs["files"] = files
-                # Remove Content-Type header to let httpx set it automatically for multipart
-                headers = stream_kwargs["headers"].copy()
-                headers.pop("Content-Type", None)
-                stream_kwargs["headers"] = headers
-            elif data is not None:
-                # For JSON requests (empty {} / [] are valid bodies)
-                stream_kwargs["json"] = data
-
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, form_data, files, idempotency_key)
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = await self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), raise_for_status)
+            offset = 0
             try:
-                ctx_manager = self.client.stream(**stream_kwargs)
-            except httpx.TimeoutException as exc:
-                raise APITimeoutError(f"Request timed out: {method} {url}") from exc
-            except httpx.ConnectError as exc:
-                raise APIConnectionError(f"Connection error: {method} {url}: {exc}") from exc
-
-            async with ctx_manager as response_ctx_manager:
-                self._validate_response(response_ctx_manager)
-
-                content_type = response_ctx_manager.headers.get("content-type", "")
-                is_json_stream = "application/json" in content_type or "application/stream+json" in content_type
-                is_text_stream = "text/plain" in content_type or ("text/" in content_type and not is_json_stream)
-
-                async for chunk in response_ctx_manager.aiter_lines():
-                    if not chunk:
+                content_type = response.headers.get("content-type", "")
+                async for line in response.aiter_lines():
+                    item = self._decode_stream_line(line, content_type, offset)
+                    if item is _SKIP_LINE:
                         continue
-
-                    if is_json_stream:
-                        try:
-                            yield json.loads(chunk)
-                        except Exception:
-                            pass
-                    elif is_text_stream:
-                        yield chunk
-                    else:
-                        # Default behavior: try JSON first, fall back to text
-                        try:
-                            yield json.loads(chunk)
-                        except Exception:
-                            yield chunk
-
-        @backoff.on_exception(backoff.expo, (InternalServerError, RateLimitError), max_tries=self.max_retries + 1, on_giveup=raise_max_tries_exceeded)
-        async def wrapped_request() -> AsyncIterator[Any]:
-            async for item in raw_request():
-                yield item
-
-        async_iterator_ = raw_request() if raise_for_status else wrapped_request()
-
-        async for item in async_iterator_:
-            yield item
+                    offset += 1
+                    if offset <= delivered:
+                        continue
+                    delivered = offset
+                    yield item
+                return
+            except httpx.TransportError as exc:
+                if raise_for_status:
+                    raise StreamInterruptedError(f"Stream interrupted after {delivered} events: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                await asyncio.sleep(self._stream_reconnect_delay(reconnects, delivered, exc))
+            finally:
+                await response.aclose()
+
+    async def _request_items(
+        self,
+        method: str,
+        endpoint: str,
+        decoder: JSONListDecoder,
+        data: Any = None,
+        params: Optional[dict[str, Any]] = None,
+        idempotency_key: str | None = None,
+        raise_for_status: bool = False,
+    ) -> AsyncIterator[Any]:
+        """Async variant of ``Retab._request_items``: yields list items as the body arrives."""
+        request_kwargs = self._build_request_kwargs(method, endpoint, data, params, idempotency_key=idempotency_key)
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = await self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), raise_for_status)
+            decoder.reset()
+            try:
+                async for chunk in response.aiter_bytes():
+                    for item in decoder.feed(chunk):
+                        if decoder.count > delivered:
+                            delivered = decoder.count
+                            yield item
+                for item in decoder.close():
+                    if decoder.count > delivered:
+                        delivered = decoder.count
+                        yield item
+                return
+            except httpx.TransportError as exc:
+                if raise_for_status:
+                    raise StreamInterruptedError(f"Response interrupted after {delivered} items: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                await asyncio.sleep(self._stream_reconnect_delay(reconnects, delivered, exc))
+            finally:
+                await response.aclose()
 
     async def _prepared_request(self, request: PreparedRequest) -> Any:
-        return await self._request(
-            method=request.method,
-            endpoint=request.url,
-            data=request.data,
-            params=request.params,
-            form_data=request.form_data,
-            files=request.files,
-            idempotency_key=request.idempotency_key,
-            raise_for_status=request.raise_for_status,
-        )
+        with deadline_scope(request.timeout, request.deadline):
+            response = await self._request(
+                method=request.method,
+                endpoint=request.url,
+                data=request.data,
+                params=request.params,
+                form_data=request.form_data,
+                files=request.files,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            )
+        # Inside a call that skips validation, build its return model here; the generated
+        # code's model_validate() then returns that instance unchanged.
+        return construct_response(response)
 
     async def _prepared_request_bytes(self, request: PreparedRequest) -> bytes:
-        return await self._request_bytes(
-            method=request.method,
-            endpoint=request.url,
-            data=request.data,
-            params=request.params,
-            form_data=request.form_data,
-            files=request.files,
-            idempotency_key=request.idempotency_key,
-            raise_for_status=request.raise_for_status,
-        )
+        with deadline_scope(request.timeout, request.deadline):
+            return await self._request_bytes(
+                method=request.method,
+                endpoint=request.url,
+                data=request.data,
+                params=request.params,
+                form_data=request.form_data,
+                files=request.files,
+                idempotency_key=request.idempotency_key,
+                raise_for_status=request.raise_for_status,
+            )
 
     async def _prepared_request_stream(self, request: PreparedRequest) -> AsyncIterator[Any]:
-        async for item in self._request_stream(
+        stream = self._request_stream(
             method=request.method,
             endpoint=request.url,
             data=request.data,
@@ -850,9 +1874,135 @@ class AsyncRetab(BaseRetab):
             files=request.files,
             idempotency_key=request.idempotency_key,
             raise_for_status=request.raise_for_status,
-        ):
+        )
+        async for item in aiter_in_scope(stream, request.timeout, request.deadline):
             yield item
 
+    def iter_bytes(self, request: PreparedRequest, chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+        """Async variant of ``Retab.iter_bytes``."""
+        return aiter_in_scope(self._iter_download(request, chunk_size, RangeResume()), request.timeout, request.deadline)
+
+    async def download_to(
+        self,
+        request: PreparedRequest,
+        destination: Destination,
+        *,
+        chunk_size: int = DEFAULT_DOWNLOAD_CHUNK_SIZE,
+        checksum: str | None = "sha256",
+        expected_checksum: str | None = None,
+    ) -> DownloadResult:
+        """Async variant of ``Retab.download_to``. Chunks are written to the file from the event loop."""
+        sink = DownloadSink(destination, checksum, expected_checksum)
+        resume = RangeResume()
+        try:
+            async for chunk in aiter_in_scope(self._iter_download(request, chunk_size, resume), request.timeout, request.deadline):
+                sink.write(chunk)
+        except BaseException:
+            sink.abort()
+            raise
+        return sink.finish(resume)
+
+    async def _iter_download(self, request: PreparedRequest, chunk_size: int, resume: RangeResume) -> AsyncIterator[bytes]:
+        base_kwargs = self._download_kwargs(request)
+        request_kwargs = base_kwargs
+        delivered = 0
+        reconnects = 0
+        while True:
+            response = await self._with_retries(request_kwargs, lambda: self._send(request_kwargs, stream=True), request.raise_for_status)
+            try:
+                skip = resume.skip(response, delivered)
+                async for chunk in response.aiter_bytes(chunk_size):
+                    if skip:
+                        if len(chunk) <= skip:
+                            skip -= len(chunk)
+                            continue
+                        chunk, skip = chunk[skip:], 0
+                    delivered += len(chunk)
+                    yield chunk
+                return
+            except httpx.TransportError as exc:
+                if request.raise_for_status:
+                    raise StreamInterruptedError(f"Download interrupted after {delivered} bytes: {exc}", delivered=delivered) from exc
+                reconnects += 1
+                await asyncio.sleep(self._stream_reconnect_delay(reconnects, delivered, exc, unit="bytes"))
+                request_kwargs = resume.request_kwargs(base_kwargs, delivered)
+            finally:
+                await response.aclose()
+
+    async def batch(
+        self,
+        items: Iterable[BatchItem],
+        *,
+        concurrency: int = 16,
+        on_progress: ProgressCallback | None = None,
+        stop_on_error: bool = False,
+    ) -> BatchResults[Any]:
+        """Run many calls with at most ``concurrency`` in flight and return results in input order.
+
+        Args:
+            items: ``PreparedRequest`` objects, zero-argument async callables
+                (e.g. ``functools.partial(client.extractions.create, ...)``) or awaitables
+            concurrency (int): Maximum number of items running at once. Defaults to 16
+            on_progress (Callable[[BatchProgress], None], optional): Called after every finished item
+            stop_on_error (bool): Raise ``BatchAborted`` on the first failed item instead of
+                collecting every error. Defaults to False
+
+        Returns:
+            BatchResults: One ``BatchResult`` per item, carrying either ``value`` or ``error``, plus a ``summary``
+        """
+        return await abatch(self, items, concurrency=concurrency, on_progress=on_progress, stop_on_error=stop_on_error)
+
+    def list_sharded(
+        self,
+        list_method: Callable[..., Awaitable["AsyncPaginatedList[T]"]],
+        *,
+        from_date: str | datetime.date,
+        to_date: str | datetime.date,
+        shards: int = 8,
+        max_shards: int | None = None,
+        concurrency: int = 8,
+        order: "PaginationOrder" = "desc",
+        ordered: bool = False,
+        **filters: Any,
+    ) -> AsyncIterator[T]:
+        """List every item of ``list_method`` between two dates, paging windows of the range concurrently.
+
+        See :meth:`Retab.list_sharded`; ``concurrency`` bounds the page requests in flight. Defaults to 8.
+        """
+        return aiter_sharded(
+            list_method,
+            from_date,
+            to_date,
+            shards=shards,
+            max_shards=max_shards,
+            concurrency=concurrency,
+            order=order,
+            ordered=ordered,
+            filters=filters,
+        )
+
+    def batch_as_completed(
+        self,
+        items: Iterable[BatchItem],
+        *,
+        concurrency: int = 16,
+        on_progress: ProgressCallback | None = None,
+        stop_on_error: bool = False,
+    ) -> AsyncIterator[BatchResult[Any]]:
+        """Like :meth:`batch`, but yield each ``BatchResult`` as soon as it finishes."""
+        return abatch_as_completed(self, items, concurrency=concurrency, on_progress=on_progress, stop_on_error=stop_on_error)
+
+    async def gather_prepared(
+        self,
+        requests: Iterable[PreparedRequest],
+        *,
+        concurrency: int = 16,
+        on_progress: ProgressCallback | None = None,
+        stop_on_error: bool = False,
+    ) -> BatchResults[Any]:
+        """Send ``prepare_*`` requests concurrently; results hold the raw (unvalidated) responses."""
+        return await abatch(self, requests, concurrency=concurrency, on_progress=on_progress, stop_on_error=stop_on_error)
+
     async def close(self) -> None:
         """Closes the async HTTP client session."""
         await self.client.aclose()
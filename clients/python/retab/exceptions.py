@@ -4,7 +4,7 @@ All API exceptions inherit from both :class:`APIError` and :class:`RuntimeError`
 so existing ``except RuntimeError`` blocks continue to catch them.
 """
 
-from typing import Any
+from typing import Any, Mapping
 
 
 class RetabError(Exception):
@@ -32,6 +32,7 @@ class APIError(RetabError, RuntimeError):
         request_id: str | None = None,
         method: str | None = None,
         url: str | None = None,
+        headers: Mapping[str, str] | None = None,
     ) -> None:
         self.status_code = status_code
         self.code = code
@@ -40,6 +41,7 @@ class APIError(RetabError, RuntimeError):
         self.request_id = request_id
         self.method = method
         self.url = url
+        self.headers = headers
         self.retries: int = 0
         super().__init__(message)
 
@@ -132,3 +134,52 @@ class APITimeoutError(APIConnectionError):
     """The request timed out."""
 
     pass
+
+
+class DeadlineExceededError(APITimeoutError):
+    """The call's ``timeout=`` / ``deadline=`` budget ran out before it could complete."""
+
+    pass
+
+
+class StreamInterruptedError(APIConnectionError):
+    """A streamed response dropped and could not be resumed within the retry budget.
+
+    ``delivered`` is the number of events already handed to the consumer, so
+    callers can tell how far the stream got.
+    """
+
+    def __init__(self, message: str, delivered: int) -> None:
+        self.delivered = delivered
+        super().__init__(message)
+
+
+class StreamDecodeError(RetabError):
+    """A line of a JSON stream could not be decoded."""
+
+    def __init__(self, message: str, line: str, offset: int) -> None:
+        self.line = line
+        self.offset = offset
+        super().__init__(message)
+
+
+class CircuitOpenError(RetabError):
+    """The request was not sent because the circuit breaker for its route is open.
+
+    ``route`` is the ``"<METHOD> <route template>"`` the breaker tracks and
+    ``retry_after`` the seconds until a trial request will be let through.
+    """
+
+    def __init__(self, message: str, route: str, retry_after: float) -> None:
+        self.route = route
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class ChecksumMismatchError(RetabError):
+    """A downloaded body does not match the expected checksum."""
+
+    def __init__(self, message: str, expected: str, actual: str) -> None:
+        self.expected = expected
+        self.actual = actual
+        super().__init__(message)
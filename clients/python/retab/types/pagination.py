@@ -1,6 +1,12 @@
+import asyncio
+import contextlib
+import contextvars
+import queue
+import threading
 from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Iterator, Literal, TypeAlias, TypeVar
 
 from pydantic import ConfigDict, PrivateAttr
+from retab._validation import construct
 from retab.types.base import RetabBaseModel
 
 
@@ -37,13 +43,22 @@ class PaginatedList(RetabBaseModel, Generic[T]):
     def has_more(self) -> bool:
         return self.list_metadata.after is not None
 
-    def auto_paging_iter(self) -> Iterator[T]:
-        page: PaginatedList[T] = self
-        while True:
-            yield from page.data
-            if not page.has_more or page._fetch_next_page is None:
-                break
-            page = page._fetch_next_page(after=page.list_metadata.after)
+    def auto_paging_iter(self, prefetch: int = 0) -> Iterator[T]:
+        """Iterate over the items of this page and of every page after it.
+
+        Args:
+            prefetch (int): Pages fetched ahead in a background thread while the current one is consumed, so
+                the next page is usually there when it is needed. 0 (the default) fetches each page once the
+                previous one is exhausted. At most ``prefetch`` pages are held besides the current one
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        return _iter_items(self, prefetch)
+
+    def _next_page(self) -> "PaginatedList[T] | None":
+        if not self.has_more or self._fetch_next_page is None:
+            return None
+        return self._fetch_next_page(after=self.list_metadata.after)
 
 
 class AsyncPaginatedList(RetabBaseModel, Generic[T]):
@@ -69,21 +84,188 @@ class AsyncPaginatedList(RetabBaseModel, Generic[T]):
     def has_more(self) -> bool:
         return self.list_metadata.after is not None
 
-    async def auto_paging_iter(self) -> AsyncIterator[T]:
-        page: AsyncPaginatedList[T] = self
-        while True:
+    def auto_paging_iter(self, prefetch: int = 0) -> AsyncIterator[T]:
+        """Iterate over the items of this page and of every page after it.
+
+        Args:
+            prefetch (int): Pages fetched ahead by a task while the current one is consumed, so the next page is
+                usually there when it is needed. 0 (the default) fetches each page once the previous one is
+                exhausted. At most ``prefetch`` pages are held besides the current one
+        """
+        if prefetch < 0:
+            raise ValueError("prefetch must be >= 0")
+        return _aiter_items(self, prefetch)
+
+    async def _next_page(self) -> "AsyncPaginatedList[T] | None":
+        if not self.has_more or self._fetch_next_page is None:
+            return None
+        return await self._fetch_next_page(after=self.list_metadata.after)
+
+
+PaginationOrder: TypeAlias = Literal["asc", "desc"]
+
+# End of the pages handed over by a prefetching thread or task.
+_DONE = object()
+
+
+class _Failed:
+    """A page fetch that raised, handed over to the consumer to re-raise."""
+
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def _iter_items(first: PaginatedList[T], prefetch: int) -> Iterator[T]:
+    # Started with the iteration, so the second page is fetched while the first one is consumed.
+    prefetcher = _PagePrefetcher(first, prefetch) if prefetch and first.has_more else None
+    try:
+        yield from first.data
+        for page in prefetcher if prefetcher is not None else _next_pages(first):
+            yield from page.data
+    finally:
+        if prefetcher is not None:
+            prefetcher.close()
+
+
+def _next_pages(page: PaginatedList[T]) -> Iterator[PaginatedList[T]]:
+    next_page = page._next_page()
+    while next_page is not None:
+        yield next_page
+        next_page = next_page._next_page()
+
+
+class _PagePrefetcher(Generic[T]):
+    """Iterator over the pages after ``first``, fetched by a background thread up to ``prefetch`` pages ahead."""
+
+    __slots__ = ("_pages", "_slots", "_stop", "_finished")
+
+    def __init__(self, first: PaginatedList[T], prefetch: int) -> None:
+        self._pages: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        # One slot per page fetched ahead; taken before fetching, given back when the consumer takes the page.
+        self._slots = threading.Semaphore(prefetch)
+        self._stop = threading.Event()
+        self._finished = False
+        # The thread runs in a copy of the caller's context, so the caller's deadline and hooks apply to its requests.
+        context = contextvars.copy_context()
+        threading.Thread(target=context.run, args=(self._produce, first), name="retab-page-prefetch", daemon=True).start()
+
+    def _produce(self, first: PaginatedList[T]) -> None:
+        page: PaginatedList[T] = first
+        try:
+            while True:
+                self._slots.acquire()
+                if self._stop.is_set():
+                    return
+                next_page = page._next_page()
+                if next_page is None:
+                    break
+                page = next_page
+                self._pages.put(page)
+        except BaseException as exc:
+            self._pages.put(_Failed(exc))
+            return
+        self._pages.put(_DONE)
+
+    def __iter__(self) -> "_PagePrefetcher[T]":
+        return self
+
+    def __next__(self) -> PaginatedList[T]:
+        if self._finished:
+            raise StopIteration
+        item = self._pages.get()
+        if item is _DONE or isinstance(item, _Failed):
+            self._finished = True
+            if item is _DONE:
+                raise StopIteration
+            raise item.error
+        self._slots.release()
+        return item
+
+    def close(self) -> None:
+        """Stop fetching: the thread finishes the page it is fetching, if any, and exits."""
+        self._stop.set()
+        self._slots.release()
+
+
+async def _aiter_items(first: AsyncPaginatedList[T], prefetch: int) -> AsyncIterator[T]:
+    prefetcher = _AsyncPagePrefetcher(first, prefetch) if prefetch and first.has_more else None
+    try:
+        for item in first.data:
+            yield item
+        async for page in prefetcher if prefetcher is not None else _anext_pages(first):
             for item in page.data:
                 yield item
-            if not page.has_more or page._fetch_next_page is None:
-                break
-            page = await page._fetch_next_page(after=page.list_metadata.after)
+    finally:
+        if prefetcher is not None:
+            await prefetcher.aclose()
 
 
-PaginationOrder: TypeAlias = Literal["asc", "desc"]
+async def _anext_pages(page: AsyncPaginatedList[T]) -> AsyncIterator[AsyncPaginatedList[T]]:
+    next_page = await page._next_page()
+    while next_page is not None:
+        yield next_page
+        next_page = await next_page._next_page()
+
+
+class _AsyncPagePrefetcher(Generic[T]):
+    """Async iterator over the pages after ``first``, fetched by a task up to ``prefetch`` pages ahead."""
+
+    __slots__ = ("_pages", "_slots", "_task", "_finished")
+
+    def __init__(self, first: AsyncPaginatedList[T], prefetch: int) -> None:
+        self._pages: asyncio.Queue[Any] = asyncio.Queue()
+        self._slots = asyncio.Semaphore(prefetch)
+        self._finished = False
+        self._task = asyncio.ensure_future(self._produce(first))
+
+    async def _produce(self, first: AsyncPaginatedList[T]) -> None:
+        page: AsyncPaginatedList[T] = first
+        end: Any = _DONE
+        try:
+            while True:
+                await self._slots.acquire()
+                next_page = await page._next_page()
+                if next_page is None:
+                    break
+                page = next_page
+                self._pages.put_nowait(page)
+        except Exception as exc:
+            end = _Failed(exc)
+        except BaseException as exc:
+            # Cancelled by something other than aclose(): the consumer re-raises it instead of waiting forever.
+            end = _Failed(exc)
+            raise
+        finally:
+            self._pages.put_nowait(end)
+
+    def __aiter__(self) -> "_AsyncPagePrefetcher[T]":
+        return self
+
+    async def __anext__(self) -> AsyncPaginatedList[T]:
+        if self._finished:
+            raise StopAsyncIteration
+        item = await self._pages.get()
+        if item is _DONE or isinstance(item, _Failed):
+            self._finished = True
+            if item is _DONE:
+                raise StopAsyncIteration
+            raise item.error
+        self._slots.release()
+        return item
+
+    async def aclose(self) -> None:
+        """Stop fetching, cancelling the page fetch in progress if any."""
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
 
 
-def _validate_page_items(raw_items: Any, model: type[Any]) -> list[Any]:
+def _validate_page_items(raw_items: Any, model: type[Any], validate: bool = True) -> list[Any]:
     validator = getattr(model, "model_validate", None)
     if validator is None:
         return list(raw_items)
+    if not validate:
+        return [construct(model, item) for item in raw_items]
     return [validator(item) if isinstance(item, dict) else item for item in raw_items]
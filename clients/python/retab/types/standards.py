@@ -1,3 +1,4 @@
+from datetime import datetime
 from enum import Enum
 from typing import Any, List, Literal, Optional, Tuple, TypeVar
 from typing_extensions import TypedDict
@@ -40,15 +41,84 @@ class DocumentPreprocessResponseContent(RetabBaseModel):
     json_schema: dict[str, Any] = Field(..., description="Generated JSON Schema for Structured Output OpenAI Completions")
 
 
-class PreparedRequest(RetabBaseModel):
-    method: Literal["POST", "GET", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "CONNECT", "TRACE"]
-    url: str
-    data: Any = None
-    params: dict | None = None
-    form_data: dict | None = None
-    files: dict | List[Tuple[str, Tuple[str, bytes, str]]] | None = None
-    idempotency_key: str | None = None
-    raise_for_status: bool = False
+HTTPMethod = Literal["POST", "GET", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS", "CONNECT", "TRACE"]
+
+_PREPARED_REQUEST_FIELDS = ("method", "url", "data", "params", "form_data", "files", "idempotency_key", "raise_for_status", "timeout", "deadline")
+
+
+class PreparedRequest:
+    """A request built by a resource's ``prepare_*`` method, ready to be sent by the client.
+
+    A plain ``__slots__`` class rather than a pydantic model: every resource call builds one from
+    values the ``prepare_*`` method already produced, so validating them again only cost CPU on
+    small, chatty calls. ``model_dump`` / ``model_copy`` are kept for code written against the
+    former pydantic model.
+    """
+
+    __slots__ = _PREPARED_REQUEST_FIELDS
+
+    def __init__(
+        self,
+        *,
+        method: HTTPMethod,
+        url: str,
+        data: Any = None,
+        params: dict | None = None,
+        form_data: dict | None = None,
+        files: dict | List[Tuple[str, Tuple[str, bytes, str]]] | None = None,
+        idempotency_key: str | None = None,
+        raise_for_status: bool = False,
+        # Per-call budget: seconds from when the request is run, and/or an absolute time.time() timestamp or datetime.
+        timeout: float | None = None,
+        deadline: float | datetime | None = None,
+    ) -> None:
+        self.method = method
+        self.url = url
+        self.data = data
+        self.params = params
+        self.form_data = form_data
+        self.files = files
+        self.idempotency_key = idempotency_key
+        self.raise_for_status = raise_for_status
+        self.timeout = timeout
+        self.deadline = deadline
+
+    def model_dump(
+        self,
+        *,
+        mode: str = "python",
+        include: set[str] | None = None,
+        exclude: set[str] | None = None,
+        exclude_none: bool = False,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Return the fields as a dict, like the pydantic model did.
+
+        ``include``, ``exclude`` and ``exclude_none`` select fields, and ``mode="json"`` turns a datetime
+        ``deadline`` into an ISO 8601 string. The other keyword arguments of pydantic's ``model_dump``
+        (``by_alias``, ``exclude_unset``, ...) are accepted and change nothing for these plain fields.
+        """
+        dumped: dict[str, Any] = {}
+        for name in _PREPARED_REQUEST_FIELDS:
+            value = getattr(self, name)
+            if (include is not None and name not in include) or (exclude is not None and name in exclude) or (exclude_none and value is None):
+                continue
+            dumped[name] = value.isoformat() if mode == "json" and isinstance(value, datetime) else value
+        return dumped
+
+    def model_copy(self, update: dict[str, Any] | None = None) -> "PreparedRequest":
+        return PreparedRequest(**{**self.model_dump(), **(update or {})})
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PreparedRequest):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in _PREPARED_REQUEST_FIELDS)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={value!r}" for name in _PREPARED_REQUEST_FIELDS if (value := getattr(self, name)) is not None and value is not False)
+        return f"PreparedRequest({fields})"
 
 
 class DeleteResponse(TypedDict):
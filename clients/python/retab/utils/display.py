@@ -6,13 +6,15 @@ from pathlib import Path
 from typing import List, Literal, Optional
 from typing_extensions import TypedDict
 
+import httpx
 import numpy as np
-import requests
 import tiktoken  # For text tokenization
 from PIL import Image
 from rich.console import Console
 from rich.table import Table
 
+from .._tls import ssl_context
+
 
 class TokenStats(TypedDict):
     min: float
@@ -75,8 +77,8 @@ def count_image_tokens(image_url: str, detail: Literal["low", "high", "auto"] =
                 image_data = base64.b64decode(encoded_data)
                 img = Image.open(BytesIO(image_data))
             else:
-                # HTTP URL or local path
-                response = requests.get(image_url, timeout=5)
+                # HTTP URL or local path; verified against the OS trust store like the clients
+                response = httpx.get(image_url, timeout=5, follow_redirects=True, verify=ssl_context())
                 response.raise_for_status()
                 img = Image.open(BytesIO(response.content))
 
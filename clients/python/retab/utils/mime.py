@@ -1,16 +1,23 @@
+from __future__ import annotations
+
 import base64
 import hashlib
 import io
 import mimetypes
+import sys
 from pathlib import Path
-from typing import Sequence, TypeVar, get_args
+from typing import TYPE_CHECKING, Sequence, TypeVar, get_args
 from urllib.parse import unquote_to_bytes
 
 import httpx
-import PIL.Image
-import puremagic
 from pydantic import HttpUrl
 
+if TYPE_CHECKING:
+    # PIL and puremagic are imported on use: they are only needed for image inputs and byte sniffing.
+    import PIL.Image
+
+from .._hooks import phase
+from .._tls import ssl_context
 from ..types.mime import MIMEData
 from typing import Literal
 
@@ -109,11 +116,30 @@ def convert_mime_data_to_pil_image(mime_data: MIMEData) -> PIL.Image.Image:
     image_bytes = base64.b64decode(mime_data.content)
 
     # Create PIL Image from bytes
+    import PIL.Image
+
     image = PIL.Image.open(io.BytesIO(image_bytes))
 
     return image
 
 
+def _is_pil_image(value: object) -> bool:
+    # An object can only be a PIL image if the caller already imported PIL.
+    image_module = sys.modules.get("PIL.Image")
+    return image_module is not None and isinstance(value, image_module.Image)
+
+
+def _sniff_extension(data: bytes) -> str:
+    """Guess a file extension from the leading bytes, ``.txt`` when unknown."""
+    import puremagic
+
+    try:
+        extension = puremagic.from_string(data)
+    except Exception:
+        return ".txt"
+    return ".jpeg" if extension.lower() in [".jpg", ".jpeg", ".jfif"] else extension
+
+
 def _is_https_url_string(value: object) -> bool:
     return isinstance(value, str) and value.startswith("https://")
 
@@ -179,9 +205,15 @@ def prepare_mime_document(document: Path | str | bytes | io.IOBase | MIMEData |
     Returns:
         A MIMEData object
     """
+    # Timed as a phase of the current SDK call when the client has lifecycle hooks.
+    with phase("prepare_mime_document"):
+        return _prepare_mime_document(document)
+
+
+def _prepare_mime_document(document: Path | str | bytes | io.IOBase | MIMEData | PIL.Image.Image | HttpUrl) -> MIMEData:
     # Check if document is a HttpUrl (Pydantic type)
 
-    if isinstance(document, PIL.Image.Image):
+    if _is_pil_image(document):
         return convert_pil_image_to_mime_data(document)
 
     if isinstance(document, MIMEData):
@@ -203,12 +235,7 @@ def prepare_mime_document(document: Path | str | bytes | io.IOBase | MIMEData |
 
     if isinstance(document, bytes):
         # `document` is already the raw bytes
-        try:
-            extension = puremagic.from_string(document)
-            if extension.lower() in [".jpg", ".jpeg", ".jfif"]:
-                extension = ".jpeg"
-        except Exception:
-            extension = ".txt"
+        extension = _sniff_extension(document)
         file_bytes = document
         filename = "uploaded_file" + extension
     elif isinstance(document, io.IOBase):
@@ -220,24 +247,13 @@ def prepare_mime_document(document: Path | str | bytes | io.IOBase | MIMEData |
             # A bare stream (e.g. io.BytesIO) carries no usable extension; sniff
             # the bytes the same way the `bytes` branch does so validation does
             # not reject a valid document just because the stream had no name.
-            try:
-                sniffed = puremagic.from_string(file_bytes)
-                if sniffed.lower() in [".jpg", ".jpeg", ".jfif"]:
-                    sniffed = ".jpeg"
-            except Exception:
-                sniffed = ".txt"
-            filename = filename + sniffed
+            filename = filename + _sniff_extension(file_bytes)
     elif hasattr(document, "unicode_string") and callable(getattr(document, "unicode_string")):
-        with httpx.Client() as client:
+        with httpx.Client(verify=ssl_context()) as client:
             url: str = document.unicode_string()  # type: ignore
             response = client.get(url)
             response.raise_for_status()
-            try:
-                extension = puremagic.from_string(response.content)
-                if extension.lower() in [".jpg", ".jpeg", ".jfif"]:
-                    extension = ".jpeg"
-            except Exception:
-                extension = ".txt"
+            extension = _sniff_extension(response.content)
             file_bytes = response.content  # Fix: Use response.content instead of document
             filename = "uploaded_file" + extension
     else:
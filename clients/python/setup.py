@@ -43,6 +43,7 @@ setup(
     packages=find_packages(),
     python_requires=">=3.11",
     install_requires=requirements_list,
+    extras_require={"http2": ["h2>=3,<5"], "speedups": ["orjson>=3.9"], "compression": ["brotli>=1.1", "zstandard>=0.18"], "otel": ["opentelemetry-api>=1.20"]},
     include_package_data=True,
     package_data={"retab": ["**/*.yaml"]},
 )
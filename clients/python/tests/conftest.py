@@ -13,7 +13,9 @@ import pytest_asyncio
 
 os.environ["EMAIL_DOMAIN"] = "mailbox.retab.com"
 from enum import Enum
-from typing import AsyncGenerator, Generator
+from typing import AsyncGenerator, Callable, Generator
+
+import httpx
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
@@ -23,8 +25,12 @@ TEST_DIR = os.path.dirname(os.path.abspath(__file__))
 SDK_ROOT = os.path.dirname(TEST_DIR)
 if SDK_ROOT not in sys.path:
     sys.path.insert(0, SDK_ROOT)
+# The benchmarks next to the tests are smoke-tested by the unit tests.
+BENCHMARKS_DIR = os.path.join(SDK_ROOT, "benchmarks")
+if BENCHMARKS_DIR not in sys.path:
+    sys.path.insert(0, BENCHMARKS_DIR)
 
-from retab import AsyncRetab, Retab  # noqa: E402
+from retab import AsyncRetab, Retab, RetryPolicy  # noqa: E402
 
 
 def pytest_addoption(parser: pytest.Parser) -> None:
@@ -202,6 +208,52 @@ async def async_client(api_keys: EnvConfig) -> AsyncGenerator[AsyncRetab, None]:
         await client.close()
 
 
+SCRIPTED_EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_abc", "filename": "doc.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object", "properties": {}},
+    "output": {"total": 100},
+}
+
+ScriptedClient = Callable[..., Retab]
+
+
+@pytest.fixture
+def scripted_client() -> ScriptedClient:
+    """Return a factory of offline `Retab` clients answering every request from a script.
+
+    ``scripted_client(statuses, seen, body=..., headers=..., **client_kwargs)``: each request is answered
+    with the next status of ``statuses`` (a list consumed in order, a function of the request, or None for
+    200 every time), with ``body`` as JSON (an extraction by default) and ``headers`` plus an
+    ``x-request-id`` of ``req_<statuses left>``. Requests are appended to ``seen`` when it is given.
+    Retries do not back off unless ``retry_policy`` is passed.
+    """
+
+    def build(
+        statuses: list[int] | Callable[[httpx.Request], int] | None = None,
+        seen: list[httpx.Request] | None = None,
+        *,
+        body: Any = None,
+        headers: dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> Retab:
+        def handler(request: httpx.Request) -> httpx.Response:
+            if seen is not None:
+                seen.append(request)
+            if statuses is None or callable(statuses):
+                status, request_id = (200 if statuses is None else statuses(request)), "req_0"
+            else:
+                status = statuses.pop(0)
+                request_id = f"req_{len(statuses)}"
+            return httpx.Response(status, headers={"x-request-id": request_id, **(headers or {})}, json=SCRIPTED_EXTRACTION if body is None else body)
+
+        kwargs.setdefault("retry_policy", RetryPolicy(initial_delay=0.0, jitter=0.0))
+        return Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), **kwargs)
+
+    return build
+
+
 @pytest.fixture(scope="session")
 def test_data_dir() -> str:
     """Return the path to the test data directory"""
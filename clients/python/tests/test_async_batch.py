@@ -0,0 +1,117 @@
+"""Unit tests for the concurrency-bounded `AsyncRetab.batch` executor."""
+
+import asyncio
+import functools
+from typing import Any
+
+import pytest
+
+from retab import BatchAborted, BatchProgress
+from retab.exceptions import NotFoundError
+from retab.types.standards import PreparedRequest
+from mocks import mock_async_retab
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def _prepared(i: int) -> PreparedRequest:
+    return PreparedRequest(method="GET", url=f"/v1/extractions/extr_{i}")
+
+
+@pytest.mark.asyncio
+async def test_gather_prepared_returns_input_order() -> None:
+    client, rec = mock_async_retab(lambda req: {"url": req.url})
+    results = await client.gather_prepared([_prepared(i) for i in range(20)], concurrency=4)
+    assert [r.index for r in results] == list(range(20))
+    assert [r.unwrap() for r in results] == [{"url": f"/v1/extractions/extr_{i}"} for i in range(20)]
+    assert len(rec.requests) == 20
+
+
+@pytest.mark.asyncio
+async def test_batch_collects_per_item_errors() -> None:
+    def responder(req: PreparedRequest) -> Any:
+        if req.url.endswith("_3"):
+            raise NotFoundError("missing", status_code=404)
+        return {"url": req.url}
+
+    client, _ = mock_async_retab(responder)
+    results = await client.batch([_prepared(i) for i in range(6)])
+    assert [r.ok for r in results] == [True, True, True, False, True, True]
+    assert isinstance(results[3].error, NotFoundError)
+    with pytest.raises(NotFoundError):
+        results[3].unwrap()
+
+
+@pytest.mark.asyncio
+async def test_batch_bounds_concurrency() -> None:
+    client, _ = mock_async_retab()
+    running = 0
+    peak = 0
+
+    async def call(i: int) -> int:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return i
+
+    results = await client.batch((functools.partial(call, i) for i in range(30)), concurrency=5)
+    assert [r.value for r in results] == list(range(30))
+    assert peak == 5
+
+
+@pytest.mark.asyncio
+async def test_batch_as_completed_yields_fastest_first_and_reports_progress() -> None:
+    client, _ = mock_async_retab()
+    snapshots: list[tuple[int, int, int | None]] = []
+
+    async def call(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    def on_progress(progress: BatchProgress) -> None:
+        snapshots.append((progress.completed, progress.failed, progress.total))
+
+    items = [functools.partial(call, d) for d in (0.05, 0.0, 0.02)]
+    order = [r.index async for r in client.batch_as_completed(items, concurrency=3, on_progress=on_progress)]
+    assert order == [1, 2, 0]
+    assert snapshots == [(1, 0, 3), (2, 0, 3), (3, 0, 3)]
+
+
+@pytest.mark.asyncio
+async def test_batch_accepts_awaitables() -> None:
+    client, _ = mock_async_retab()
+
+    async def value(i: int) -> int:
+        return i * 2
+
+    results = await client.batch([value(i) for i in range(3)])
+    assert [r.value for r in results] == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_stop_on_error_aborts_batch() -> None:
+    client, _ = mock_async_retab()
+    started: list[int] = []
+
+    async def call(i: int) -> int:
+        started.append(i)
+        if i == 2:
+            raise ValueError("boom")
+        await asyncio.sleep(0)
+        return i
+
+    with pytest.raises(BatchAborted) as exc_info:
+        await client.batch((functools.partial(call, i) for i in range(100)), concurrency=2, stop_on_error=True)
+    assert exc_info.value.result.index == 2
+    assert isinstance(exc_info.value.__cause__, ValueError)
+    assert len(started) < 100
+
+
+@pytest.mark.asyncio
+async def test_batch_rejects_invalid_items_per_item() -> None:
+    client, _ = mock_async_retab()
+    results = await client.batch([object()])  # type: ignore[list-item]
+    assert isinstance(results[0].error, TypeError)
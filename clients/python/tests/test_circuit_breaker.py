@@ -0,0 +1,146 @@
+"""Unit tests for the per-route circuit breaker."""
+
+from typing import Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, CircuitBreaker, CircuitOpenError, Retab, RetryPolicy
+from retab.exceptions import DeadlineExceededError, InternalServerError, NotFoundError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+SPLITS = "POST /v1/splits"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
+def _splits_degraded(request: httpx.Request) -> int:
+    """``POST /v1/splits`` is down, every other route answers."""
+    return 500 if request.url.path == "/v1/splits" else 200
+
+
+RETRY = RetryPolicy(max_retries=2, initial_delay=0.0, jitter=0.0)
+
+
+def test_failing_route_opens_and_fails_fast_while_others_flow(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    transitions: list[tuple[str, str, str]] = []
+    breaker = CircuitBreaker(failure_threshold=3, recovery_timeout=60.0, on_state_change=lambda *change: transitions.append(change))
+    client = scripted_client(_splits_degraded, seen, circuit_breaker=breaker, retry_policy=RETRY)
+
+    with pytest.raises(InternalServerError):
+        client._request("POST", "/v1/splits", data={})
+    assert len(seen) == 3 and breaker.state(SPLITS) == "open"
+    assert transitions == [(SPLITS, "closed", "open")]
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        client._request("POST", "/v1/splits", data={})
+    assert len(seen) == 3
+    assert excinfo.value.route == SPLITS and 0 < excinfo.value.retry_after <= 60.0
+
+    assert client.extractions.get("extr_1").id == "extr_1"
+    assert breaker.states() == {SPLITS: "open"}
+
+
+def test_half_open_trial_closes_or_reopens(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("retab._circuit.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+    route = "GET /v1/extractions/{id}"
+
+    breaker.before_request(route)
+    breaker.record(route, InternalServerError("boom", status_code=500))
+    assert breaker.state(route) == "open"
+    now[0] += 10.0
+    assert breaker.state(route) == "half_open"
+
+    breaker.before_request(route)
+    # Only one trial at a time while half-open.
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request(route)
+    breaker.record(route, InternalServerError("still down", status_code=503))
+    assert breaker.state(route) == "open"
+
+    now[0] += 10.0
+    breaker.before_request(route)
+    # A 4xx proves the route is up.
+    breaker.record(route, NotFoundError("missing", status_code=404))
+    assert breaker.state(route) == "closed"
+
+
+def test_cancelled_trial_frees_the_slot(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [0.0]
+    monkeypatch.setattr("retab._circuit.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1.0)
+    route = "GET /v1/files/{id}"
+    breaker.record(route, InternalServerError("boom", status_code=500))
+    now[0] = 5.0
+    breaker.before_request(route)
+    breaker.record(route, KeyboardInterrupt())
+    breaker.before_request(route)
+    assert breaker.state(route) == "half_open"
+
+
+def test_spent_call_budgets_do_not_open_the_circuit(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    breaker = CircuitBreaker(failure_threshold=1)
+    with scripted_client(_splits_degraded, seen, circuit_breaker=breaker, retry_policy=RETRY) as client:
+        for _ in range(3):
+            with pytest.raises(DeadlineExceededError):
+                client.extractions.get("extr_1", timeout=0)
+        assert client.extractions.get("extr_1").id == "extr_1"
+    assert [request.url.path for request in seen] == ["/v1/extractions/extr_1"]
+    assert breaker.states() == {}
+
+
+def test_dropped_connections_open_the_circuit() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.RemoteProtocolError("Server disconnected without sending a response.", request=request)
+
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60.0)
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), circuit_breaker=breaker, max_retries=0) as client:
+        for _ in range(2):
+            with pytest.raises(httpx.RemoteProtocolError):
+                client.extractions.get("extr_1")
+        with pytest.raises(CircuitOpenError):
+            client.extractions.get("extr_1")
+    assert calls == 2
+    assert breaker.states() == {"GET /v1/extractions/{id}": "open"}
+
+
+def test_successes_reset_the_failure_count() -> None:
+    breaker = CircuitBreaker(failure_threshold=2)
+    for _ in range(5):
+        breaker.record(SPLITS, InternalServerError("boom", status_code=500))
+        breaker.record(SPLITS, None)
+    assert breaker.state(SPLITS) == "closed"
+    breaker.reset()
+    assert breaker.states() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_client_fails_fast_when_open() -> None:
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503, json={"detail": "down"})
+
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60.0)
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), circuit_breaker=breaker, max_retries=0)
+    with pytest.raises(InternalServerError):
+        await client._request("GET", "/v1/extractions/extr_1")
+    with pytest.raises(CircuitOpenError):
+        await client.extractions.get("extr_1")
+    assert calls == 1
+    await client.close()
@@ -0,0 +1,71 @@
+"""Unit tests for the client's connection-pool / transport configuration."""
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab
+from retab.client import DEFAULT_CONNECTION_LIMITS
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def _json_handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"path": request.url.path})
+
+
+def test_default_pool_limits_and_timeout() -> None:
+    client = Retab(api_key="sk_test_dummy", base_url="https://api.retab.com")
+    pool = client.client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == DEFAULT_CONNECTION_LIMITS.max_connections
+    assert pool._max_keepalive_connections == DEFAULT_CONNECTION_LIMITS.max_keepalive_connections
+    assert pool._keepalive_expiry == DEFAULT_CONNECTION_LIMITS.keepalive_expiry
+    assert client.client.timeout == httpx.Timeout(1800.0)
+    client.close()
+
+
+def test_custom_limits_and_split_timeouts() -> None:
+    timeout = httpx.Timeout(connect=2.0, read=60.0, write=10.0, pool=1.0)
+    limits = httpx.Limits(max_connections=500, max_keepalive_connections=500, keepalive_expiry=90.0)
+    client = Retab(api_key="sk_test_dummy", timeout=timeout, limits=limits)
+    pool = client.client._transport._pool  # type: ignore[attr-defined]
+    assert pool._max_connections == 500
+    assert pool._keepalive_expiry == 90.0
+    assert client.client.timeout == timeout
+    client.close()
+
+
+def test_shared_sync_transport_is_not_closed_by_clients() -> None:
+    transport = httpx.MockTransport(_json_handler)
+    first = Retab(api_key="sk_test_dummy", base_url="https://api.retab.com", transport=transport)
+    second = Retab(api_key="sk_test_dummy", base_url="https://api.retab.com", transport=transport)
+
+    assert first._request("GET", "/v1/files") == {"path": "/v1/files"}
+    first.close()
+    # The caller owns the shared transport: closing one client must not break the other.
+    assert second._request("GET", "/v1/extractions") == {"path": "/v1/extractions"}
+    second.close()
+
+
+@pytest.mark.asyncio
+async def test_shared_async_transport_is_not_closed_by_clients() -> None:
+    transport = httpx.MockTransport(_json_handler)
+    first = AsyncRetab(api_key="sk_test_dummy", base_url="https://api.retab.com", transport=transport)
+    second = AsyncRetab(api_key="sk_test_dummy", base_url="https://api.retab.com", transport=transport)
+
+    assert await first._request("GET", "/v1/files") == {"path": "/v1/files"}
+    await first.close()
+    assert await second._request("GET", "/v1/parses") == {"path": "/v1/parses"}
+    await second.close()
+
+
+def test_http2_requires_h2_package() -> None:
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        with pytest.raises(ImportError):
+            Retab(api_key="sk_test_dummy", http2=True)
+    else:
+        client = Retab(api_key="sk_test_dummy", http2=True)
+        assert client.client._transport._pool._http2 is True  # type: ignore[attr-defined]
+        client.close()
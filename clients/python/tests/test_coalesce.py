@@ -0,0 +1,111 @@
+"""Unit tests for single-flight coalescing of identical concurrent GETs."""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab
+from retab.exceptions import NotFoundError
+from retab.types.files import FileLink
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+LINK = {"download_url": "https://storage.example.com/file_1?sig=abc", "expires_in": "1h", "filename": "invoice.pdf"}
+
+
+def _async_client(seen: list[httpx.Request], status: int = 200, **kwargs) -> AsyncRetab:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(status, json=LINK if status == 200 else {"detail": "File not found"})
+
+    return AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_gets_share_one_request() -> None:
+    seen: list[httpx.Request] = []
+    # Without the link cache, so every round below reaches the network layer.
+    client = _async_client(seen, file_link_cache=False)
+    links = await asyncio.gather(*(client.files.get_download_link("file_1") for _ in range(50)))
+    assert len(seen) == 1
+    assert all(type(link) is FileLink and link.download_url == LINK["download_url"] for link in links)
+    await asyncio.gather(client.files.get_download_link("file_1"), client.files.get_download_link("file_2"))
+    await asyncio.gather(*(client.files.get_download_link("file_1", timeout=60) for _ in range(2)))
+    await client.close()
+    assert len(seen) == 5
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_coalescing_can_be_disabled() -> None:
+    seen: list[httpx.Request] = []
+    client = _async_client(seen, status=404)
+    results = await asyncio.gather(*(client.files.get_download_link("file_1") for _ in range(5)), return_exceptions=True)
+    assert len(seen) == 1 and all(isinstance(result, NotFoundError) for result in results)
+    await client.close()
+
+    seen.clear()
+    client = _async_client(seen, coalesce_requests=False)
+    await asyncio.gather(*(client.files.get_download_link("file_1") for _ in range(3)))
+    await client.close()
+    assert len(seen) == 3
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_fail_the_others() -> None:
+    seen: list[httpx.Request] = []
+    client = _async_client(seen)
+    first = asyncio.ensure_future(client._request("GET", "/v1/files/file_1/download-link"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(client._request("GET", "/v1/files/file_1/download-link"))
+    await asyncio.sleep(0)
+    first.cancel()
+    assert await second == LINK
+    await client.close()
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_gets_issued_after_a_mutation_do_not_join_earlier_reads() -> None:
+    seen: list[httpx.Request] = []
+    client = _async_client(seen)
+    link = "/v1/files/file_1/download-link"
+    before = [asyncio.ensure_future(client._request("GET", link)) for _ in range(2)]
+    await asyncio.sleep(0)
+    other = asyncio.ensure_future(client._request("POST", "/v1/extractions", data={}))
+    await asyncio.sleep(0)
+    # A write of another resource does not matter.
+    before.append(asyncio.ensure_future(client._request("GET", link)))
+    await asyncio.sleep(0)
+    write = asyncio.ensure_future(client._request("POST", "/v1/files/upload", data={}))
+    await asyncio.sleep(0)
+    after = [asyncio.ensure_future(client._request("GET", link)) for _ in range(2)]
+    await asyncio.gather(*before, other, write, *after)
+    await client.close()
+    assert [request.method for request in seen] == ["GET", "POST", "POST", "GET"]
+
+
+def test_threads_of_the_sync_client_share_one_request() -> None:
+    entered, release = threading.Event(), threading.Event()
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        entered.set()
+        release.wait(5)
+        return httpx.Response(200, json=LINK)
+
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler)) as client, ThreadPoolExecutor(8) as pool:
+        first = pool.submit(client.files.get_download_link, "file_1")
+        entered.wait(5)
+        others = [pool.submit(client.files.get_download_link, "file_1") for _ in range(7)]
+        time.sleep(0.05)
+        release.set()
+        links = [future.result() for future in (first, *others)]
+    assert len(seen) == 1
+    assert all(link == links[0] for link in links) and links[0] is not links[1]
@@ -0,0 +1,83 @@
+"""Unit tests for opt-in request body compression and response encoding negotiation."""
+
+import gzip
+import json
+from typing import Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab, RetryPolicy
+from retab._compression import get_compressor
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+OK = {"ok": True}
+LARGE = {"document": {"filename": "a.pdf", "url": "data:application/pdf;base64," + "QUJDRA==" * 20_000}}
+
+
+def test_large_bodies_are_gzipped_once_across_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    bodies: list[bytes] = []
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["content-encoding"] == "gzip"
+        assert request.headers["content-length"] == str(len(request.content))
+        bodies.append(request.content)
+        return httpx.Response(statuses.pop(0), json={"ok": True})
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), compression="gzip", retry_policy=RetryPolicy(initial_delay=0.0))
+    assert client._request("POST", "/v1/extractions", data=LARGE) == {"ok": True}
+    assert len(bodies) == 2 and bodies[0] == bodies[1]
+    assert json.loads(gzip.decompress(bodies[0])) == LARGE
+    assert len(bodies[0]) < len(json.dumps(LARGE)) // 10
+
+
+def test_small_bodies_and_default_client_are_not_compressed(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    scripted_client(seen=seen, body=OK, compression="gzip")._request("POST", "/v1/extractions", data={"x": 1})
+    scripted_client(seen=seen, body=OK)._request("POST", "/v1/extractions", data=LARGE)
+    assert all("content-encoding" not in request.headers for request in seen)
+    assert json.loads(seen[1].content) == LARGE
+
+
+def test_incompressible_bodies_are_sent_uncompressed(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    scripted_client(seen=seen, body=OK, compression="gzip", compression_threshold=0)._request("POST", "/v1/extractions", data={"x": 1})
+    assert "content-encoding" not in seen[0].headers
+    assert seen[0].content == b'{"x":1}'
+
+
+def test_responses_advertise_supported_encodings(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    scripted_client(seen=seen, body=OK)._request("GET", "/v1/files")
+    assert "gzip" in seen[0].headers["accept-encoding"]
+
+
+def test_unknown_or_unavailable_encodings_fail_at_construction() -> None:
+    with pytest.raises(ValueError):
+        Retab(api_key="sk_test_dummy", compression="lz4")
+    try:
+        compress = get_compressor("zstd")
+    except ImportError:
+        with pytest.raises(ImportError):
+            Retab(api_key="sk_test_dummy", compression="zstd")
+    else:
+        assert compress(b"a" * 1000) != b"a" * 1000
+
+
+@pytest.mark.asyncio
+async def test_async_client_compresses_large_bodies() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), compression="gzip")
+    assert await client._request("POST", "/v1/extractions", data=LARGE) == {"ok": True}
+    assert seen[0].headers["content-encoding"] == "gzip"
+    assert json.loads(gzip.decompress(seen[0].content)) == LARGE
+    await client.close()
@@ -0,0 +1,146 @@
+"""Unit tests for per-call deadlines (``timeout=`` / ``deadline=``)."""
+
+import asyncio
+import inspect
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, DeadlineExceededError, Retab, RetryPolicy
+from retab._deadline import deadline_scope, remaining
+from retab.exceptions import InternalServerError
+from retab.types.standards import PreparedRequest
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_abc", "filename": "doc.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object", "properties": {}},
+    "output": {"total": 100},
+}
+RETRY_AFTER = {"retry-after": "5"}
+RETRY = RetryPolicy(jitter=0.0)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    slept: list[float] = []
+    monkeypatch.setattr("time.sleep", slept.append)
+    return slept
+
+
+def test_scopes_only_tighten() -> None:
+    assert remaining() is None
+    with deadline_scope(timeout=1.0):
+        with deadline_scope(timeout=60.0):
+            budget = remaining()
+            assert budget is not None and budget <= 1.0
+        with deadline_scope(deadline=datetime.now(timezone.utc) + timedelta(seconds=0.5)):
+            budget = remaining()
+            assert budget is not None and budget <= 0.5
+    assert remaining() is None
+
+
+def test_retry_is_skipped_when_backoff_does_not_fit(sleeps: list[float], scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([503, 200], seen, headers=RETRY_AFTER, retry_policy=RETRY)
+    with pytest.raises(InternalServerError):
+        client.extractions.get("extr_1", timeout=2.0)
+    assert len(seen) == 1 and sleeps == []
+
+    assert client.extractions.get("extr_1").id == "extr_1"
+    assert len(seen) == 2
+
+
+def test_retry_runs_when_it_fits_and_attempt_timeouts_are_clamped(sleeps: list[float], scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([503, 200], seen, headers=RETRY_AFTER, retry_policy=RETRY)
+    assert client.extractions.get("extr_1", timeout=30.0).id == "extr_1"
+    assert sleeps == [5.0]
+    assert all(0 < request.extensions["timeout"]["read"] <= 30.0 for request in seen)
+
+
+def test_prepared_request_carries_its_budget(sleeps: list[float], scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([200, 200], seen, headers=RETRY_AFTER, retry_policy=RETRY)
+    client._prepared_request(PreparedRequest(method="GET", url="/v1/extractions/extr_1", timeout=3.0))
+    client._prepared_request(PreparedRequest(method="GET", url="/v1/extractions/extr_1"))
+    assert seen[0].extensions["timeout"]["read"] <= 3.0
+    assert seen[1].extensions["timeout"]["read"] == 1800.0
+
+
+def test_streamed_prepared_requests_keep_their_budget() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.url.path == "/v1/extractions":
+            after = request.url.params.get("after")
+            page = {"data": [] if after else [EXTRACTION], "list_metadata": {"after": None if after else "extr_1"}}
+            return httpx.Response(200, json=page)
+        return httpx.Response(200, content=b'{"n": 1}\n{"n": 2}\n', headers={"content-type": "application/x-ndjson"})
+
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler)) as client:
+        for item in client._prepared_request_stream(PreparedRequest(method="POST", url="/v1/extractions/stream", data={}, timeout=3.0)):
+            # The budget covers producing each item, not the consumer's code in between.
+            assert remaining() is None
+        assert [extraction.id for extraction in client.extractions.iter_items(client.extractions.list, timeout=3.0)] == ["extr_1"]
+        assert b"".join(client.iter_bytes(PreparedRequest(method="GET", url="/v1/files/file_1/download", timeout=3.0)))
+    assert len(seen) == 4 and all(request.extensions["timeout"]["read"] <= 3.0 for request in seen)
+
+
+def test_call_options_are_in_signatures_and_prepared_requests(sleeps: list[float], scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([200], seen, headers=RETRY_AFTER, retry_policy=RETRY)
+    parameters = inspect.signature(client.extractions.get).parameters
+    assert [name for name in parameters if parameters[name].kind is inspect.Parameter.KEYWORD_ONLY] == ["timeout", "deadline", "validate_response"]
+    assert "validate_response (bool, optional)" in (client.extractions.get.__doc__ or "")
+    assert "validate_response" not in inspect.signature(client.extractions.prepare_get).parameters
+    request = client.extractions.prepare_get("extr_1", timeout=3.0)
+    # A budget, not a query parameter of the request.
+    assert request.timeout == 3.0 and request.deadline is None and request.params == {"include_output": True}
+    client._prepared_request(request)
+    assert seen[0].extensions["timeout"]["read"] <= 3.0
+
+
+def test_spent_budget_fails_before_sending(sleeps: list[float], scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([200], seen, headers=RETRY_AFTER, retry_policy=RETRY)
+    with pytest.raises(DeadlineExceededError):
+        client.extractions.get("extr_1", deadline=time.time() - 1)
+    assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_async_attempt_is_cut_at_the_deadline() -> None:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler))
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError):
+        await client.extractions.get("extr_1", timeout=0.05)
+    assert time.monotonic() - started < 1.0
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_streamed_prepared_requests_keep_their_budget() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, content=b'{"n": 1}\n{"n": 2}\n', headers={"content-type": "application/x-ndjson"})
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler))
+    items = [item async for item in client._prepared_request_stream(PreparedRequest(method="POST", url="/v1/extractions/stream", data={}, timeout=3.0))]
+    assert items == [{"n": 1}, {"n": 2}]
+    assert seen[0].extensions["timeout"]["read"] <= 3.0
+    await client.close()
@@ -0,0 +1,110 @@
+"""Unit tests for streaming downloads (`iter_bytes`, `download_to`) and Range resume."""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, ChecksumMismatchError, Retab, StreamInterruptedError
+from retab.types.standards import PreparedRequest
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+BODY = bytes(range(256)) * 400  # 100 KiB
+REQUEST = PreparedRequest(method="GET", url="/v1/tables/tbl_1/download")
+
+
+class _DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Serves ``body`` in 4 KiB chunks and optionally fails after ``fail_after`` bytes."""
+
+    def __init__(self, body: bytes, fail_after: int | None = None) -> None:
+        self.body = body
+        self.fail_after = fail_after
+
+    def __iter__(self) -> Iterator[bytes]:
+        sent = 0
+        for i in range(0, len(self.body), 4096):
+            if self.fail_after is not None and sent >= self.fail_after:
+                raise httpx.ReadError("connection reset")
+            chunk = self.body[i : i + 4096]
+            sent += len(chunk)
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.__iter__():
+            yield chunk
+
+
+def _transport(requests: list[httpx.Request], ranges: bool = True, etags: tuple[str, str] = ('"v1"', '"v1"')) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        headers = {"content-type": "text/csv", "etag": etags[min(len(requests), 2) - 1]}
+        if ranges:
+            headers["accept-ranges"] = "bytes"
+        if len(requests) == 1:
+            return httpx.Response(200, headers=headers, stream=_DroppingStream(BODY, fail_after=40_000))
+        range_header = request.headers.get("range")
+        if ranges and range_header and request.headers.get("if-range") == headers["etag"]:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            headers["content-range"] = f"bytes {start}-{len(BODY) - 1}/{len(BODY)}"
+            return httpx.Response(206, headers=headers, stream=_DroppingStream(BODY[start:]))
+        return httpx.Response(200, headers=headers, stream=_DroppingStream(BODY))
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
+def test_download_to_path_resumes_with_range(tmp_path: Path) -> None:
+    requests: list[httpx.Request] = []
+    client = Retab(api_key="sk_test_dummy", transport=_transport(requests))
+    result = client.download_to(REQUEST, tmp_path / "export.csv", chunk_size=8192)
+
+    assert (tmp_path / "export.csv").read_bytes() == BODY
+    assert not (tmp_path / "export.csv.part").exists()
+    assert result.bytes_written == len(BODY) and result.resumed == 1 and result.content_type == "text/csv"
+    assert result.checksum == hashlib.sha256(BODY).hexdigest()
+    assert requests[0].headers["accept-encoding"] == "identity"
+    assert requests[1].headers["range"] == "bytes=40960-" and requests[1].headers["if-range"] == '"v1"'
+
+
+def test_without_range_support_the_prefix_is_skipped() -> None:
+    requests: list[httpx.Request] = []
+    client = Retab(api_key="sk_test_dummy", transport=_transport(requests, ranges=False))
+    chunks = list(client.iter_bytes(REQUEST, chunk_size=4096))
+    assert b"".join(chunks) == BODY
+    assert max(len(chunk) for chunk in chunks) <= 4096
+    assert "range" not in requests[1].headers
+
+
+def test_changed_content_is_not_spliced(tmp_path: Path) -> None:
+    client = Retab(api_key="sk_test_dummy", transport=_transport([], ranges=False, etags=('"v1"', '"v2"')))
+    with pytest.raises(StreamInterruptedError):
+        client.download_to(REQUEST, tmp_path / "export.csv", chunk_size=4096)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_checksum_mismatch_leaves_no_file(tmp_path: Path) -> None:
+    client = Retab(api_key="sk_test_dummy", transport=_transport([]))
+    with pytest.raises(ChecksumMismatchError):
+        client.download_to(REQUEST, tmp_path / "export.csv", expected_checksum="00" * 32)
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_async_download_to_file_object() -> None:
+    requests: list[httpx.Request] = []
+    client = AsyncRetab(api_key="sk_test_dummy", transport=_transport(requests))
+    buffer = io.BytesIO()
+    result = await client.download_to(REQUEST, buffer, chunk_size=8192, checksum="md5", expected_checksum=hashlib.md5(BODY).hexdigest())
+    assert buffer.getvalue() == BODY
+    assert result.path is None and result.resumed == 1
+    assert requests[1].headers["range"] == "bytes=40960-"
+    await client.close()
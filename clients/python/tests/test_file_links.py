@@ -0,0 +1,116 @@
+"""Unit tests for reusing ``files.get_download_link`` results (`FileLinkCache`)."""
+
+import time
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, FileLinkCache, Retab
+from retab._file_links import download_link_file_id, file_path_id, link_expiry
+from retab.types.mime import FileRef
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+FILE = FileRef(id="file_1", filename="invoice.pdf", mime_type="application/pdf")
+EXTRACTION = {"id": "extr_1", "file": FILE.model_dump(), "model": "retab-small", "json_schema": {}, "output": {}}
+
+
+class Server:
+    """Serves download links valid for ``expires_in`` and extractions, recording the request paths."""
+
+    def __init__(self, expires_in: str = "3600") -> None:
+        self.expires_in = expires_in
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path.endswith("/download-link"):
+            return httpx.Response(200, json={"download_url": f"https://storage.example.com/{len(self.paths)}", "expires_in": self.expires_in, "filename": "invoice.pdf"})
+        return httpx.Response(200, json=EXTRACTION)
+
+
+def test_primitives_over_one_file_fetch_one_link() -> None:
+    server = Server()
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        for schema in ({"title": "a"}, {"title": "b"}, {"title": "c"}):
+            client.extractions.create(document=FILE, json_schema=schema)
+        client.extractions.prepare_create(document=FILE, json_schema={"title": "d"})
+        client.file_link_cache.invalidate("file_1")
+        client.extractions.create(document=FILE, json_schema={"title": "e"})
+    assert server.paths == ["/v1/files/file_1/download-link", *["/v1/extractions"] * 3, "/v1/files/file_1/download-link", "/v1/extractions"]
+
+
+def test_direct_calls_fetch_a_fresh_link_unless_opted_in() -> None:
+    server = Server()
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        client.extractions.create(document=FILE, json_schema={"title": "a"})
+        link = client.files.get_download_link("file_1")
+        assert link.download_url == "https://storage.example.com/3" and link.expires_in == "3600"
+    assert server.paths.count("/v1/files/file_1/download-link") == 2
+    server = Server()
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), file_link_cache=FileLinkCache(direct_calls=True)) as client:
+        client.files.get_download_link("file_1")
+        assert client.files.get_download_link("file_1").download_url == "https://storage.example.com/1"
+    assert len(server.paths) == 1
+
+
+def test_deleting_or_reuploading_a_file_drops_its_links() -> None:
+    server = Server()
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        client.extractions.create(document=FILE, json_schema={"title": "a"})
+        client._request("DELETE", "/v1/files/file_1")
+        client.extractions.create(document=FILE, json_schema={"title": "b"})
+        client._request("POST", "/v1/files/upload/file_1/complete", data={})
+        client.extractions.create(document=FILE, json_schema={"title": "c"})
+    assert server.paths.count("/v1/files/file_1/download-link") == 3
+    assert [file_path_id(path) for path in ("/v1/files/file_1", "/v1/files/upload/file_1/complete", "/v1/files/upload", "/v1/files/blueprints/bp_1", "/v1/files")] == [
+        "file_1",
+        "file_1",
+        None,
+        None,
+        None,
+    ]
+
+
+def test_links_close_to_expiry_are_refreshed(monkeypatch: pytest.MonkeyPatch) -> None:
+    server = Server()
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), file_link_cache=FileLinkCache(direct_calls=True)) as client:
+        client.files.get_download_link("file_1")
+        now = time.time()
+        monkeypatch.setattr("retab._file_links.time.time", lambda: now + 1000)
+        # A reused link tells how long it has left, not the validity it was fetched with.
+        assert client.files.get_download_link("file_1").expires_in in ("2599", "2600")
+        monkeypatch.setattr("retab._file_links.time.time", lambda: now + 3400)
+        assert client.files.get_download_link("file_1").download_url == "https://storage.example.com/2"
+    server = Server(expires_in="120")
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), file_link_cache=FileLinkCache(direct_calls=True)) as client:
+        client.files.get_download_link("file_1")
+        client.files.get_download_link("file_1")
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), file_link_cache=False) as client:
+        client.extractions.create(document=FILE, json_schema={"title": "a"})
+        client.extractions.create(document=FILE, json_schema={"title": "b"})
+    assert server.paths.count("/v1/files/file_1/download-link") == 4
+
+
+def test_expiry_formats_and_download_link_paths() -> None:
+    assert link_expiry("3600", 100.0) == 3700.0
+    assert link_expiry("30m", 100.0) == 1900.0 and link_expiry("1h", 0.0) == 3600.0 and link_expiry(60, 0.0) == 60.0
+    assert link_expiry("2026-01-01T00:00:00Z", 0.0) == link_expiry("2026-01-01T00:00:00", 0.0) == 1767225600.0
+    assert link_expiry("soon", 0.0) is None and link_expiry(None, 0.0) is None
+    assert download_link_file_id("/v1/files/file_1/download-link") == "file_1"
+    assert download_link_file_id("/v1/files/file_1") is None
+    cache = FileLinkCache(max_entries=1)
+    cache.put("a", "file_a", {"expires_in": "1h"}, time.time())
+    cache.put("b", "file_b", {"expires_in": "1h"}, time.time())
+    assert len(cache) == 1 and cache.get("a") is None and cache.get("b") in ({"expires_in": "3599"}, {"expires_in": "3600"})
+
+
+@pytest.mark.asyncio
+async def test_async_primitives_share_the_link() -> None:
+    server = Server()
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(server))
+    for schema in ({"title": "a"}, {"title": "b"}):
+        await client.extractions.create(document=FILE, json_schema=schema)
+    await client.close()
+    assert server.paths == ["/v1/files/file_1/download-link", "/v1/extractions", "/v1/extractions"]
@@ -0,0 +1,124 @@
+"""Unit tests for request hedging (`HedgePolicy`)."""
+
+import asyncio
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, HedgePolicy, Retab
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_abc", "filename": "doc.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object", "properties": {}},
+    "output": {"total": 100},
+}
+
+
+def _policy(**kwargs: Any) -> HedgePolicy:
+    return HedgePolicy(**{"initial_delay": 0.02, "min_delay": 0.0, "budget": 1.0, **kwargs})
+
+
+def test_policy_delay_follows_observed_percentile() -> None:
+    policy = HedgePolicy(percentile=0.9, min_samples=10, initial_delay=2.0, min_delay=0.0)
+    route = "GET /v1/extractions/{id}"
+    assert policy.delay(route) == 2.0
+    for i in range(1, 101):
+        policy.record(route, i / 100)
+    assert policy.delay(route) == pytest.approx(0.9)
+    assert policy.delay("GET /v1/files/{id}") == 2.0
+
+
+def test_policy_budget_caps_hedge_ratio() -> None:
+    policy = HedgePolicy(budget=0.1)
+    hedges = 0
+    for _ in range(100):
+        policy.admit()
+        hedges += policy.try_hedge()
+    assert hedges == 10
+    with pytest.raises(ValueError):
+        HedgePolicy(budget=1.5)
+
+
+def test_slow_get_is_hedged_and_fast_copy_wins() -> None:
+    release = threading.Event()
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path)
+        if len(seen) == 1:
+            release.wait(5)
+            return httpx.Response(200, json={**EXTRACTION, "id": "slow"})
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hedge_policy=_policy(), metrics=True)
+    try:
+        assert client.extractions.get("extr_1").id == "extr_1"
+        assert seen == ["/v1/extractions/extr_1"] * 2
+        operation = client.metrics.snapshot()["operations"]["Extractions.get"]
+        assert operation["hedges"] == 1 and operation["retries"] == 0
+    finally:
+        release.set()
+        client.close()
+
+
+def test_no_hedge_without_budget_or_for_unsafe_methods() -> None:
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.method)
+        threading.Event().wait(0.1)
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hedge_policy=_policy(budget=0.0))
+    client.extractions.get("extr_1")
+    client.close()
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hedge_policy=_policy(), metrics=True)
+    client._request("POST", "/v1/extractions", data={})
+    client.close()
+    assert calls == ["GET", "POST"]
+
+
+def test_errors_fall_back_to_the_other_copy() -> None:
+    count = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal count
+        count += 1
+        if count == 1:
+            threading.Event().wait(0.1)
+            return httpx.Response(200, json=EXTRACTION)
+        return httpx.Response(404, json={"detail": "stale replica"})
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hedge_policy=_policy(), metrics=True)
+    assert client.extractions.get("extr_1").id == "extr_1"
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_hedge_cancels_the_loser() -> None:
+    cancelled = asyncio.Event()
+    seen = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal seen
+        seen += 1
+        if seen == 1:
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hedge_policy=_policy())
+    assert (await client.extractions.get("extr_1")).id == "extr_1"
+    await asyncio.wait_for(cancelled.wait(), 1)
+    assert seen == 2
+    await client.close()
@@ -0,0 +1,167 @@
+"""Unit tests for request lifecycle hooks and the OpenTelemetry integration."""
+
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, CallScope, RequestEvent, RequestHooks, Retab, RetryPolicy
+from retab._hooks import current_call
+from retab.exceptions import NotFoundError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_abc", "filename": "doc.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object", "properties": {}},
+    "output": {"total": 100},
+}
+PDF_BYTES = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj<<>>endobj\ntrailer<<>>\n%%EOF"
+
+
+class RecordingHooks(RequestHooks):
+    def __init__(self) -> None:
+        self.log: list[tuple[Any, ...]] = []
+
+    def on_call_start(self, call: CallScope) -> None:
+        self.log.append(("call_start", call.name))
+
+    def on_call_end(self, call: CallScope) -> None:
+        self.log.append(("call_end", call.name, call.attempts, call.retries, call.request_id, type(call.error).__name__ if call.error else None))
+
+    def on_request(self, event: RequestEvent) -> None:
+        self.log.append(("request", event.attempt))
+
+    def on_response(self, event: RequestEvent) -> None:
+        self.log.append(("response", event.attempt, event.response.status_code if event.response else None))
+
+    def on_retry(self, event: RequestEvent) -> None:
+        self.log.append(("retry", event.attempt, event.delay))
+
+    def on_error(self, event: RequestEvent) -> None:
+        self.log.append(("error", event.attempt, type(event.error).__name__))
+
+    def on_phase(self, call: CallScope, name: str, started_ns: int, ended_ns: int) -> None:
+        assert started_ns <= ended_ns
+        self.log.append(("phase", name))
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
+def test_resource_call_reports_attempts_retries_and_phases(scripted_client: Callable[..., Retab]) -> None:
+    hooks = RecordingHooks()
+    client = scripted_client([503, 200], hooks=[hooks])
+    extraction = client.extractions.create(document=PDF_BYTES, json_schema={"type": "object"})
+    assert extraction.id == "extr_1"
+    assert hooks.log == [
+        ("call_start", "Extractions.create"),
+        ("phase", "prepare_mime_document"),
+        ("request", 1),
+        ("response", 1, 503),
+        ("retry", 1, 0.0),
+        ("request", 2),
+        ("response", 2, 200),
+        ("phase", "model_validate"),
+        ("call_end", "Extractions.create", 2, 1, "req_0", None),
+    ]
+
+
+def test_callbacks_and_final_error(scripted_client: Callable[..., Retab]) -> None:
+    events: list[tuple[str, RequestEvent]] = []
+    client = scripted_client(
+        [404],
+        body={"detail": "missing"},
+        on_request=lambda event: events.append(("request", event)),
+        on_response=lambda event: events.append(("response", event)),
+        on_error=lambda event: events.append(("error", event)),
+    )
+    with pytest.raises(NotFoundError):
+        client._request("GET", "/v1/extractions/extr_1")
+    assert [name for name, _ in events] == ["request", "response", "error"]
+    event = events[-1][1]
+    assert event.call.name == "GET /v1/extractions/{id}"
+    assert isinstance(event.error, NotFoundError) and event.response is not None
+    assert event.call.request_id == "req_0"
+
+
+def test_failing_hooks_are_ignored(scripted_client: Callable[..., Retab]) -> None:
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("hook bug")
+
+    client = scripted_client([200], on_request=broken)
+    assert client._request("GET", "/v1/extractions/extr_1")["id"] == "extr_1"
+
+
+def test_clients_without_hooks_do_not_open_calls() -> None:
+    seen: list[Any] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(current_call())
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler))
+    assert client.hooks == [] and client.metrics is None
+    client.extractions.get("extr_1")
+    assert seen == [None]
+
+
+@pytest.mark.asyncio
+async def test_async_resource_call_reports_lifecycle() -> None:
+    hooks = RecordingHooks()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, headers={"x-request-id": "req_async"}, json=EXTRACTION)
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hooks=[hooks])
+    await client.extractions.get("extr_1")
+    assert hooks.log == [
+        ("call_start", "Extractions.get"),
+        ("request", 1),
+        ("response", 1, 200),
+        ("phase", "model_validate"),
+        ("call_end", "Extractions.get", 1, 0, "req_async", None),
+    ]
+    await client.close()
+
+
+def test_opentelemetry_spans() -> None:
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+    from retab import OpenTelemetryHooks
+
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    seen: list[httpx.Request] = []
+    statuses = [500, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(statuses.pop(0), headers={"x-request-id": "req_otel"}, json=EXTRACTION)
+
+    client = Retab(
+        api_key="sk_test_dummy",
+        transport=httpx.MockTransport(handler),
+        hooks=[OpenTelemetryHooks(tracer_provider=provider)],
+        retry_policy=RetryPolicy(initial_delay=0.0),
+    )
+    client.extractions.create(document=PDF_BYTES, json_schema={"type": "object"})
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    call = spans["Extractions.create"]
+    assert call.attributes["retab.resource"] == "Extractions"
+    assert call.attributes["retab.request_id"] == "req_otel"
+    assert call.attributes["retab.retry_count"] == 1
+    assert call.attributes["retab.request.bytes"] > len(PDF_BYTES)
+    assert [event.name for event in call.events] == ["retry"]
+    children = [span for span in exporter.get_finished_spans() if span.parent is not None and span.parent.span_id == call.context.span_id]
+    assert sorted(span.name for span in children) == ["POST /v1/extractions", "POST /v1/extractions", "model_validate", "prepare_mime_document"]
+    assert "traceparent" in seen[0].headers
+    assert seen[0].headers["traceparent"] != seen[1].headers["traceparent"]
@@ -0,0 +1,115 @@
+"""Unit tests for automatic idempotency keys and `IdempotencyStore`."""
+
+from pathlib import Path
+from typing import Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, IdempotencyStore, Retab, RetryPolicy
+from retab.exceptions import InternalServerError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+SPLIT = {"id": "split_1"}
+RETRY = RetryPolicy(max_retries=2, initial_delay=0.0, jitter=0.0)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
+def test_retries_reuse_one_key_and_calls_get_fresh_ones(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([500, 503, 200, 200], seen, body=SPLIT, retry_policy=RETRY)
+    client._request("POST", "/v1/splits", data={"document": "a"})
+    client._request("POST", "/v1/splits", data={"document": "a"})
+    keys = [request.headers["idempotency-key"] for request in seen]
+    assert keys[0] == keys[1] == keys[2] != keys[3]
+
+
+def test_explicit_keys_gets_and_opt_out(scripted_client: Callable[..., Retab]) -> None:
+    seen: list[httpx.Request] = []
+    client = scripted_client([200, 200], seen, body=SPLIT, retry_policy=RETRY)
+    client._request("POST", "/v1/splits", data={}, idempotency_key="mine")
+    client._request("GET", "/v1/splits/split_1")
+    assert seen[0].headers["idempotency-key"] == "mine"
+    assert "idempotency-key" not in seen[1].headers
+
+    seen.clear()
+    scripted_client([200], seen, body=SPLIT, retry_policy=RETRY, auto_idempotency_keys=False)._request("POST", "/v1/splits", data={})
+    assert "idempotency-key" not in seen[0].headers
+
+
+def test_store_keeps_the_key_of_an_unfinished_request_across_restarts(tmp_path: Path, scripted_client: Callable[..., Retab]) -> None:
+    path = tmp_path / "keys.json"
+    seen: list[httpx.Request] = []
+    client = scripted_client([500, 500, 500], seen, body=SPLIT, retry_policy=RETRY, idempotency_store=IdempotencyStore(path))
+    with pytest.raises(InternalServerError):
+        client._request("POST", "/v1/splits", data={"document": "a"})
+    assert len(IdempotencyStore(path).pending()) == 1
+
+    # A new process resubmits the same request with the same key, then forgets it.
+    restarted = scripted_client([200, 200], seen, body=SPLIT, retry_policy=RETRY, idempotency_store=IdempotencyStore(path))
+    restarted._request("POST", "/v1/splits", data={"document": "a"})
+    assert seen[3].headers["idempotency-key"] == seen[0].headers["idempotency-key"]
+    assert IdempotencyStore(path).pending() == {}
+
+    restarted._request("POST", "/v1/splits", data={"document": "b"})
+    assert seen[4].headers["idempotency-key"] != seen[0].headers["idempotency-key"]
+
+
+def test_pending_keys_expire_after_the_ttl(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("retab._idempotency.time.time", lambda: now[0])
+    request = {"method": "POST", "url": "https://api.retab.com/v1/splits", "content": b"{}"}
+    store = IdempotencyStore(tmp_path / "keys.json", ttl=60.0)
+    key = store.key_for(request)
+    now[0] += 59.0
+    assert store.key_for(request) == key and len(IdempotencyStore(tmp_path / "keys.json", ttl=60.0).pending()) == 1
+    now[0] += 1.0
+    # Expired keys are dropped when a store is opened, and replaced when the request is made again.
+    assert IdempotencyStore(tmp_path / "keys.json", ttl=60.0).pending() == {}
+    assert store.key_for(request) != key and len(store.pending()) == 1
+
+
+def test_the_store_file_is_appended_to_and_compacted(tmp_path: Path) -> None:
+    path = tmp_path / "keys.json"
+    store = IdempotencyStore(path)
+    keys = [store.key_for({"method": "POST", "url": "/v1/splits", "content": str(index).encode()}) for index in range(3)]
+    store.settle(keys[0], None)
+    assert len(path.read_text().splitlines()) == 4
+    # A line cut short by a crash is skipped.
+    with open(path, "a") as fh:
+        fh.write('["abc", "key')
+    reopened = IdempotencyStore(path)
+    assert sorted(reopened.pending().values()) == sorted(keys[1:])
+    assert len(path.read_text().splitlines()) == 2
+    for index in range(300):
+        reopened.settle(reopened.key_for({"method": "POST", "url": "/v1/parses", "content": str(index).encode()}), None)
+    assert len(path.read_text().splitlines()) < 256 and sorted(IdempotencyStore(path).pending().values()) == sorted(keys[1:])
+
+
+def test_client_errors_release_the_key(scripted_client: Callable[..., Retab]) -> None:
+    store = IdempotencyStore()
+    client = scripted_client([422], body=SPLIT, retry_policy=RETRY, idempotency_store=store)
+    with pytest.raises(Exception):
+        client._request("POST", "/v1/splits", data={})
+    assert store.pending() == {}
+
+
+@pytest.mark.asyncio
+async def test_async_retries_reuse_the_key() -> None:
+    keys: list[str] = []
+    statuses = [502, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        keys.append(request.headers["idempotency-key"])
+        return httpx.Response(statuses.pop(0), json=SPLIT)
+
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), retry_policy=RetryPolicy(initial_delay=0.0, jitter=0.0))
+    await client._request("POST", "/v1/splits", data={})
+    assert len(keys) == 2 and keys[0] == keys[1]
+    await client.close()
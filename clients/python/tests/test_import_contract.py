@@ -1,4 +1,5 @@
 import json
+import os
 import subprocess
 import sys
 
@@ -68,3 +69,57 @@ print("___PROBE___" + json.dumps({
     assert payload["async_retab_name"] == "AsyncRetab"
     assert payload["mime_data_name"] == "MIMEData"
     assert payload["retab_client_loaded"] is True
+
+
+def test_client_construction_defers_resources_and_heavy_imports() -> None:
+    payload = _run_import_probe(
+        """
+import json
+import sys
+
+from retab import Retab
+
+def heavy():
+    return sorted(name for name in sys.modules if name.startswith(("retab.resources.", "PIL", "puremagic")))
+
+client = Retab(api_key="sk_test_dummy")
+before = heavy()
+extractions = client.extractions
+
+print("___PROBE___" + json.dumps({
+    "before": before,
+    "after": heavy(),
+    "cached": client.extractions is extractions,
+    "type": type(extractions).__name__,
+}))
+"""
+    )
+
+    assert payload["before"] == []
+    assert "retab.resources.extractions" in payload["after"]
+    assert "retab.resources.files" not in payload["after"]
+    assert payload["cached"] is True
+    assert payload["type"] == "Extractions"
+
+
+# Cumulative `python -X importtime` budget for `import retab.client`, in milliseconds. It is
+# generous on purpose (a cold import is ~0.3s locally) so CI only fails on real regressions,
+# such as an eager import of the resource modules or PIL; override with RETAB_IMPORT_BUDGET_MS.
+IMPORT_BUDGET_MS = float(os.environ.get("RETAB_IMPORT_BUDGET_MS", "1500"))
+
+
+def test_import_time_budget() -> None:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import retab.client"], capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+
+    # Lines look like "import time:   self [us] | cumulative | imported package".
+    cumulative_us: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        cumulative_us[name.strip()] = int(cumulative)
+
+    heavy = sorted(name for name in cumulative_us if name.startswith(("retab.resources", "PIL", "puremagic")))
+    assert heavy == []
+    assert cumulative_us["retab.client"] / 1000 < IMPORT_BUDGET_MS, f"import retab.client took {cumulative_us['retab.client'] / 1000:.0f}ms"
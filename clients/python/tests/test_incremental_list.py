@@ -0,0 +1,147 @@
+"""Unit tests for incremental decoding of list responses (`JSONListDecoder`, `iter_list_items`, `iter_items`)."""
+
+import json
+import random
+from typing import Any, AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab
+from retab._json_stream import JSONListDecoder
+from retab.types.base import RetabBaseModel
+from retab.types.extractions import Extraction
+from retab.types.standards import PreparedRequest
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+class Item(RetabBaseModel):
+    id: str
+    consensus: dict[str, Any] | None = None
+
+
+def _items(start: int, count: int) -> list[dict[str, Any]]:
+    return [{"id": f"extr_{i}", "consensus": {"choices": [{"text": "x" * 50}] * 3, "likelihoods": {"a": 0.5}}} for i in range(start, start + count)]
+
+
+def _decode(body: bytes, chunk_size: int, **kwargs: Any) -> tuple[list[Any], JSONListDecoder]:
+    decoder = JSONListDecoder(**kwargs)
+    items: list[Any] = []
+    for i in range(0, len(body), chunk_size):
+        items.extend(decoder.feed(body[i : i + chunk_size]))
+    items.extend(decoder.close())
+    return items, decoder
+
+
+class _ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Serves a body in small chunks and records how many were read."""
+
+    def __init__(self, body: bytes, chunk_size: int = 16) -> None:
+        self._chunks = [body[i : i + chunk_size] for i in range(0, len(body), chunk_size)]
+        self.served = 0
+
+    def __iter__(self) -> Iterator[bytes]:
+        for chunk in self._chunks:
+            self.served += 1
+            yield chunk
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.__iter__():
+            yield chunk
+
+
+def _pages_transport(streams: list[_ChunkedStream], requests: list[httpx.Request]) -> httpx.MockTransport:
+    pages = {
+        None: {"data": _items(0, 3), "list_metadata": {"before": None, "after": "extr_2"}},
+        "extr_2": {"data": _items(3, 2), "list_metadata": {"before": "extr_3", "after": None}},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        stream = _ChunkedStream(json.dumps(pages[request.url.params.get("after")]).encode())
+        streams.append(stream)
+        return httpx.Response(200, headers={"content-type": "application/json"}, stream=stream)
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 17, 4096])
+def test_decoder_matches_json_loads_for_any_chunking(chunk_size: int) -> None:
+    rng = random.Random(chunk_size)
+    data = [{"s": 'a"b\\c}{][,é', "n": [1, -2.5e3, None, True, {"k": []}], "deep": {"x": {"y": [[], {}]}}}, 12345678901234, "str", [], {}, None, False]
+    rng.shuffle(data)
+    body = json.dumps({"list_metadata": {"before": None, "after": "x"}, "data": data, "total": 7}, indent=1).encode()
+    items, decoder = _decode(body, chunk_size)
+    assert items == data
+    assert decoder.envelope == {"list_metadata": {"before": None, "after": "x"}, "total": 7}
+    assert decoder.count == len(data)
+
+
+def test_decoder_streams_bare_arrays_and_keeps_null_data_in_envelope() -> None:
+    assert _decode(b' [1, {"a": 2}] ', 2)[0] == [1, {"a": 2}]
+    items, decoder = _decode(b'{"data": null, "list_metadata": {}}', 4)
+    assert items == [] and decoder.envelope == {"data": None, "list_metadata": {}}
+
+
+def test_decoder_drops_subtrees_and_rejects_truncated_bodies() -> None:
+    body = json.dumps({"data": _items(0, 2) + [{"id": "extr_9", "consensus": [{"choices": 1, "keep": 2}]}]}).encode()
+    items, _ = _decode(body, 7, drop=["consensus.choices"])
+    assert items[0] == {"id": "extr_0", "consensus": {"likelihoods": {"a": 0.5}}}
+    assert items[2] == {"id": "extr_9", "consensus": [{"keep": 2}]}
+    with pytest.raises(ValueError):
+        _decode(body[:-5], 7)
+
+
+def test_iter_list_items_decodes_incrementally_across_pages() -> None:
+    streams: list[_ChunkedStream] = []
+    requests: list[httpx.Request] = []
+    client = Retab(api_key="sk_test_dummy", transport=_pages_transport(streams, requests))
+    request = PreparedRequest(method="GET", url="/v1/extractions", params={"limit": 3, "before": "extr_x"})
+    iterator = client.extractions.iter_list_items(request, model=Item, drop=["consensus.choices"])
+    first = next(iterator)
+    # The first item is yielded long before the first page has been fully read.
+    assert streams[0].served < len(streams[0]._chunks)
+    rest = list(iterator)
+    assert [item.id for item in [first, *rest]] == [f"extr_{i}" for i in range(5)]
+    assert all(isinstance(item, Item) and item.consensus == {"likelihoods": {"a": 0.5}} for item in [first, *rest])
+    assert requests[1].url.params["after"] == "extr_2" and "before" not in requests[1].url.params
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_iter_list_items_walks_all_pages() -> None:
+    streams: list[_ChunkedStream] = []
+    requests: list[httpx.Request] = []
+    client = AsyncRetab(api_key="sk_test_dummy", transport=_pages_transport(streams, requests))
+    request = PreparedRequest(method="GET", url="/v1/extractions", params={"limit": 3})
+    ids = [item.id async for item in client.extractions.iter_list_items(request, model=Item)]
+    assert ids == [f"extr_{i}" for i in range(5)]
+    assert len(requests) == 2
+    await client.close()
+
+
+def test_list_methods_stream_their_items_through_iter_items() -> None:
+    streams: list[_ChunkedStream] = []
+    requests: list[httpx.Request] = []
+    client = Retab(api_key="sk_test_dummy", transport=_pages_transport(streams, requests), validate_responses=False)
+    items = list(client.extractions.iter_items(client.extractions.list, limit=3, filename="a.pdf", drop=["consensus.choices"]))
+    assert [item.id for item in items] == [f"extr_{i}" for i in range(5)]
+    assert all(type(item) is Extraction and item.consensus is not None and item.consensus.choices == [] for item in items)
+    assert requests[0].url.params["filename"] == "a.pdf" and requests[1].url.params["after"] == "extr_2"
+    with pytest.raises(ValueError):
+        client.extractions.iter_items(client.extractions.get, "extr_1")
+    with pytest.raises(ValueError):
+        client.extractions.iter_items(client.files.list)
+    client.close()
+
+
+@pytest.mark.asyncio
+async def test_async_list_methods_stream_their_items() -> None:
+    streams: list[_ChunkedStream] = []
+    requests: list[httpx.Request] = []
+    client = AsyncRetab(api_key="sk_test_dummy", transport=_pages_transport(streams, requests), validate_responses=False)
+    ids = [item.id async for item in client.extractions.iter_items(client.extractions.list, limit=3)]
+    assert ids == [f"extr_{i}" for i in range(5)]
+    await client.close()
@@ -0,0 +1,98 @@
+"""Unit tests for the pluggable JSON codec and serialize-once request bodies."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from retab import JSONCodec, Retab, RetryPolicy
+from retab._codec import MsgspecCodec, OrjsonCodec, get_default_codec
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+PAYLOAD = {"document": {"filename": "a.pdf", "url": "data:application/pdf;base64,AAAA"}, "json_schema": {"type": "object"}, "n": 1.5, "é": "ü"}
+
+
+def _available_codecs() -> list[JSONCodec]:
+    codecs: list[JSONCodec] = [JSONCodec()]
+    for candidate in (OrjsonCodec, MsgspecCodec):
+        try:
+            codecs.append(candidate())
+        except ImportError:
+            pass
+    return codecs
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self) -> None:
+        self.dumps_calls = 0
+        self.loads_calls = 0
+
+    def dumps(self, obj: Any) -> bytes:
+        self.dumps_calls += 1
+        return super().dumps(obj)
+
+    def loads(self, data: bytes | str) -> Any:
+        self.loads_calls += 1
+        return super().loads(data)
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_round_trip_and_match_stdlib(codec: JSONCodec) -> None:
+    encoded = codec.dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded) == PAYLOAD
+    assert codec.loads(encoded.decode()) == PAYLOAD
+
+
+@pytest.mark.parametrize("codec", _available_codecs(), ids=lambda codec: codec.name)
+def test_codecs_raise_value_error_on_malformed_input(codec: JSONCodec) -> None:
+    with pytest.raises(ValueError):
+        codec.loads(b"{not json")
+
+
+def test_default_codec_prefers_fast_backend() -> None:
+    codec = get_default_codec()
+    try:
+        import orjson  # noqa: F401
+    except ImportError:
+        assert codec.name in {"msgspec", "json"}
+    else:
+        assert codec.name == "orjson"
+    assert Retab(api_key="sk_test_dummy").codec is codec
+
+
+def test_body_is_serialized_once_across_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    bodies: list[bytes] = []
+    statuses = [503, 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.content)
+        return httpx.Response(statuses.pop(0), json={"ok": True})
+
+    codec = CountingCodec()
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), codec=codec, retry_policy=RetryPolicy(initial_delay=0.0))
+    assert client._request("POST", "/v1/extractions", data=PAYLOAD) == {"ok": True}
+    assert codec.dumps_calls == 1
+    assert codec.loads_calls == 1
+    assert len(bodies) == 3 and len(set(bodies)) == 1
+    assert json.loads(bodies[0]) == PAYLOAD
+
+
+def test_json_request_headers_and_stream_lines_use_codec() -> None:
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, headers={"content-type": "application/stream+json"}, content=b'{"a":1}\n{"b":2}\n')
+
+    codec = CountingCodec()
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), codec=codec)
+    assert list(client._request_stream("POST", "/v1/extractions/stream", data={"x": 1})) == [{"a": 1}, {"b": 2}]
+    assert codec.loads_calls == 2
+    assert seen[0].headers["content-type"] == "application/json"
+    assert seen[0].headers["content-length"] == str(len(b'{"x":1}'))
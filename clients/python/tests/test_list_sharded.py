@@ -0,0 +1,96 @@
+"""Unit tests for `Retab.list_sharded` / `AsyncRetab.list_sharded` (time-sharded listing)."""
+
+import datetime
+import threading
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab
+from retab._sharding import _ShardPlan
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+START = datetime.date(2026, 3, 1)
+
+
+def _extraction(day: int, hour: int) -> dict:
+    created_at = datetime.datetime(2026, 3, day, hour, tzinfo=datetime.timezone.utc)
+    return {
+        "id": f"extr_{day:02d}_{hour:02d}",
+        "file": {"id": "file_1", "filename": "a.pdf", "mime_type": "application/pdf"},
+        "model": "m",
+        "json_schema": {},
+        "output": {},
+        "created_at": created_at.isoformat(),
+    }
+
+
+class Server:
+    """Serves ``/v1/extractions`` filtered by ``from_date`` / ``to_date`` (both included) and paged by ``after``."""
+
+    def __init__(self, per_day: dict[int, int]) -> None:
+        self.items = [_extraction(day, hour) for day, count in per_day.items() for hour in range(count)]
+        self.requests: list[httpx.QueryParams] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        with self._lock:
+            self.requests.append(params)
+        first, last = params["from_date"], params["to_date"]
+        items = sorted((item for item in self.items if first <= item["created_at"][:10] <= last), key=lambda item: item["id"], reverse=params["order"] == "desc")
+        if "after" in params:
+            items = items[[item["id"] for item in items].index(params["after"]) + 1 :]
+        limit = int(params["limit"])
+        page, more = items[:limit], len(items) > limit
+        return httpx.Response(200, json={"data": page, "list_metadata": {"before": None, "after": page[-1]["id"] if more else None}})
+
+
+def test_every_item_of_the_range_is_yielded_once() -> None:
+    server = Server({1: 3, 2: 1, 5: 4, 9: 2, 10: 5})
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        items = list(client.list_sharded(client.extractions.list, from_date="2026-03-01", to_date="2026-03-09", shards=3, limit=2))
+    # The windows ask for one day more; items of 2026-03-10 are filtered out.
+    assert sorted(item.id for item in items) == sorted(item["id"] for item in server.items if item["created_at"] < "2026-03-10")
+    assert {(params["from_date"], params["to_date"]) for params in server.requests} >= {("2026-03-01", "2026-03-04"), ("2026-03-04", "2026-03-07"), ("2026-03-07", "2026-03-10")}
+
+
+def test_ordered_results_follow_the_list_order() -> None:
+    server = Server({day: 2 for day in range(1, 15)})
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        descending = [item.id for item in client.list_sharded(client.extractions.list, from_date=START, to_date="2026-03-14", shards=4, ordered=True, limit=3)]
+        ascending = [item.id for item in client.list_sharded(client.extractions.list, from_date=START, to_date="2026-03-14", order="asc", ordered=True, limit=3)]
+    assert descending == sorted(descending, reverse=True) and len(descending) == 28
+    assert ascending == sorted(ascending) and len(ascending) == 28
+
+
+def test_dense_windows_are_split() -> None:
+    server = Server({1: 1, 2: 1, 3: 1, 4: 1, 5: 12, 6: 12, 7: 1, 8: 1})
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server)) as client:
+        items = list(client.list_sharded(client.extractions.list, from_date="2026-03-01", to_date="2026-03-08", shards=2, limit=5))
+    assert len(items) == len({item.id for item in items}) == 30
+    windows = {(params["from_date"], params["to_date"]) for params in server.requests}
+    assert ("2026-03-05", "2026-03-06") in windows and ("2026-03-06", "2026-03-07") in windows
+
+    plan = _ShardPlan(START, datetime.date(2026, 3, 4), shards=1, max_shards=2, order="desc", ordered=True)
+    assert plan.split(plan.windows[0]) is not None and plan.split(plan.windows[0]) is None
+    assert [(window.start.day, window.end.day) for window in plan.windows] == [(3, 4), (1, 2)]
+
+
+def test_invalid_ranges_are_rejected_by_the_call() -> None:
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(Server({}))) as client:
+        with pytest.raises(ValueError):
+            client.list_sharded(client.extractions.list, from_date="2026-03-09", to_date="2026-03-01")
+        with pytest.raises(ValueError):
+            client.list_sharded(client.extractions.list, from_date="2026-03-01", to_date="2026-03-09", shards=4, max_shards=2)
+
+
+@pytest.mark.asyncio
+async def test_async_list_sharded() -> None:
+    server = Server({1: 4, 3: 9, 4: 2, 6: 1})
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(server))
+    items = [item async for item in client.list_sharded(client.extractions.list, from_date="2026-03-01", to_date="2026-03-06", shards=3, concurrency=2, ordered=True, limit=3)]
+    await client.close()
+    assert [item.id for item in items] == sorted((item["id"] for item in server.items), reverse=True)
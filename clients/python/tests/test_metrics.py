@@ -0,0 +1,132 @@
+"""Unit tests for the in-process metrics registry and its Prometheus export."""
+
+import re
+from typing import Callable
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, MetricsRegistry, Retab
+from retab._hooks import route_template
+from retab._metrics import Histogram
+from retab.exceptions import NotFoundError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_abc", "filename": "doc.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object", "properties": {}},
+    "output": {"total": 100},
+}
+PDF_BYTES = b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n1 0 obj<<>>endobj\ntrailer<<>>\n%%EOF"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+
+
+def test_route_template_collapses_ids() -> None:
+    assert route_template("/v1/files/file_1/download-link") == "/v1/files/{id}/download-link"
+    assert route_template("/v1/projects/proj_1/iterations/it_2") == "/v1/projects/{id}/iterations/{id}"
+    assert route_template("/v1/extractions") == "/v1/extractions"
+
+
+def test_histogram_quantiles_interpolate_within_buckets() -> None:
+    histogram = Histogram((1.0, 2.0, 4.0))
+    for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+        histogram.observe(value)
+    assert histogram.counts == [1, 2, 1, 1]
+    assert histogram.quantile(0.5) == pytest.approx(1.75)
+    assert histogram.quantile(0.99) == 4.0
+    assert histogram.snapshot()["buckets"] == {"1.0": 1, "2.0": 3, "4.0": 4, "+Inf": 5}
+
+
+def test_snapshot_counts_calls_retries_statuses_and_phases(scripted_client: Callable[..., Retab]) -> None:
+    client = scripted_client([503, 200, 200], metrics=True)
+    client.extractions.create(document=PDF_BYTES, json_schema={"type": "object"})
+    client.extractions.get("extr_1")
+
+    snapshot = client.metrics.snapshot()
+    create = snapshot["operations"]["Extractions.create"]
+    assert create["calls"] == 1 and create["retries"] == 1
+    assert create["status_codes"] == {503: 1, 200: 1}
+    assert create["bytes_sent"] > 2 * len(PDF_BYTES) and create["bytes_received"] > 0
+    assert create["latency"]["count"] == 1 and create["attempt_latency"]["count"] == 2
+    assert snapshot["operations"]["Extractions.get"]["calls"] == 1
+    assert set(snapshot["phases"]) == {"prepare_mime_document", "model_validate"}
+    assert snapshot["phases"]["prepare_mime_document"]["Extractions.create"]["count"] == 1
+    assert snapshot["in_flight"] == 0
+
+
+def test_errors_and_implicit_calls_use_route_templates(scripted_client: Callable[..., Retab]) -> None:
+    client = scripted_client([404], body={"detail": "missing"}, metrics=True)
+    with pytest.raises(NotFoundError):
+        client._request("GET", "/v1/extractions/extr_1")
+    operation = client.metrics.snapshot()["operations"]["GET /v1/extractions/{id}"]
+    assert operation["errors"] == {"NotFoundError": 1}
+    assert operation["status_codes"] == {404: 1}
+
+
+def test_prometheus_exposition(scripted_client: Callable[..., Retab]) -> None:
+    client = scripted_client([200], metrics=True)
+    client.extractions.get("extr_1")
+    client.metrics.set_gauge("page_size", 50, operation="list")
+    text = client.metrics.to_prometheus()
+
+    assert '# TYPE retab_calls_total counter\nretab_calls_total{resource="Extractions",operation="get"} 1\n' in text
+    assert 'retab_responses_total{resource="Extractions",operation="get",status="200"} 1' in text
+    assert "retab_in_flight_requests 0" in text
+    assert 'retab_call_duration_seconds_bucket{resource="Extractions",operation="get",le="+Inf"} 1' in text
+    assert 'retab_call_duration_seconds_count{resource="Extractions",operation="get"} 1' in text
+    assert 'retab_page_size{operation="list"} 50' in text
+    sample = re.compile(r'^[a-z_]+(\{[a-z_]+="[^"]*"(,[a-z_]+="[^"]*")*\})? [0-9.e+-]+$')
+    assert all(line.startswith("# ") or sample.match(line) for line in text.splitlines())
+
+
+def test_in_flight_gauge_tracks_open_requests() -> None:
+    seen: list[int] = []
+    registry = MetricsRegistry()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(registry.in_flight)
+        return httpx.Response(200, json=EXTRACTION)
+
+    client = Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), hooks=[registry])
+    client.extractions.get("extr_1")
+    assert seen == [1] and registry.in_flight == 0
+    registry.reset()
+    assert registry.snapshot()["operations"] == {}
+
+
+@pytest.mark.asyncio
+async def test_in_flight_gauge_drops_cancelled_attempts() -> None:
+    import asyncio
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(5)
+        return httpx.Response(200, json=EXTRACTION)
+
+    # Without coalescing: a shared GET keeps running (and counting) for other waiters when one gives up.
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler), coalesce_requests=False, metrics=True)
+    task = asyncio.ensure_future(client.extractions.get("extr_1"))
+    await asyncio.sleep(0.01)
+    assert client.metrics.in_flight == 1
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(client._request("GET", "/v1/files/file_1"), 0.01)
+    await client.close()
+    assert client.metrics.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_client_records_metrics() -> None:
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(lambda request: httpx.Response(200, json=EXTRACTION)), metrics=True)
+    await client.extractions.get("extr_1")
+    assert client.metrics.snapshot()["operations"]["Extractions.get"]["calls"] == 1
+    await client.close()
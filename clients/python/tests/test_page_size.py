@@ -0,0 +1,93 @@
+"""Unit tests for adaptive page sizes of auto-paged lists (`PageSizePolicy`)."""
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, PageSizePolicy, Retab
+from retab._page_size import page_size_key
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+class Server:
+    """Serves ``count`` extractions, with a large output when ``include_output=true``, recording the limits asked for."""
+
+    def __init__(self, count: int) -> None:
+        self.count = count
+        self.limits: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        limit = int(params["limit"])
+        self.limits.append(limit)
+        start = int(params.get("after", 0))
+        output = {"text": "x" * 2000} if params.get("include_output") == "true" else {}
+        data = [
+            {"id": str(index), "file": {"id": "file_1", "filename": "a.pdf", "mime_type": "application/pdf"}, "model": "m", "json_schema": {}, "output": output}
+            for index in range(start, min(start + limit, self.count))
+        ]
+        after = str(start + limit) if start + limit < self.count else None
+        return httpx.Response(200, json={"data": data, "list_metadata": {"before": None, "after": after}})
+
+
+def test_fast_light_pages_grow_to_the_maximum() -> None:
+    server = Server(500)
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), page_size_policy=PageSizePolicy(), metrics=True) as client:
+        page = client.extractions.list(limit=10)
+        assert len(page.data) == 10
+        assert len(list(page.auto_paging_iter())) == 500
+        gauges = client.metrics.snapshot()["gauges"]
+    assert server.limits[:6] == [10, 20, 40, 80, 100, 100]
+    assert gauges == {"page_size{route=GET /v1/extractions}": 100}
+
+
+def test_heavy_pages_shrink_and_are_sized_apart() -> None:
+    server = Server(200)
+    policy = PageSizePolicy(target_bytes=20_000)
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), page_size_policy=policy, metrics=True) as client:
+        heavy = list(client.extractions.list(limit=20, include_output=True).auto_paging_iter())
+        heavy_limits = list(server.limits)
+        server.limits.clear()
+        light = list(client.extractions.list(limit=20).auto_paging_iter())
+        gauges = client.metrics.snapshot()["gauges"]
+    assert len(heavy) == len(light) == 200
+    # About 2 KB per item: pages of 20 overshoot the 20 KB target and settle just below it.
+    assert heavy_limits[0] == 20 and all(limit < 10 for limit in heavy_limits[1:])
+    assert server.limits[:3] == [20, 40, 80]
+    assert gauges["page_size{route=GET /v1/extractions include_output}"] < 10
+
+
+def test_policy_sizes() -> None:
+    policy = PageSizePolicy(max_page_size=100, target_seconds=1.0, target_bytes=1000)
+    assert policy.record("k", 10, 10, seconds=0.1, size=100) == 20
+    assert policy.record("k", 20, 20, seconds=2.0, size=100) == 10
+    assert policy.record("k", 10, 10, seconds=0.6, size=100) == 10
+    # A last page, shorter than its limit, tells nothing about larger ones.
+    assert policy.record("k", 10, 3, seconds=0.0, size=0) == 10
+    assert policy.record("k", 40, 40, seconds=0.01, size=40) == 80
+    # A later listing starting from a small limit keeps the larger size while its first page says it fits.
+    assert policy.record("k", 10, 10, seconds=0.01, size=20) == 80
+    assert policy.record("k", 10, 10, seconds=0.01, size=500) == 20
+    assert policy.record("other", 50, 50, seconds=0.0, size=5000) == 10
+    assert page_size_key("get", "/v1/workflows/wf_1/runs", {"limit": 10, "include_output": True, "status": "done"}) == "GET /v1/workflows/{id}/runs include_output"
+    with pytest.raises(ValueError):
+        PageSizePolicy(max_page_size=0)
+
+
+def test_without_a_policy_the_limit_is_kept() -> None:
+    server = Server(35)
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), metrics=True) as client:
+        assert len(list(client.extractions.list(limit=10).auto_paging_iter())) == 35
+        assert client.metrics.snapshot()["gauges"] == {}
+    assert server.limits == [10, 10, 10, 10]
+
+
+@pytest.mark.asyncio
+async def test_async_pages_grow() -> None:
+    server = Server(300)
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), page_size_policy=PageSizePolicy(max_page_size=50))
+    page = await client.extractions.list(limit=10)
+    assert len([item async for item in page.auto_paging_iter()]) == 300
+    await client.close()
+    assert server.limits[:4] == [10, 20, 40, 50]
@@ -0,0 +1,131 @@
+"""Unit tests for ``auto_paging_iter(prefetch=...)`` on sync and async paginated lists."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from retab import Retab
+from retab.types.extractions import Extraction
+from retab.types.pagination import AsyncPaginatedList, ListMetadata, PaginatedList, _AsyncPagePrefetcher
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def _sync_pages(count: int, fetched: list[str], fail_at: int | None = None) -> PaginatedList[int]:
+    def page(number: int) -> PaginatedList[int]:
+        result = PaginatedList[int](data=[number * 10, number * 10 + 1], list_metadata=ListMetadata(before=None, after=str(number + 1) if number + 1 < count else None))
+
+        def fetch(after: str) -> PaginatedList[int]:
+            fetched.append(after)
+            if int(after) == fail_at:
+                raise RuntimeError(f"page {after} failed")
+            return page(int(after))
+
+        result._fetch_next_page = fetch
+        return result
+
+    return page(0)
+
+
+def _async_pages(count: int, fetched: list[str], fail_at: int | None = None) -> AsyncPaginatedList[int]:
+    def page(number: int) -> AsyncPaginatedList[int]:
+        result = AsyncPaginatedList[int](data=[number * 10, number * 10 + 1], list_metadata=ListMetadata(before=None, after=str(number + 1) if number + 1 < count else None))
+
+        async def fetch(after: str) -> AsyncPaginatedList[int]:
+            fetched.append(after)
+            await asyncio.sleep(0)
+            if int(after) == fail_at:
+                raise RuntimeError(f"page {after} failed")
+            return page(int(after))
+
+        result._fetch_next_page = fetch
+        return result
+
+    return page(0)
+
+
+def _wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+
+
+def test_prefetching_yields_the_same_items() -> None:
+    assert list(_sync_pages(5, []).auto_paging_iter(prefetch=2)) == list(_sync_pages(5, []).auto_paging_iter())
+    assert list(_sync_pages(1, []).auto_paging_iter(prefetch=2)) == [0, 1]
+    with pytest.raises(ValueError):
+        _sync_pages(1, []).auto_paging_iter(prefetch=-1)
+
+
+def test_pages_are_fetched_ahead_within_the_bound() -> None:
+    fetched: list[str] = []
+    items = _sync_pages(6, fetched).auto_paging_iter(prefetch=2)
+    assert next(items) == 0
+    _wait_for(lambda: len(fetched) == 2)
+    time.sleep(0.05)
+    assert fetched == ["1", "2"]
+    assert [next(items) for _ in range(3)] == [1, 10, 11]
+    _wait_for(lambda: len(fetched) == 3)
+    assert fetched == ["1", "2", "3"]
+    items.close()
+    _wait_for(lambda: not any(thread.name == "retab-page-prefetch" for thread in threading.enumerate()))
+    assert not any(thread.name == "retab-page-prefetch" for thread in threading.enumerate())
+
+
+def test_fetch_errors_reach_the_consumer_after_the_pages_before_them() -> None:
+    seen: list[int] = []
+    with pytest.raises(RuntimeError, match="page 3 failed"):
+        for item in _sync_pages(6, [], fail_at=3).auto_paging_iter(prefetch=2):
+            seen.append(item)
+    assert seen == [0, 1, 10, 11, 20, 21]
+
+
+@pytest.mark.asyncio
+async def test_async_prefetching() -> None:
+    fetched: list[str] = []
+    assert [item async for item in _async_pages(4, fetched).auto_paging_iter(prefetch=2)] == [0, 1, 10, 11, 20, 21, 30, 31]
+    seen: list[int] = []
+    with pytest.raises(RuntimeError, match="page 2 failed"):
+        async for item in _async_pages(4, [], fail_at=2).auto_paging_iter(prefetch=1):
+            seen.append(item)
+    assert seen == [0, 1, 10, 11]
+
+    fetched.clear()
+    items = _async_pages(6, fetched).auto_paging_iter(prefetch=1)
+    assert await items.__anext__() == 0
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert fetched == ["1"]
+    await items.aclose()
+
+
+@pytest.mark.asyncio
+async def test_async_consumer_is_woken_when_the_fetch_is_cancelled() -> None:
+    first = AsyncPaginatedList[int](data=[0], list_metadata=ListMetadata(before=None, after="1"))
+
+    async def fetch(after: str) -> AsyncPaginatedList[int]:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    first._fetch_next_page = fetch
+    prefetcher = _AsyncPagePrefetcher(first, 1)
+    consumer = asyncio.ensure_future(prefetcher.__anext__())
+    await asyncio.sleep(0)
+    # Cancelled from outside (e.g. the event loop shutting down), not through aclose().
+    prefetcher._task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(consumer, timeout=1.0)
+    assert prefetcher._task.cancelled()
+
+
+def test_resource_lists_prefetch_through_the_client() -> None:
+    extraction = {"id": "extr_1", "file": {"id": "file_1", "filename": "a.pdf", "mime_type": "application/pdf"}, "model": "m", "json_schema": {}, "output": {}}
+    pages = {None: "extr_1", "extr_1": "extr_2", "extr_2": None}
+    handler = lambda request: httpx.Response(200, json={"data": [extraction], "list_metadata": {"before": None, "after": pages[request.url.params.get("after")]}})  # noqa: E731
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler)) as client:
+        items = list(client.extractions.list().auto_paging_iter(prefetch=2))
+    assert len(items) == 3 and all(type(item) is Extraction for item in items)
@@ -0,0 +1,46 @@
+"""Unit tests for `PreparedRequest` and the per-resource request construction benchmark."""
+
+from datetime import datetime, timezone
+
+import pytest
+from bench_prepare_requests import run
+from mocks import mock_retab
+
+from retab.types.standards import PreparedRequest
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def test_prepared_request_keeps_the_pydantic_era_helpers() -> None:
+    request = PreparedRequest(method="GET", url="/v1/workflows/runs/run_1", params={"limit": 10})
+    assert request.model_dump()["params"] == {"limit": 10}
+    assert request.model_copy() == request
+    assert request.model_copy(update={"url": "/v1/workflows/runs/run_2"}).url == "/v1/workflows/runs/run_2"
+    assert request.model_dump(mode="json", exclude_none=True, by_alias=True) == {
+        "method": "GET",
+        "url": "/v1/workflows/runs/run_1",
+        "params": {"limit": 10},
+        "raise_for_status": False,
+    }
+    deadline = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    assert PreparedRequest(method="GET", url="/v1/files", deadline=deadline).model_dump(mode="json", include={"deadline"}) == {"deadline": "2026-01-01T00:00:00+00:00"}
+    assert repr(request) == "PreparedRequest(method='GET', url='/v1/workflows/runs/run_1', params={'limit': 10})"
+    with pytest.raises(TypeError):
+        PreparedRequest("GET", "/v1/files")  # type: ignore[misc]
+
+
+def test_generated_prepare_methods_build_plain_requests() -> None:
+    client, recorder = mock_retab({"id": "run_1"})
+    with client:
+        request = client.workflows.runs.prepare_get("run_1")
+        assert type(request) is PreparedRequest
+        assert (request.method, request.url, request.params, request.data) == ("GET", "/v1/workflows/runs/run_1", None, None)
+
+
+def test_benchmark_covers_every_resource_method() -> None:
+    timings, skipped = run(["workflows.runs", "extractions"], number=1)
+    labels = [label for label, _ in timings]
+    assert "workflows.runs.prepare_get" in labels and "extractions.prepare_create" in labels
+    assert skipped == []
+    assert all(micros > 0 for _, micros in timings)
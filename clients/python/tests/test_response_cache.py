@@ -0,0 +1,110 @@
+"""Unit tests for `ResponseCache`, the client's optional GET response cache."""
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, ResponseCache, Retab
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+WORKFLOW = {"id": "wf_1", "name": "Invoices"}
+
+
+class Server:
+    """Serves ``WORKFLOW`` with the given headers and records every request."""
+
+    def __init__(self, headers: dict[str, str]) -> None:
+        self.headers = headers
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        etag = self.headers.get("ETag")
+        if etag is not None and request.headers.get("if-none-match") == etag:
+            return httpx.Response(304, headers=self.headers)
+        return httpx.Response(200, json=WORKFLOW, headers=self.headers)
+
+
+def _client(server: Server, cache: ResponseCache, api_key: str = "sk_test_dummy") -> Retab:
+    return Retab(api_key=api_key, transport=httpx.MockTransport(server), response_cache=cache)
+
+
+def test_fresh_responses_are_served_from_memory() -> None:
+    server = Server({"Cache-Control": "max-age=60"})
+    with _client(server, ResponseCache()) as client:
+        assert client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+        assert client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+        client._request("GET", "/v1/workflows/wf_1", params={"expand": "spec"})
+    assert len(server.requests) == 2
+
+
+def test_stale_responses_are_revalidated_with_their_etag() -> None:
+    server = Server({"ETag": '"v1"'})
+    with _client(server, ResponseCache()) as client:
+        client._request("GET", "/v1/workflows/wf_1")
+        assert client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+    assert "if-none-match" not in server.requests[0].headers
+    assert server.requests[1].headers["if-none-match"] == '"v1"'
+
+
+def test_mutations_drop_their_resource_and_uncacheable_responses_are_skipped() -> None:
+    server = Server({"Cache-Control": "max-age=60"})
+    cache = ResponseCache()
+    with _client(server, cache) as client:
+        client._request("GET", "/v1/workflows/wf_1/spec")
+        client._request("GET", "/v1/files/file_1")
+        client._request("PATCH", "/v1/workflows/wf_1", data={"name": "Receipts"})
+        assert len(cache) == 1
+        client._request("GET", "/v1/workflows/wf_1/spec")
+        client._request("GET", "/v1/files/file_1")
+        server.headers = {"Cache-Control": "no-store", "ETag": '"v2"'}
+        client._request("GET", "/v1/tables/tbl_1")
+        client._request("GET", "/v1/tables/tbl_1")
+    assert [request.url.path for request in server.requests] == [
+        "/v1/workflows/wf_1/spec",
+        "/v1/files/file_1",
+        "/v1/workflows/wf_1",
+        "/v1/workflows/wf_1/spec",
+        "/v1/tables/tbl_1",
+        "/v1/tables/tbl_1",
+    ]
+
+
+def test_entries_are_per_api_key_and_bounded() -> None:
+    server = Server({"Cache-Control": "max-age=60"})
+    cache = ResponseCache(max_entries=2)
+    with _client(server, cache) as first, _client(server, cache, api_key="sk_other_dummy") as second:
+        first._request("GET", "/v1/workflows/wf_1")
+        second._request("GET", "/v1/workflows/wf_1")
+        first._request("GET", "/v1/workflows/wf_2")
+        first._request("GET", "/v1/workflows/wf_1")
+    assert len(server.requests) == 4 and len(cache) == 2
+
+
+def test_disk_entries_outlive_the_cache_and_late_reads_are_not_stored(tmp_path) -> None:
+    server = Server({"Cache-Control": "max-age=60"})
+    with _client(server, ResponseCache(directory=tmp_path)) as client:
+        client._request("GET", "/v1/workflows/wf_1")
+    cache = ResponseCache(directory=tmp_path)
+    with _client(server, cache) as client:
+        assert client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+    assert len(server.requests) == 1
+
+    generation = cache.generation("/v1/workflows")
+    cache.invalidate("/v1/workflows/wf_1")
+    cache.store("key", "/v1/workflows", httpx.Response(200, json=WORKFLOW, headers={"Cache-Control": "max-age=60"}), generation)
+    assert len(cache) == 0 and cache.get("key", "/v1/workflows") is None
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_the_cache() -> None:
+    server = Server({"ETag": '"v1"'})
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(server), response_cache=ResponseCache(default_ttl=60))
+    assert await client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+    assert await client._request("GET", "/v1/workflows/wf_1") == WORKFLOW
+    await client._request("DELETE", "/v1/workflows/wf_1")
+    await client._request("GET", "/v1/workflows/wf_1")
+    await client.close()
+    assert [request.method for request in server.requests] == ["GET", "DELETE", "GET"]
+    assert server.requests[2].headers.get("if-none-match") is None
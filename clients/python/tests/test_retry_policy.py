@@ -0,0 +1,261 @@
+"""Unit tests for the Retry-After-aware retry policy and the client-side rate limiter."""
+
+import time
+from typing import Any
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, RateLimiter, Retab, RetryPolicy
+from retab._deadline import deadline_scope
+from retab._retry import parse_retry_after
+from retab.exceptions import DeadlineExceededError, InternalServerError, NotFoundError, RateLimitError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def _rate_limited(retry_after: str | None = None) -> RateLimitError:
+    headers = {"retry-after": retry_after} if retry_after is not None else {}
+    return RateLimitError("slow down", status_code=429, headers=headers)
+
+
+class _Sleeps:
+    def __init__(self) -> None:
+        self.calls: list[float] = []
+
+    def __call__(self, seconds: float) -> None:
+        self.calls.append(seconds)
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> _Sleeps:
+    recorder = _Sleeps()
+    monkeypatch.setattr(time, "sleep", recorder)
+    return recorder
+
+
+# ---------------------------------------------------------------------------
+# Retry-After parsing & delay computation
+# ---------------------------------------------------------------------------
+
+
+def test_parse_retry_after_variants() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after(httpx.Headers({})) is None
+    assert parse_retry_after(httpx.Headers({"Retry-After": "7"})) == 7.0
+    assert parse_retry_after(httpx.Headers({"retry-after-ms": "250", "retry-after": "9"})) == 0.25
+    assert parse_retry_after(httpx.Headers({"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0.0
+    assert parse_retry_after(httpx.Headers({"Retry-After": "not a date"})) is None
+
+
+def test_compute_delay_honours_retry_after() -> None:
+    policy = RetryPolicy(max_retries=3, initial_delay=1.0, jitter=0.0)
+    assert policy.compute_delay(1, _rate_limited("12")) == 12.0
+
+
+def test_compute_delay_ignores_retry_after_when_disabled() -> None:
+    policy = RetryPolicy(max_retries=3, initial_delay=1.0, jitter=0.0, respect_retry_after=False)
+    assert policy.compute_delay(1, _rate_limited("12")) == 1.0
+
+
+def test_compute_delay_gives_up_on_excessive_retry_after() -> None:
+    policy = RetryPolicy(max_retries=3, max_retry_after=30.0)
+    assert policy.compute_delay(1, _rate_limited("3600")) is None
+
+
+def test_compute_delay_exponential_without_jitter() -> None:
+    policy = RetryPolicy(max_retries=5, initial_delay=0.5, multiplier=2.0, max_delay=3.0, jitter=0.0)
+    assert [policy.compute_delay(attempt) for attempt in range(1, 7)] == [0.5, 1.0, 2.0, 3.0, 3.0, None]
+
+
+def test_compute_delay_full_jitter_stays_in_range() -> None:
+    policy = RetryPolicy(max_retries=10, initial_delay=2.0, jitter=1.0)
+    for _ in range(200):
+        delay = policy.compute_delay(1)
+        assert delay is not None and 0.0 <= delay <= 2.0
+
+
+def test_retry_policy_rejects_invalid_arguments() -> None:
+    with pytest.raises(ValueError):
+        RetryPolicy(max_retries=-1)
+    with pytest.raises(ValueError):
+        RetryPolicy(jitter=1.5)
+
+
+# ---------------------------------------------------------------------------
+# Client retry loop
+# ---------------------------------------------------------------------------
+
+
+def _sequence_transport(responses: list[httpx.Response], seen: list[httpx.Request]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return responses.pop(0)
+
+    return httpx.MockTransport(handler)
+
+
+def test_client_waits_for_retry_after_then_succeeds(sleeps: _Sleeps) -> None:
+    seen: list[httpx.Request] = []
+    transport = _sequence_transport(
+        [httpx.Response(429, headers={"Retry-After": "4"}, json={"detail": "slow down"}), httpx.Response(200, json={"ok": True})],
+        seen,
+    )
+    client = Retab(api_key="sk_test_dummy", transport=transport, retry_policy=RetryPolicy(jitter=0.0))
+    assert client._request("GET", "/v1/files") == {"ok": True}
+    assert len(seen) == 2
+    assert sleeps.calls == [4.0]
+
+
+def test_client_gives_up_and_records_retries(sleeps: _Sleeps) -> None:
+    seen: list[httpx.Request] = []
+    transport = _sequence_transport([httpx.Response(503, text="unavailable") for _ in range(3)], seen)
+    client = Retab(api_key="sk_test_dummy", transport=transport, retry_policy=RetryPolicy(max_retries=2, initial_delay=0.01))
+    with pytest.raises(InternalServerError) as exc_info:
+        client._request("POST", "/v1/extractions", data={})
+    assert exc_info.value.retries == 3
+    assert len(seen) == 3
+    assert len(sleeps.calls) == 2
+
+
+def test_client_does_not_retry_client_errors(sleeps: _Sleeps) -> None:
+    seen: list[httpx.Request] = []
+    transport = _sequence_transport([httpx.Response(404, json={"detail": "missing"})], seen)
+    client = Retab(api_key="sk_test_dummy", transport=transport)
+    with pytest.raises(NotFoundError) as exc_info:
+        client._request("GET", "/v1/files/file_missing")
+    assert exc_info.value.retries == 0
+    assert sleeps.calls == []
+
+
+def test_max_retries_still_configures_default_policy() -> None:
+    client = Retab(api_key="sk_test_dummy", max_retries=7)
+    assert client.retry_policy.max_retries == 7
+    assert client.max_retries == 7
+
+
+@pytest.mark.asyncio
+async def test_async_client_retries_with_policy(monkeypatch: pytest.MonkeyPatch) -> None:
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+
+    monkeypatch.setattr("retab._retry.asyncio.sleep", fake_sleep)
+    seen: list[httpx.Request] = []
+    transport = _sequence_transport([httpx.Response(429, headers={"retry-after-ms": "1500"}), httpx.Response(200, json={"ok": 1})], seen)
+    client = AsyncRetab(api_key="sk_test_dummy", transport=transport, retry_policy=RetryPolicy(jitter=0.0))
+    assert await client._request("GET", "/v1/files") == {"ok": 1}
+    assert slept == [1.5]
+    await client.close()
+
+
+def test_stream_error_body_is_parsed() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(422, json={"detail": {"code": "BAD", "message": "nope"}}))
+    client = Retab(api_key="sk_test_dummy", transport=transport)
+    with pytest.raises(Exception) as exc_info:
+        list(client._request_stream("POST", "/v1/extractions/stream", data={}))
+    assert getattr(exc_info.value, "code", None) == "BAD"
+
+
+# ---------------------------------------------------------------------------
+# RateLimiter
+# ---------------------------------------------------------------------------
+
+
+def test_rate_limiter_backs_off_and_recovers() -> None:
+    limiter = RateLimiter(requests_per_second=10.0, decrease_factor=0.5, recovery_per_success=1.0)
+    limiter.record_rate_limited()
+    assert limiter.requests_per_second == 5.0
+    limiter.record_rate_limited()
+    assert limiter.requests_per_second == 2.5
+    for _ in range(20):
+        limiter.record_success()
+    assert limiter.requests_per_second == 10.0
+
+
+def test_rate_limiter_token_bucket_spaces_requests(sleeps: _Sleeps) -> None:
+    limiter = RateLimiter(requests_per_second=2.0, burst=1)
+    for _ in range(3):
+        limiter.acquire()
+        limiter.release()
+    # First request uses the burst token; the next two queue behind it at 0.5s spacing.
+    assert len(sleeps.calls) == 2
+    assert sleeps.calls[0] == pytest.approx(0.5, abs=0.05)
+    assert sleeps.calls[1] == pytest.approx(1.0, abs=0.05)
+
+
+def test_rate_limiter_pauses_all_callers_after_retry_after(sleeps: _Sleeps) -> None:
+    limiter = RateLimiter(max_in_flight=4)
+    limiter.record_rate_limited(retry_after=3.0)
+    limiter.acquire()
+    limiter.release()
+    assert sleeps.calls and sleeps.calls[0] == pytest.approx(3.0, abs=0.05)
+
+
+def test_client_feeds_429s_into_shared_limiter(sleeps: _Sleeps) -> None:
+    limiter = RateLimiter(requests_per_second=100.0, burst=100)
+    responses: list[Any] = [httpx.Response(429), httpx.Response(200, json={})]
+    transport = _sequence_transport(responses, [])
+    client = Retab(api_key="sk_test_dummy", transport=transport, rate_limiter=limiter, retry_policy=RetryPolicy(initial_delay=0.0))
+    client._request("GET", "/v1/files")
+    assert limiter.requests_per_second is not None and limiter.requests_per_second < 100.0
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_async_limiter_caps_in_flight() -> None:
+    import asyncio
+
+    limiter = RateLimiter(max_in_flight=2)
+    peak = 0
+
+    async def worker() -> None:
+        nonlocal peak
+        await limiter.aacquire()
+        try:
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+        finally:
+            limiter.arelease()
+
+    await asyncio.gather(*(worker() for _ in range(8)))
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_or_timed_out_waits_hold_nothing() -> None:
+    import asyncio
+
+    limiter = RateLimiter(requests_per_second=1.0, max_in_flight=2, burst=1)
+    assert await limiter.aacquire()
+    for _ in range(3):
+        waiting = asyncio.ensure_future(limiter.aacquire())
+        await asyncio.sleep(0.01)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+    assert limiter.in_flight == 1
+    # The next token is a second away: a shorter budget gives up at once, holding nothing.
+    assert await limiter.aacquire(timeout=0.1) is False
+    assert limiter.in_flight == 1
+    limiter.arelease()
+    assert limiter._async_slots is not None and limiter._async_slots._value == 2
+
+    slots = RateLimiter(max_in_flight=1)
+    await slots.aacquire()
+    assert await slots.aacquire(timeout=0.01) is False
+    slots.arelease()
+    assert await slots.aacquire(timeout=0.01) is True
+
+
+def test_client_bounds_the_limiter_wait_by_the_deadline() -> None:
+    limiter = RateLimiter(requests_per_second=0.5, burst=1)
+    transport = _sequence_transport([httpx.Response(200, json={}), httpx.Response(200, json={})], [])
+    client = Retab(api_key="sk_test_dummy", transport=transport, rate_limiter=limiter)
+    client._request("GET", "/v1/files")
+    started = time.monotonic()
+    with pytest.raises(DeadlineExceededError), deadline_scope(0.2, None):
+        client._request("GET", "/v1/files")
+    assert time.monotonic() - started < 1.0 and limiter.in_flight == 0
@@ -0,0 +1,109 @@
+"""Unit tests for resumable, exactly-once delivery of streamed responses."""
+
+import json
+import time
+from typing import AsyncIterator, Iterator
+
+import httpx
+import pytest
+
+from retab import AsyncRetab, Retab, RetryPolicy
+from retab.exceptions import StreamDecodeError, StreamInterruptedError
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EVENTS = [{"seq": i} for i in range(6)]
+
+
+class _DroppingStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    """Serves NDJSON events and drops the connection after ``drop_after`` of them."""
+
+    def __init__(self, events: list[dict], drop_after: int | None) -> None:
+        self._lines = [json.dumps(event).encode() + b"\n" for event in events]
+        self._drop_after = drop_after
+
+    def __iter__(self) -> Iterator[bytes]:
+        for index, line in enumerate(self._lines):
+            if index == self._drop_after:
+                # Half a line reaches the client before the socket dies.
+                yield line[:3]
+                raise httpx.ReadError("connection reset by peer")
+            yield line
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self.__iter__():
+            yield chunk
+
+
+def _transport(drops: list[int | None], calls: list[int]) -> httpx.MockTransport:
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        drop_after = drops.pop(0) if drops else None
+        return httpx.Response(200, headers={"content-type": "application/stream+json"}, stream=_DroppingStream(EVENTS, drop_after))
+
+    return httpx.MockTransport(handler)
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    async def fake_async_sleep(seconds: float) -> None:
+        return None
+
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    monkeypatch.setattr("retab.client.asyncio.sleep", fake_async_sleep)
+
+
+def test_dropped_stream_resumes_without_duplicates() -> None:
+    calls: list[int] = []
+    client = Retab(api_key="sk_test_dummy", transport=_transport([2, 4], calls))
+    received = list(client._request_stream("POST", "/v1/extractions/stream", data={}))
+    assert received == EVENTS
+    assert len(calls) == 3
+
+
+def test_stream_gives_up_after_retry_budget() -> None:
+    calls: list[int] = []
+    client = Retab(api_key="sk_test_dummy", transport=_transport([3, 3, 3], calls), retry_policy=RetryPolicy(max_retries=2))
+    received: list[dict] = []
+    with pytest.raises(StreamInterruptedError) as exc_info:
+        for item in client._request_stream("POST", "/v1/extractions/stream", data={}):
+            received.append(item)
+    assert received == EVENTS[:3]
+    assert exc_info.value.delivered == 3
+    assert len(calls) == 3
+
+
+def test_raise_for_status_stream_does_not_reconnect() -> None:
+    calls: list[int] = []
+    client = Retab(api_key="sk_test_dummy", transport=_transport([1], calls))
+    with pytest.raises(StreamInterruptedError):
+        list(client._request_stream("POST", "/v1/extractions/stream", data={}, raise_for_status=True))
+    assert len(calls) == 1
+
+
+def test_malformed_json_line_raises() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, headers={"content-type": "application/stream+json"}, content=b'{"seq": 0}\n{not json\n'))
+    client = Retab(api_key="sk_test_dummy", transport=transport)
+    stream = client._request_stream("GET", "/v1/stream")
+    assert next(stream) == {"seq": 0}
+    with pytest.raises(StreamDecodeError) as exc_info:
+        next(stream)
+    assert exc_info.value.offset == 1
+    assert exc_info.value.line == "{not json"
+
+
+def test_untyped_stream_still_falls_back_to_text() -> None:
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, headers={"content-type": "application/octet-stream"}, content=b'{"a": 1}\nplain\n'))
+    client = Retab(api_key="sk_test_dummy", transport=transport)
+    assert list(client._request_stream("GET", "/v1/stream")) == [{"a": 1}, "plain"]
+
+
+@pytest.mark.asyncio
+async def test_async_dropped_stream_resumes_without_duplicates() -> None:
+    calls: list[int] = []
+    client = AsyncRetab(api_key="sk_test_dummy", transport=_transport([1, 5], calls))
+    received = [item async for item in client._request_stream("POST", "/v1/extractions/stream", data={})]
+    assert received == EVENTS
+    assert len(calls) == 3
+    await client.close()
@@ -0,0 +1,120 @@
+"""Unit tests for the thread-pool batch mode of the synchronous `Retab` client."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import pytest
+
+from retab import BatchAborted, BatchProgress, Retab
+from retab.exceptions import NotFoundError
+from retab.types.standards import PreparedRequest
+from mocks import mock_retab
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def test_map_returns_ordered_results_with_summary() -> None:
+    client, _ = mock_retab()
+
+    def work(i: int) -> int:
+        time.sleep(0.001 * (10 - i))
+        return i * i
+
+    results = client.map(work, range(10), max_workers=4)
+    assert [r.index for r in results] == list(range(10))
+    assert results.values == [i * i for i in range(10)]
+    summary = results.summary
+    assert summary.total == 10 and summary.failed == 0 and summary.succeeded == 10
+    assert summary.throughput > 0
+    assert 0 < summary.latency_p50 <= summary.latency_p95 <= summary.latency_p99 <= summary.latency_max
+    client.close()
+
+
+def test_map_bounds_concurrency() -> None:
+    client, _ = mock_retab()
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work(i: int) -> int:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.01)
+        with lock:
+            running -= 1
+        return i
+
+    client.map(work, range(24), max_workers=3)
+    assert peak == 3
+    client.close()
+
+
+def test_run_batch_collects_per_item_errors() -> None:
+    def responder(req: PreparedRequest) -> Any:
+        if req.url.endswith("/2"):
+            raise NotFoundError("missing", status_code=404)
+        return {"url": req.url}
+
+    client, rec = mock_retab(responder)
+    progress: list[BatchProgress] = []
+    results = client.run_batch([PreparedRequest(method="GET", url=f"/v1/files/{i}") for i in range(5)], max_workers=2, on_progress=progress.append)
+    assert [r.ok for r in results] == [True, True, False, True, True]
+    assert isinstance(results.errors[0].error, NotFoundError)
+    assert results.summary.failed == 1
+    assert len(rec.requests) == 5
+    assert progress[-1].completed == 5 and progress[-1].failed == 1
+    client.close()
+
+
+def test_stop_on_error_cancels_pending_items() -> None:
+    client, _ = mock_retab()
+    started: list[int] = []
+
+    def work(i: int) -> int:
+        started.append(i)
+        if i == 1:
+            raise ValueError("fatal")
+        time.sleep(0.005)
+        return i
+
+    with pytest.raises(BatchAborted) as exc_info:
+        client.map(work, range(200), max_workers=2, stop_on_error=True)
+    assert exc_info.value.result.index == 1
+    assert len(started) < 200
+    client.close()
+
+
+def test_run_batch_shares_the_client_connection_pool() -> None:
+    seen_threads: set[str] = set()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_threads.add(threading.current_thread().name)
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = Retab(api_key="sk_test_dummy", base_url="https://api.retab.com", transport=httpx.MockTransport(handler))
+    results = client.run_batch([PreparedRequest(method="GET", url=f"/v1/files/{i}") for i in range(8)], max_workers=4)
+    assert results.values == [{"path": f"/v1/files/{i}"} for i in range(8)]
+    assert all(name.startswith("retab-batch") for name in seen_threads)
+    client.close()
+    assert client._executor is None
+
+
+def test_growing_the_pool_does_not_break_running_calls() -> None:
+    client, _ = mock_retab()
+
+    def slow(i: int) -> int:
+        time.sleep(0.005)
+        return i
+
+    with ThreadPoolExecutor(2) as callers:
+        first = callers.submit(client.map, slow, range(40), max_workers=2)
+        time.sleep(0.02)
+        second = callers.submit(client.map, slow, range(20), max_workers=8)
+        assert first.result().values == list(range(40)) and second.result().values == list(range(20))
+    client.close()
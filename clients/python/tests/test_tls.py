@@ -0,0 +1,65 @@
+"""Unit tests for the shared TLS context."""
+
+import io
+import ssl
+from typing import Any
+
+import httpx
+import pytest
+from bench_client_construction import run
+from PIL import Image
+
+from retab import AsyncRetab, Retab, _tls
+from retab.utils import display
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+
+def _pool_context(client: Retab) -> ssl.SSLContext:
+    return client.client._transport._pool._ssl_context  # type: ignore[attr-defined]
+
+
+def test_clients_share_one_context_per_protocol() -> None:
+    first, second = Retab(api_key="sk_test_dummy"), Retab(api_key="sk_test_dummy")
+    assert _pool_context(first) is _pool_context(second) is _tls.ssl_context()
+    assert _tls.ssl_context(http2=True) is not _tls.ssl_context()
+    assert _pool_context(first).verify_mode == ssl.CERT_REQUIRED and _pool_context(first).check_hostname
+
+
+@pytest.mark.asyncio
+async def test_async_client_uses_the_shared_context() -> None:
+    client = AsyncRetab(api_key="sk_test_dummy")
+    assert client.client._transport._pool._ssl_context is _tls.ssl_context()  # type: ignore[attr-defined]
+    await client.close()
+
+
+def test_constructing_a_client_leaves_the_ssl_module_alone() -> None:
+    original = ssl.SSLContext
+    Retab(api_key="sk_test_dummy")
+    assert ssl.SSLContext is original
+
+
+def test_image_downloads_verify_against_the_shared_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    png = io.BytesIO()
+    Image.new("RGB", (512, 512)).save(png, format="PNG")
+    calls: list[dict[str, Any]] = []
+
+    def get(url: str, **kwargs: Any) -> httpx.Response:
+        calls.append(kwargs)
+        return httpx.Response(200, content=png.getvalue(), request=httpx.Request("GET", url))
+
+    monkeypatch.setattr(display.httpx, "get", get)
+    assert display.count_image_tokens("https://example.com/page.png") == 85 + 170 * 4
+    assert calls[0]["verify"] is _tls.ssl_context()
+
+
+def test_forked_child_builds_its_own_context() -> None:
+    parent = _tls.ssl_context()
+    _tls._reset_after_fork()
+    assert _tls.ssl_context() is not parent
+
+
+def test_client_construction_benchmark_runs() -> None:
+    # Timing lives in benchmarks/bench_client_construction.py; this only keeps the script working.
+    assert run(rounds=2) > 0
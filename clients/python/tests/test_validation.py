@@ -0,0 +1,79 @@
+"""Unit tests for skipping response validation (``validate_responses`` / ``validate_response``)."""
+
+import datetime
+from typing import Callable
+
+import httpx
+import pydantic
+import pytest
+
+from retab import AsyncRetab, Retab
+from retab._validation import construct
+from retab.types.extractions import Extraction, ExtractionConsensus
+from retab.types.mime import FileRef
+
+# Whole module is unit (pure offline; no server/credentials needed).
+pytestmark = pytest.mark.unit
+
+EXTRACTION = {
+    "id": "extr_1",
+    "file": {"id": "file_1", "filename": "invoice.pdf", "mime_type": "application/pdf"},
+    "model": "retab-small",
+    "json_schema": {"type": "object"},
+    "output": {"total": 42, "lines": [{"sku": "a"}]},
+    "status": "completed",
+    "consensus": {"choices": [{"total": 42}], "likelihoods": {"total": 0.9}},
+    "created_at": "2026-01-02T03:04:05+00:00",
+}
+# ``file`` and ``output`` have the wrong shape: rejected by validation, passed through otherwise.
+MALFORMED = {**EXTRACTION, "file": "file_1", "output": None}
+
+
+def test_unvalidated_responses_keep_their_types(scripted_client: Callable[..., Retab]) -> None:
+    with scripted_client(body=EXTRACTION, validate_responses=False) as client:
+        extraction = client.extractions.get("extr_1")
+    assert type(extraction) is Extraction and type(extraction.file) is FileRef and type(extraction.consensus) is ExtractionConsensus
+    assert extraction.created_at == datetime.datetime(2026, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)
+    assert extraction.output is not None and extraction.instructions is None and extraction.n_consensus == 1
+    assert extraction == Extraction.model_validate(EXTRACTION)
+    assert extraction.model_dump(mode="json") == Extraction.model_validate(EXTRACTION).model_dump(mode="json")
+
+
+def test_per_call_switch_overrides_the_client(scripted_client: Callable[..., Retab]) -> None:
+    with scripted_client(body=MALFORMED) as client:
+        with pytest.raises(pydantic.ValidationError):
+            client.extractions.get("extr_1")
+        assert client.extractions.get("extr_1", validate_response=False).file == "file_1"
+    with scripted_client(body=MALFORMED, validate_responses=False) as client:
+        assert client.extractions.get("extr_1").output is None
+        with pytest.raises(pydantic.ValidationError):
+            client.extractions.get("extr_1", validate_response=True)
+
+
+def test_list_pages_keep_the_mode_of_the_call() -> None:
+    pages = {
+        None: {"data": [EXTRACTION], "list_metadata": {"before": None, "after": "extr_1"}},
+        "extr_1": {"data": [{**MALFORMED, "id": "extr_2"}], "list_metadata": {"before": "extr_1", "after": None}},
+    }
+    handler = lambda request: httpx.Response(200, json=pages[request.url.params.get("after")])  # noqa: E731
+    with Retab(api_key="sk_test_dummy", transport=httpx.MockTransport(handler)) as client:
+        items = list(client.extractions.list(validate_response=False).auto_paging_iter())
+        assert [type(item) for item in items] == [Extraction, Extraction] and items[1].file == "file_1"
+        with pytest.raises(pydantic.ValidationError):
+            list(client.extractions.list().auto_paging_iter())
+
+
+def test_defaults_are_not_shared_between_instances() -> None:
+    first, second = construct(ExtractionConsensus, {}), construct(ExtractionConsensus, {})
+    assert first.choices == [] and first.choices is not second.choices
+    assert first.model_fields_set == set()
+
+
+@pytest.mark.asyncio
+async def test_async_client_skips_validation() -> None:
+    client = AsyncRetab(api_key="sk_test_dummy", transport=httpx.MockTransport(lambda request: httpx.Response(200, json=MALFORMED)))
+    extraction = await client.extractions.get("extr_1", validate_response=False)
+    assert type(extraction) is Extraction and extraction.file == "file_1"
+    with pytest.raises(pydantic.ValidationError):
+        await client.extractions.get("extr_1")
+    await client.close()